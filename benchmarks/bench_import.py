@@ -0,0 +1,90 @@
+"""
+Benchmarks of import time of env-only config loading against full import.
+
+Run from repository root:
+
+    python -m benchmarks.bench_import --repeat 20
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+HEAVY_MODULES = ('consul', 'requests', 'voluptuous')
+
+ENV_ONLY = """
+import os, sys, types
+os.environ['BENCH_HOST'] = 'localhost'
+sys.modules['bench_config'] = types.ModuleType('bench_config')
+from confgetti.load import load_and_validate_config
+load_and_validate_config('bench_config', 'BENCH', keys=['host'])
+"""
+
+PACKAGE_NAME = """
+import confgetti
+confgetti.EnvironmentIndex
+"""
+
+FULL = """
+import confgetti
+confgetti.Confgetti
+confgetti.CachedSchema
+"""
+
+SCENARIOS = (
+    ('env-only load_and_validate_config', ENV_ONLY),
+    ('confgetti.EnvironmentIndex', PACKAGE_NAME),
+    ('confgetti.Confgetti', FULL),
+)
+
+# runs scenario in fresh interpreter and reports its duration and which
+# heavy modules it imported
+RUNNER = """
+import sys, json
+from time import perf_counter
+start = perf_counter()
+exec({code!r})
+duration = perf_counter() - start
+print(json.dumps({{
+    'duration': duration,
+    'imported': [name for name in {modules!r} if name in sys.modules]
+}}))
+"""
+
+
+def run_scenario(code):
+    runner = RUNNER.format(code=code, modules=HEAVY_MODULES)
+    output = subprocess.check_output(
+        [sys.executable, '-c', runner],
+        stderr=subprocess.DEVNULL)
+
+    return json.loads(output.decode().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='number of measured interpreter runs')
+    args = parser.parse_args(argv)
+
+    print('{0} runs'.format(args.repeat))
+    print('{0:<36} {1:>9} {2:>9}  {3}'.format(
+        'scenario', 'mean ms', 'min ms', 'imported'))
+
+    for name, code in SCENARIOS:
+        # warm up, so bytecode and OS file caches are filled
+        run_scenario(code)
+        results = [run_scenario(code) for _ in range(args.repeat)]
+        timings = [result['duration'] * 1000 for result in results]
+
+        print('{0:<36} {1:>9.2f} {2:>9.2f}  {3}'.format(
+            name,
+            statistics.mean(timings),
+            min(timings),
+            ', '.join(results[-1]['imported']) or '-'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""
+Benchmarks of variables resolution pipeline against local fake Consul.
+
+Run from repository root:
+
+    python -m benchmarks.bench_resolution --keys 100 --latency 1
+"""
+import os
+import sys
+import types
+import logging
+import argparse
+import statistics
+
+from time import perf_counter
+from unittest import mock
+
+from voluptuous import Schema, Coerce
+
+from confgetti.base import Confgetti, ValueConvert
+from confgetti.load import load_and_validate_config
+from benchmarks.fake_consul import FakeConsul
+
+
+NAMESPACE = 'BENCH'
+SOURCES = ('env', 'consul', 'miss')
+
+
+def get_keys(count, source):
+    prefix = 'missing' if source == 'miss' else 'bench'
+
+    return ['{0}_key_{1}'.format(prefix, i) for i in range(count)]
+
+
+def get_environ(keys, source, prefix=None):
+    if source != 'env':
+        return {}
+
+    return {
+        (key if prefix is None else '{0}_{1}'.format(prefix, key.upper())):
+            str(i)
+        for i, key in enumerate(keys)
+    }
+
+
+class Result(object):
+    def __init__(self, name, timings, calls, requests):
+        self.name = name
+        self.timings = timings
+        self.calls = calls
+        self.requests = requests
+
+    def row(self):
+        per_call = [timing / self.calls for timing in self.timings]
+        ordered = sorted(self.timings)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+        return '{0:<44} {1:>11.4f} {2:>11.3f} {3:>11.3f} {4:>9}'.format(
+            self.name,
+            statistics.mean(per_call) * 1000,
+            statistics.mean(self.timings) * 1000,
+            p95 * 1000,
+            self.requests)
+
+
+def measure(name, consul, func, calls, repeat):
+    """
+    Runs `func` `repeat` times and records timings and number of requests
+    made to fake Consul by single run.
+    """
+    timings = []
+    consul.reset_requests()
+
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+
+    return Result(name, timings, calls, consul.request_count // repeat)
+
+
+def bench_convert(consul, count, repeat):
+    value_convert = ValueConvert()
+    values = [str(i).encode('ascii') for i in range(count)]
+
+    def run():
+        for value in values:
+            value_convert.convert(value, int)
+
+    yield measure('ValueConvert.convert', consul, run, count, repeat)
+
+
+def bench_get_variable(consul, count, repeat):
+    for source in SOURCES:
+        keys = get_keys(count, source)
+        cgtti = Confgetti(consul_config=consul.config)
+
+        def run():
+            for key in keys:
+                cgtti.get_variable(key, path=NAMESPACE, convert_to=int)
+
+        with mock.patch.dict(os.environ, get_environ(keys, source)):
+            yield measure(
+                'get_variable[{0}]'.format(source), consul, run, count, repeat)
+
+
+def bench_get_variables(consul, count, repeat):
+    modes = (
+        ('serial', {}),
+        ('bulk', {'bulk': True}),
+        ('threads', {'max_workers': 8}),
+    )
+
+    for source in SOURCES:
+        keys = get_keys(count, source)
+
+        for keys_type, spec in (('list', keys), ('dict', dict.fromkeys(
+                keys, int))):
+            for mode, kwargs in modes:
+                cgtti = Confgetti(consul_config=consul.config)
+
+                def run():
+                    cgtti.get_variables(path=NAMESPACE, keys=spec, **kwargs)
+
+                with mock.patch.dict(os.environ, get_environ(keys, source)):
+                    yield measure(
+                        'get_variables[{0},{1},{2}]'.format(
+                            source, keys_type, mode),
+                        consul, run, count, repeat)
+
+
+def bench_load_and_validate_config(consul, count, repeat):
+    sys.modules['bench_config'] = types.ModuleType('bench_config')
+
+    for source in SOURCES:
+        keys = get_keys(count, source)
+        schema = Schema({key: Coerce(int) for key in keys})
+
+        def run():
+            load_and_validate_config('bench_config', NAMESPACE, schema)
+
+        environ = get_environ(keys, source, NAMESPACE)
+        environ.update({
+            'CONSUL_HOST': consul.host,
+            'CONSUL_PORT': str(consul.port)
+        })
+
+        with mock.patch.dict(os.environ, environ):
+            yield measure(
+                'load_and_validate_config[{0}]'.format(source),
+                consul, run, count, repeat)
+
+    del sys.modules['bench_config']
+
+
+BENCHMARKS = (
+    bench_convert,
+    bench_get_variable,
+    bench_get_variables,
+    bench_load_and_validate_config,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--keys', type=int, default=100,
+                        help='number of keys resolved by single call')
+    parser.add_argument('--latency', type=float, default=1.0,
+                        help='fake Consul latency per request in ms')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of measured runs per benchmark')
+    args = parser.parse_args(argv)
+
+    # keep expected warnings about missing config file out of report
+    logging.disable(logging.WARNING)
+
+    with FakeConsul(latency=args.latency / 1000) as consul:
+        for i, key in enumerate(get_keys(args.keys, 'consul')):
+            consul.put('{0}/{1}'.format(NAMESPACE, key), str(i))
+
+        print('{0} keys, {1} ms latency, {2} runs'.format(
+            args.keys, args.latency, args.repeat))
+        print('{0:<44} {1:>11} {2:>11} {3:>11} {4:>9}'.format(
+            'benchmark', 'key ms', 'mean ms', 'p95 ms', 'requests'))
+
+        for benchmark in BENCHMARKS:
+            for result in benchmark(consul, args.keys, args.repeat):
+                print(result.row())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+import json
+import time
+import base64
+import threading
+
+from collections import Counter
+from socketserver import ThreadingMixIn
+from urllib.parse import urlsplit, parse_qs, unquote
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class FakeConsulHandler(BaseHTTPRequestHandler):
+    """
+    Serves Consul KV endpoints from in memory storage of fake server.
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-Consul-Index', str(self.server.consul.index))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        consul = self.server.consul
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+
+        consul.record(url.path)
+
+        if not url.path.startswith('/v1/kv/'):
+            return self.send_json(404, [])
+
+        key = unquote(url.path[len('/v1/kv/'):])
+        entries = consul.get_entries(key, recurse='recurse' in params)
+
+        if not entries:
+            return self.send_json(404, [])
+
+        self.send_json(200, entries)
+
+
+class FakeConsul(object):
+    """
+    Local stand-in for Consul KV HTTP API with configurable latency
+    and request counting.
+    """
+    def __init__(self, latency=0.0, host='127.0.0.1', port=0):
+        """
+        :param latency: seconds every request is delayed for
+        :type latency: float
+        :param host: host server listens on
+        :type host: string
+        :param port: port server listens on, random free port if 0
+        :type port: integer
+        """
+        self.latency = latency
+        self.index = 1
+        self.kv = {}
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), FakeConsulHandler)
+        self.server.consul = self
+        self._thread = None
+
+    @property
+    def host(self):
+        return self.server.server_address[0]
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    @property
+    def config(self):
+        """
+        :returns: consul configuration for connecting to fake server
+        :rtype: dictionary
+        """
+        return {'host': self.host, 'port': self.port}
+
+    def put(self, key, value):
+        """
+        Stores value under key and increments index.
+
+        :param key: full key path
+        :type key: string
+        :param value: stored value
+        :type value: string
+        """
+        with self._lock:
+            self.index += 1
+            self.kv[key] = (value, self.index)
+
+    def record(self, path):
+        """
+        Counts request and sleeps for configured latency.
+
+        :param path: requested path
+        :type path: string
+        """
+        with self._lock:
+            self.requests[path] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset_requests(self):
+        with self._lock:
+            self.requests.clear()
+
+    @property
+    def request_count(self):
+        return sum(self.requests.values())
+
+    def get_entries(self, key, recurse=False):
+        """
+        :param key: full key path or prefix
+        :type key: string
+        :param recurse: should all keys under prefix be returned or no
+        :type recurse: boolean
+
+        :returns: Consul KV entries
+        :rtype: list
+        """
+        with self._lock:
+            items = list(self.kv.items())
+
+        return [
+            {
+                'Key': item_key,
+                'Value': base64.b64encode(
+                    value.encode('utf-8')).decode('ascii'),
+                'Flags': 0,
+                'LockIndex': 0,
+                'CreateIndex': modify_index,
+                'ModifyIndex': modify_index
+            }
+            for item_key, (value, modify_index) in sorted(items)
+            if item_key == key or (recurse and item_key.startswith(key))
+        ]
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
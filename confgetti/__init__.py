@@ -1,3 +1,70 @@
-from .remote import ConsulInterface
-from .base import Confgetti, get_variables
-from .load import load_and_validate_config
+import sys
+import importlib
+
+# Public names by module they are imported from. Modules are imported on
+# first access of their name, so e.g. loading config from env variables and
+# files does not import Consul client, requests or voluptuous.
+_exports = {
+    'ConsulInterface': 'confgetti.remote',
+    'CachingConsulInterface': 'confgetti.remote',
+    'Confgetti': 'confgetti.base',
+    'get_variables': 'confgetti.base',
+    'get_tree': 'confgetti.base',
+    'load_and_validate_config': 'confgetti.load',
+    'ConfigWatcher': 'confgetti.watch',
+    'watch_config': 'confgetti.watch',
+    'AsyncConfgetti': 'confgetti.aio',
+    'AsyncConsulInterface': 'confgetti.aio',
+    'SnapshotStore': 'confgetti.snapshot',
+    'EnvironmentIndex': 'confgetti.environment',
+    'Stats': 'confgetti.stats',
+    'default_stats': 'confgetti.stats',
+    'SharedCache': 'confgetti.shared',
+    'CachedSchema': 'confgetti.validation',
+}
+
+# Submodules are imported on first access as well, so e.g.
+# `confgetti.remote.ConsulInterface` works after plain `import confgetti`.
+_submodules = frozenset((
+    'aio', 'base', 'diff', 'environment', 'exceptions', 'files', 'frozen',
+    'load', 'logger', 'remote', 'shared', 'snapshot', 'stats', 'validation',
+    'watch'))
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    """
+    Imports public name from its module, or submodule itself, on first
+    access and keeps it in package namespace, so later access is plain
+    attribute lookup.
+
+    :param name: name of accessed attribute
+    :type name: string
+
+    :returns: public name
+    :rtype: any
+    """
+    if name in _submodules:
+        return importlib.import_module('{0}.{1}'.format(__name__, name))
+
+    module_name = _exports.get(name)
+
+    if module_name is None:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(
+            __name__, name))
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | _submodules)
+
+
+# Module `__getattr__` is supported since Python 3.7
+if sys.version_info < (3, 7):
+    for _name in _exports:
+        __getattr__(_name)
@@ -0,0 +1,258 @@
+import os
+import asyncio
+import logging
+
+from requests.exceptions import ConnectionError
+
+from confgetti.base import ValueConvert
+from confgetti.logger import rate_limit_filter
+from confgetti.remote import ConsulInterface
+from confgetti.exceptions import UndefinedConnectionError
+
+
+log = logging.getLogger(__name__)
+log.addFilter(rate_limit_filter)
+
+
+class AsyncConsulInterface(object):
+    """
+    Declares classes for easier override if custom logic is needed.
+    """
+    consul_interface_class = ConsulInterface
+
+    def __init__(self, prepare_connection=False, executor=None):
+        """
+        Wraps synchronous Consul interface whose blocking requests are
+        run in executor, so event loop is never blocked.
+
+        :param prepare_connection: Initialization creates connection or not
+        :type prepare_connection: boolean
+        :param executor: executor running requests, loop default if None
+        :type executor: concurrent.futures.Executor/None
+        """
+        self.interface = self.consul_interface_class(prepare_connection)
+        self.executor = executor
+
+    @property
+    def connection(self):
+        """
+        :returns: instance of consul client
+        :rtype: consul.std.Consul object/None
+        """
+        return self.interface.connection
+
+    def create_connection(self, config=None):
+        """
+        Creates connection to Consul service.
+
+        :param config: Initialization creates connection or not
+        :type config: dictionary/None
+
+        :returns: instance of consul client
+        :rtype: consul.std.Consul object
+        """
+        return self.interface.create_connection(config)
+
+    async def _run(self, method, *args):
+        """
+        Runs interface method in executor.
+
+        :param method: blocking method to run
+        :type method: callable
+
+        :returns: result of method
+        :rtype: any
+        """
+        loop = asyncio.get_event_loop()
+
+        return await loop.run_in_executor(self.executor, method, *args)
+
+    async def get_raw_value(self, key, path=None):
+        """
+        Gets value from Consul's key value storage.
+
+        :param key: key for desired value
+        :type key: string
+        :param path: path where key is stored on Consul service
+        :type path: string/None
+
+        :returns: fetched value from Consul service.
+        :rtype: bytes/None
+        """
+        return await self._run(self.interface.get_raw_value, key, path)
+
+    async def get_raw_values(self, path):
+        """
+        Gets all values stored under `path` prefix with one recursive read.
+
+        :param path: path under which keys are stored on Consul service
+        :type path: string
+
+        :returns: fetched values indexed by relative key or None
+        :rtype: dictionary/None
+        """
+        return await self._run(self.interface.get_raw_values, path)
+
+
+class AsyncConfgetti(object):
+    """
+    Declares classes for easier override if custom logic is needed.
+    """
+    consul_interface_class = AsyncConsulInterface
+    value_convert_class = ValueConvert
+
+    def __init__(
+            self,
+            consul_config=None,
+            prepare_consul=True,
+            max_concurrency=10,
+            environ=None):
+        """
+        Asyncio counterpart of `Confgetti` with same lookup order,
+        fallback and conversion logic.
+
+        :param consul_config: dictionary holding consul configuration data
+        :type consul_config: dictionary/None
+        :param prepare_consul: shoud consul client be prepared or no
+        :type prepare_consul: boolean
+        :param max_concurrency: maximum number of concurrent Consul lookups
+        :type max_concurrency: integer
+        :param environ: environment variables, `os.environ` by default
+        :type environ: mapping/None
+        """
+        self.prepare_consul = prepare_consul
+        self.max_concurrency = max_concurrency
+        self.environ = os.environ if environ is None else environ
+
+        if consul_config is not None:
+            self.consul = self.consul_interface_class()
+            self.consul.create_connection(consul_config)
+        else:
+            self.consul = self.consul_interface_class(self.prepare_consul)
+
+        self.value_convert = self.value_convert_class()
+
+    def _log_connection_warning(self):
+        log.warning('Not connected to consul on host '
+                    '"%s". Please check your consul '
+                    'connection parameters!',
+                    self.consul.connection.http.host)
+
+    async def get_variable(
+            self,
+            key,
+            path=None,
+            fallback=None,
+            convert_to=None,
+            use_env=True,
+            use_consul=True):
+        """
+        Gets variable by passed key, firstly from environment and then
+        from Consul service. Arguments are same as in
+        `Confgetti.get_variable`.
+
+        :returns: variable value possibly from one source or fallback.
+        :rtype: any
+        """
+        variable = None
+
+        if use_env is True:
+            variable = self.environ.get(key)
+
+        if self.prepare_consul is True and use_consul is True \
+                and variable is None:
+            try:
+                variable = await self.consul.get_raw_value(key, path)
+            except (ConnectionError, UndefinedConnectionError):
+                self._log_connection_warning()
+
+        if variable is not None:
+            variable = self.value_convert.convert(variable, convert_to, key)
+
+        return variable if variable is not None else fallback
+
+    async def get_consul_values(self, path):
+        """
+        Gets all raw values stored under `path` on Consul service with
+        a single recursive read.
+
+        :param path: location of variables on Consul storage.
+        :type path: string
+
+        :returns: raw values indexed by key or None if prefix reads are
+            not permitted.
+        :rtype: dict/None
+        """
+        try:
+            return await self.consul.get_raw_values(path)
+        except (ConnectionError, UndefinedConnectionError):
+            self._log_connection_warning()
+
+        return {}
+
+    async def get_variables(
+            self,
+            path=None,
+            keys=None,
+            use_env=True,
+            use_consul=True,
+            bulk=False):
+        """
+        Gets multiple variables from environment or consul, based on path.
+        Keys are looked up concurrently, with at most `max_concurrency`
+        lookups at once. Arguments are same as in `Confgetti.get_variables`.
+
+        :returns: dictionary including fetched variables.
+        :rtype: dict
+        """
+        keys = [] if keys is None else keys
+
+        if isinstance(keys, dict) is True:
+            convert_map = keys
+        elif isinstance(keys, list) is True:
+            convert_map = dict.fromkeys(keys)
+        else:
+            raise TypeError('"keys" argument should be list or dict')
+
+        consul_values = None
+
+        if bulk is True and path is not None and use_consul is True \
+                and self.prepare_consul is True and convert_map:
+            consul_values = await self.get_consul_values(path)
+
+        if consul_values is not None:
+            plan = self.value_convert.compile(convert_map)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def get_variable(key, convert_to):
+            if consul_values is not None:
+                variable = await self.get_variable(
+                    key=key,
+                    convert_to=convert_to,
+                    use_env=use_env,
+                    use_consul=False)
+
+                if variable is None and consul_values.get(key) is not None:
+                    variable = plan[key](consul_values[key], key)
+
+                return variable
+
+            async with semaphore:
+                return await self.get_variable(
+                    key=key,
+                    path=path,
+                    convert_to=convert_to,
+                    use_env=use_env,
+                    use_consul=use_consul)
+
+        fetched = await asyncio.gather(*[
+            get_variable(key, convert_to)
+            for key, convert_to in convert_map.items()
+        ])
+
+        return {
+            key: variable
+            for key, variable in zip(convert_map, fetched)
+            if variable is not None
+        }
@@ -1,26 +1,38 @@
 import os
+import base64
+import binascii
 import logging
 import json
 
+from concurrent.futures import ThreadPoolExecutor
+
 from requests.exceptions import ConnectionError
 
-from confgetti.logger import DuplicateFilter
+from confgetti.logger import rate_limit_filter
+from confgetti.stats import default_stats
 from confgetti.remote import ConsulInterface
 from confgetti.exceptions import UndefinedConnectionError, ConvertValueError
 
 
 log = logging.getLogger(__name__)
-log.addFilter(DuplicateFilter())
+log.addFilter(rate_limit_filter)
 
 
 class ValueConvert(object):
-    def __init__(self):
+    def __init__(self, stats=None):
         """
         Declares boolean comparison lists under which
-        strings are converted to booleans.
+        strings are converted to booleans and empty caches of
+        conversion functions and plans.
+
+        :param stats: stats collecting conversion failures, default if None
+        :type stats: confgetti.stats.Stats/None
         """
+        self.stats = default_stats if stats is None else stats
         self.false_compare_list = ['false', 'False']
         self.true_compare_list = ['true', 'True']
+        self._converters = {}
+        self._plans = {}
 
     def convert_bool(self, value):
         """
@@ -104,52 +116,129 @@ class ValueConvert(object):
 
         return value
 
-    def convert(self, value, convert_to=None):
+    def decode(self, value):
         """
-        Seeks for existing method based on wanted type.
         Converts value from bytes to string.
-        Runs convert method if one found, if method raises error it logs
-        warning.
-        If method does not exists it logs warning about not supported
-        conversion try.
 
         :param value: value for conversion
         :type value: any
-        :param value: name of wanted value type
-        :type value: string
 
-        :returns: converted value to new type or in original type
+        :returns: decoded value or value in original type
         :rtype: any
         """
         if type(value) == bytes:
             value = value.decode('ascii')
 
-        if convert_to is not None:
+        return value
+
+    def get_converter(self, convert_to=None):
+        """
+        Seeks for existing method based on wanted type and builds function
+        which decodes value and runs found method on it. If method raises
+        error, function logs warning and returns decoded value.
+        If method does not exists, function logs warning about not
+        supported conversion try.
+        Built functions accept optional key of value, which is recorded
+        to stats when conversion fails.
+        Built functions are cached per wanted type.
+
+        :param convert_to: wanted value type or its name
+        :type convert_to: type/string/None
+
+        :returns: function converting single value
+        :rtype: callable
+        """
+        converter = self._converters.get(convert_to)
+
+        if converter is not None:
+            return converter
+
+        decode = self.decode
+
+        def conversion_failed(key):
+            if key is not None:
+                self.stats.conversion_failed(key)
+
+        if convert_to is None:
+            def converter(value, key=None):
+                return decode(value)
+        else:
             if isinstance(convert_to, str):
                 convert_name = convert_to
             else:
                 convert_name = convert_to.__name__
 
-            convert_method_name = 'convert_{0}'.format(convert_name)
-            has_convert_method = hasattr(self, convert_method_name)
-
-            if has_convert_method is True:
-                convert_method = getattr(self, convert_method_name)
-                
-                try:
-                    value = convert_method(value)
-                except ConvertValueError:
-                    log.warning('"{0}" cannot be converted to {1}!'.format(
-                        value, convert_name
-                    ))
+            convert_method = getattr(
+                self, 'convert_{0}'.format(convert_name), None)
+
+            if convert_method is not None:
+                def converter(value, key=None):
+                    value = decode(value)
+
+                    try:
+                        return convert_method(value)
+                    except ConvertValueError:
+                        log.warning('"%s" cannot be converted to %s!',
+                                    value, convert_name)
+                        conversion_failed(key)
+
+                    return value
             else:
-                log.warning(
-                    'method for "{0}" does not exist!'.format(
-                        convert_name
-                    )
-                )
+                def converter(value, key=None):
+                    log.warning(
+                        'method for "%s" does not exist!', convert_name)
+                    conversion_failed(key)
 
-        return value
+                    return decode(value)
+
+        self._converters[convert_to] = converter
+
+        return converter
+
+    def compile(self, keys):
+        """
+        Builds conversion plan which maps every key to function converting
+        its value. Plans are cached per keys specification, so repeated
+        loads of same keys reuse already built plan.
+
+        :param keys: keys with wanted value types or list of keys
+        :type keys: dict/list
+
+        :returns: conversion function for every key
+        :rtype: dict
+        """
+        if isinstance(keys, dict) is True:
+            spec = tuple(keys.items())
+        else:
+            spec = tuple((key, None) for key in keys)
+
+        plan = self._plans.get(spec)
+
+        if plan is None:
+            plan = {
+                key: self.get_converter(convert_to)
+                for key, convert_to in spec
+            }
+            self._plans[spec] = plan
+
+        return plan
+
+    def convert(self, value, convert_to=None, key=None):
+        """
+        Converts value to wanted type with function built by
+        `get_converter`.
+
+        :param value: value for conversion
+        :type value: any
+        :param convert_to: name of wanted value type
+        :type convert_to: type/string/None
+        :param key: key of value, recorded to stats if conversion fails
+        :type key: string/None
+
+        :returns: converted value to new type or in original type
+        :rtype: any
+        """
+        return self.get_converter(convert_to)(value, key)
 
 
 class Confgetti(object):
@@ -159,18 +248,44 @@ class Confgetti(object):
     consul_interface_class = ConsulInterface
     value_convert_class = ValueConvert
 
-    def __init__(self, consul_config=None, prepare_consul=True):
+    def __init__(
+            self,
+            consul_config=None,
+            prepare_consul=True,
+            snapshot_store=None,
+            environ=None,
+            stats=None,
+            shared_cache=None):
         """
         Uses passed consul configuration to initalize consul interface,
         if configuration is passed. In other case, uses default configuration
         which is defined from environment variables.
+        If snapshot store is passed, values fetched from Consul path prefix
+        are saved to it and used when Consul is not reachable.
+        Variables are looked up in `environ`, which can be
+        `confgetti.environment.EnvironmentIndex` snapshot of environment.
 
         :param prepare_consul: shoud consul client be prepared or no
         :type prepare_consul: boolean
         :param consul_config: dictionary holding consul configuration data
         :type consul_config: dictionary/None
+        :param snapshot_store: store of last fetched Consul values
+        :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+        :param environ: environment variables, `os.environ` by default
+        :type environ: mapping/None
+        :param stats: stats collecting Consul requests and conversion
+            failures, `confgetti.stats.default_stats` if None
+        :type stats: confgetti.stats.Stats/None
+        :param shared_cache: cache of Consul path prefix values shared
+            between processes on host
+        :type shared_cache: confgetti.shared.SharedCache/None
         """
         self.prepare_consul = prepare_consul
+        self.snapshot_store = snapshot_store
+        self.shared_cache = shared_cache
+        self._converted = {}
+        self.environ = os.environ if environ is None else environ
+        self.stats = default_stats if stats is None else stats
 
         if consul_config is not None:
             self.consul = self.consul_interface_class()
@@ -178,7 +293,8 @@ class Confgetti(object):
         else:
             self.consul = self.consul_interface_class(self.prepare_consul)
 
-        self.value_convert = self.value_convert_class()
+        self.consul.stats = self.stats
+        self.value_convert = self.value_convert_class(self.stats)
 
     def get_variable(
             self,
@@ -215,7 +331,7 @@ class Confgetti(object):
         variable = None
 
         if use_env is True:
-            variable = os.environ.get(key)
+            variable = self.environ.get(key)
 
         if self.prepare_consul is True and use_consul is True \
                 and variable is None:
@@ -223,24 +339,159 @@ class Confgetti(object):
                 variable = self.consul.get_raw_value(key, path)
             except (ConnectionError, UndefinedConnectionError):
                 log.warning('Not connected to consul on host '
-                            '"{}". Please check your consul '
-                            'connection parameters!'.format(
-                                self.consul.connection.http.host
-                            ))
+                            '"%s". Please check your consul '
+                            'connection parameters!',
+                            self.consul.connection.http.host)
+                variable = self.get_snapshot_values(path).get(key)
 
         if variable is not None:
-            variable = self.value_convert.convert(variable, convert_to)
+            variable = self.value_convert.convert(variable, convert_to, key)
 
         return variable if variable is not None else fallback
 
+    def get_snapshot_values(self, path):
+        """
+        Gets last values fetched from `path` prefix from snapshot store.
+
+        :param path: location of variables on Consul storage.
+        :type path: string/None
+
+        :returns: stored values or empty dictionary if there is no snapshot
+        :rtype: dict
+        """
+        if self.snapshot_store is None or path is None:
+            return {}
+
+        values = self.snapshot_store.load(path)
+
+        if values is None:
+            return {}
+
+        try:
+            values = decode_raw_values(values)
+        except (TypeError, ValueError):
+            log.warning('Ignoring unreadable snapshot of "%s" consul values',
+                        path)
+            return {}
+
+        log.warning('Using snapshot of "%s" consul values', path)
+
+        return values
+
+    def get_consul_values(self, path):
+        """
+        Gets all raw values stored under `path` on Consul service with
+        a single recursive read.
+        Fetched values are saved to snapshot store if there is one.
+        If shared cache is set, values are fetched by one process on host
+        and read from shared cache by others.
+        If Consul is not reachable it logs warning and returns values from
+        snapshot store, or empty dictionary, so every key is treated as
+        not found.
+
+        :param path: location of variables on Consul storage.
+        :type path: string
+
+        :returns: raw values indexed by key or None if prefix reads are
+            not permitted.
+        :rtype: dict/None
+        """
+        try:
+            values = self.fetch_consul_values(path)
+        except (ConnectionError, UndefinedConnectionError):
+            log.warning('Not connected to consul on host '
+                        '"%s". Please check your consul '
+                        'connection parameters!',
+                        self.consul.connection.http.host)
+
+            return self.get_snapshot_values(path)
+
+        if values is not None and self.snapshot_store is not None:
+            self.snapshot_store.save(path, encode_raw_values({
+                key: value for key, value in values.items()
+                if value is not None
+            }))
+
+        return values
+
+    def fetch_consul_values(self, path):
+        """
+        Fetches raw values stored under `path` from Consul, or from shared
+        cache if it holds fresh values of `path` read with same connection
+        settings. Values are shared encoded with `encode_raw_values`, so
+        they are read back exactly as fetched. If shared cache can't be
+        used, values are read from Consul directly.
+
+        :param path: location of variables on Consul storage.
+        :type path: string
+
+        :returns: values indexed by key or None if prefix reads are not
+            permitted.
+        :rtype: dict/None
+        """
+        if self.shared_cache is None:
+            return self.consul.get_raw_values(path)
+
+        fetched = []
+
+        def load():
+            values = self.consul.get_raw_values(path)
+            fetched.append(values)
+
+            if values is None:
+                return None
+
+            return encode_raw_values(values)
+
+        try:
+            values = self.shared_cache.get_or_load(
+                path, load, scope=self.consul.get_connection_digest())
+
+            if not fetched and values is not None:
+                values = decode_raw_values(values)
+        except ConnectionError:
+            raise
+        except (OSError, ValueError) as e:
+            log.warning('Shared cache of "%s" is not usable: %s', path, e)
+            self.stats.increment('consul.shared_cache.errors')
+
+            if fetched:
+                return fetched[0]
+
+            return self.consul.get_raw_values(path)
+
+        self.stats.increment(
+            'consul.shared_cache.misses' if fetched
+            else 'consul.shared_cache.hits')
+
+        return fetched[0] if fetched else values
+
     def get_variables(
-            self, path=None, keys=None, use_env=True, use_consul=True):
+            self,
+            path=None,
+            keys=None,
+            use_env=True,
+            use_consul=True,
+            bulk=False,
+            consul_values=None,
+            max_workers=None,
+            batch=False):
         """
         Gets multiple variables from environment or consul, based on path.
         Supports dict and list types `keys` argument.
         In case of dict, it uses key value as conversion type,
         in case of list it just passes each key to function for getting
         variable, and everything returned is string.
+        In bulk mode, all values under `path` are fetched from Consul with
+        one request and keys are resolved from fetched values. If prefix
+        read is not permitted it falls back to getting keys one by one.
+        If `consul_values` fetched from `path` beforehand are passed, keys
+        are resolved from them without querying Consul.
+        If `max_workers` is passed, keys not found in environment are
+        fetched from Consul concurrently by that many threads.
+        In batch mode, keys not found in environment are fetched with
+        Consul transactions, so keys stored under different paths are
+        fetched with one request per `txn_max_operations` keys.
 
         :param path: location of variable on Consul storage.
         :type path: string/None
@@ -250,6 +501,14 @@ class Confgetti(object):
         :type use_env: boolean
         :param use_consul: Should method look into consul for variable or no
         :type use_consul: boolean
+        :param bulk: Should all values under path be fetched at once or no
+        :type bulk: boolean
+        :param consul_values: raw values already fetched from `path`
+        :type consul_values: dict/None
+        :param max_workers: number of threads fetching keys from Consul
+        :type max_workers: integer/None
+        :param batch: Should keys be fetched with Consul transactions or no
+        :type batch: boolean
 
         :returns: dictionary including fetched variables.
         :rtype: dict
@@ -258,33 +517,341 @@ class Confgetti(object):
         variables = {}
 
         if isinstance(keys, dict) is True:
-            for key, value in keys.items():
+            convert_map = keys
+        elif isinstance(keys, list) is True:
+            convert_map = dict.fromkeys(keys)
+        else:
+            raise TypeError('"keys" argument should be list or dict')
+
+        if consul_values is None and bulk is True and path is not None \
+                and use_consul is True and self.prepare_consul is True \
+                and convert_map:
+            consul_values = self.get_consul_values(path)
+
+        if consul_values is None and batch is True \
+                and use_consul is True and self.prepare_consul is True:
+            return self._get_variables_batched(path, convert_map, use_env)
+
+        if consul_values is None and max_workers is not None \
+                and use_consul is True and self.prepare_consul is True:
+            return self._get_variables_concurrently(
+                path, convert_map, use_env, max_workers)
+
+        if consul_values is not None:
+            plan = self.value_convert.compile(convert_map)
+
+        for key, convert_to in convert_map.items():
+            if consul_values is None:
                 variable = self.get_variable(
                     key=key,
                     path=path,
-                    convert_to=value,
+                    convert_to=convert_to,
                     use_env=use_env,
                     use_consul=use_consul)
-
-                if variable is not None:
-                    variables[key] = variable
-        elif isinstance(keys, list) is True:
-            for key in keys:
+            else:
                 variable = self.get_variable(
                     key=key,
-                    path=path,
+                    convert_to=convert_to,
                     use_env=use_env,
-                    use_consul=use_consul)
+                    use_consul=False)
 
-                if variable is not None:
-                    variables[key] = variable
-        else:
-            raise TypeError('"keys" argument should be list or dict')
+                if variable is None and consul_values.get(key) is not None:
+                    variable = self.convert_consul_value(
+                        consul_values[key], key, path, convert_to, plan[key])
+
+            if variable is not None:
+                variables[key] = variable
 
         return variables
 
+    def get_tree(self, path):
+        """
+        Gets all values stored under `path` on Consul service with single
+        recursive read and rebuilds them into nested dictionary, where
+        every segment of key path is nested key, so e.g. value of
+        `path/db/host` is returned as `{'db': {'host': value}}`.
+        Values are decoded, but not converted, so they can be validated
+        and coerced by nested schema.
+        Like in bulk mode, values come from shared cache if it is set, are
+        saved to snapshot store and are read from it when Consul is not
+        reachable.
+
+        :param path: location of variables on Consul storage.
+        :type path: string
+
+        :returns: nested values, empty if prefix reads are not permitted
+        :rtype: dict
+        """
+        values = self.get_consul_values(path)
+
+        if values is None:
+            log.warning('Recursive reads of "%s" are not permitted', path)
+            return {}
+
+        return build_tree(values, self.value_convert.decode)
+
+    def convert_consul_value(self, value, key, path, convert_to, convert):
+        """
+        Converts raw value fetched from Consul. If `ModifyIndex` and raw
+        value of key did not change since its last conversion, value
+        converted last time is returned without decoding and converting
+        it again, so unchanged values are same objects as before.
+
+        :param value: raw value of key
+        :type value: bytes/string
+        :param key: key of value
+        :type key: string
+        :param path: location of variable on Consul storage.
+        :type path: string/None
+        :param convert_to: conversion type of key
+        :type convert_to: any
+        :param convert: conversion function of key
+        :type convert: callable
+
+        :returns: converted value
+        :rtype: any
+        """
+        modify_index = self.consul.get_modify_index(key, path)
+
+        if modify_index is None:
+            return convert(value, key)
+
+        cache_key = (self.consul._get_key_path(key, path), convert_to)
+        cached = self._converted.get(cache_key)
+
+        if cached is not None and cached[0] == modify_index \
+                and cached[1] == value:
+            self.stats.increment('consul.unchanged')
+            return cached[2]
+
+        converted = convert(value, key)
+        self._converted[cache_key] = (modify_index, value, converted)
+
+        return converted
+
+    def _get_variables_batched(self, path, convert_map, use_env):
+        """
+        Gets variables from environment and fetches the ones not found
+        there from Consul with transactions. If transactions are not
+        permitted, keys are fetched one by one.
+
+        :param path: location of variable on Consul storage.
+        :type path: string/None
+        :param convert_map: keys with their conversion types
+        :type convert_map: dict
+        :param use_env: Should method look into environment for variable or no
+        :type use_env: boolean
+
+        :returns: dictionary including fetched variables.
+        :rtype: dict
+        """
+        variables = dict.fromkeys(convert_map)
+
+        if use_env is True:
+            for key, convert_to in convert_map.items():
+                variables[key] = self.get_variable(
+                    key=key,
+                    convert_to=convert_to,
+                    use_consul=False)
+
+        key_paths = {
+            key: self.consul._get_key_path(key, path)
+            for key, variable in variables.items() if variable is None
+        }
+
+        if key_paths:
+            try:
+                values = self.consul.get_batched_raw_values(
+                    list(key_paths.values()))
+            except (ConnectionError, UndefinedConnectionError):
+                log.warning('Not connected to consul on host '
+                            '"%s". Please check your consul '
+                            'connection parameters!',
+                            self.consul.connection.http.host)
+                snapshot = self.get_snapshot_values(path)
+                values = {
+                    key_path: snapshot.get(key)
+                    for key, key_path in key_paths.items()
+                }
+
+            plan = self.value_convert.compile(convert_map)
+
+            for key, key_path in key_paths.items():
+                if values is None:
+                    variables[key] = self.get_variable(
+                        key=key,
+                        path=path,
+                        convert_to=convert_map[key],
+                        use_env=False)
+                elif values.get(key_path) is not None:
+                    variables[key] = self.convert_consul_value(
+                        values[key_path], key, path, convert_map[key],
+                        plan[key])
+
+        return {
+            key: variable for key, variable in variables.items()
+            if variable is not None
+        }
+
+    def _get_variables_concurrently(
+            self, path, convert_map, use_env, max_workers):
+        """
+        Gets variables from environment and fetches the ones not found
+        there from Consul on thread pool sharing one HTTP session.
+
+        :param path: location of variable on Consul storage.
+        :type path: string/None
+        :param convert_map: keys with their conversion types
+        :type convert_map: dict
+        :param use_env: Should method look into environment for variable or no
+        :type use_env: boolean
+        :param max_workers: number of threads fetching keys from Consul
+        :type max_workers: integer
+
+        :returns: dictionary including fetched variables.
+        :rtype: dict
+        """
+        variables = dict.fromkeys(convert_map)
+
+        if use_env is True:
+            for key, convert_to in convert_map.items():
+                variables[key] = self.get_variable(
+                    key=key,
+                    convert_to=convert_to,
+                    use_consul=False)
+
+        missing_keys = [
+            key for key, variable in variables.items() if variable is None
+        ]
+
+        def get_consul_variable(key):
+            return self.get_variable(
+                key=key,
+                path=path,
+                convert_to=convert_map[key],
+                use_env=False)
+
+        self.consul.resize_pool(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = executor.map(get_consul_variable, missing_keys)
+
+            for key, variable in zip(missing_keys, fetched):
+                variables[key] = variable
+
+        return {
+            key: variable for key, variable in variables.items()
+            if variable is not None
+        }
+
+
+def encode_raw_values(values):
+    """
+    Encodes raw values fetched from Consul with base64, so they can be
+    stored as JSON without decoding bytes which may not be text.
+
+    :param values: raw values indexed by key
+    :type values: dict
 
-def get_variables(path, keys, use_env=True, use_consul=True):
+    :returns: encoded values indexed by key, None values are kept
+    :rtype: dict
+    """
+    encoded = {}
+
+    for key, value in values.items():
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+
+        encoded[key] = None if value is None \
+            else base64.b64encode(value).decode('ascii')
+
+    return encoded
+
+
+def decode_raw_values(values):
+    """
+    Decodes values encoded with `encode_raw_values` back to raw bytes.
+    Raises `ValueError` if some value is not valid base64.
+
+    :param values: encoded values indexed by key
+    :type values: dict
+
+    :returns: raw values indexed by key
+    :rtype: dict
+    """
+    try:
+        return {
+            key: None if value is None
+            else base64.b64decode(value, validate=True)
+            for key, value in values.items()
+        }
+    except binascii.Error as e:
+        raise ValueError(str(e)) from e
+
+
+def build_tree(values, decode=None, separator='/'):
+    """
+    Rebuilds values indexed by relative key path into nested dictionary in
+    single pass over values, so every key path segment is walked once.
+    Keys ending with separator are Consul folders and give empty
+    dictionaries, while empty values are left out, so schema defaults
+    apply to them. If key holds value and is also parent of other keys,
+    nested keys are kept.
+
+    :param values: values indexed by key path, e.g. `db/host`
+    :type values: dict
+    :param decode: function applied to every value
+    :type decode: callable/None
+    :param separator: separator of key path segments
+    :type separator: string
+
+    :returns: nested values
+    :rtype: dict
+    """
+    tree = {}
+
+    for key_path, value in values.items():
+        segments = key_path.split(separator)
+        node = tree
+
+        for i, segment in enumerate(segments[:-1]):
+            child = node.get(segment)
+
+            if not isinstance(child, dict):
+                if child is not None:
+                    log.warning('Value of "%s" is shadowed by nested keys',
+                                separator.join(segments[:i + 1]))
+
+                child = node[segment] = {}
+
+            node = child
+
+        name = segments[-1]
+
+        if not name or value is None:
+            continue
+
+        if isinstance(node.get(name), dict):
+            log.warning('Value of "%s" is shadowed by nested keys', key_path)
+            continue
+
+        node[name] = value if decode is None else decode(value)
+
+    return tree
+
+
+def get_variables(
+        path,
+        keys,
+        use_env=True,
+        use_consul=True,
+        bulk=False,
+        max_workers=None,
+        snapshot_store=None,
+        environ=None,
+        stats=None,
+        shared_cache=None,
+        batch=False):
     """
     Shorthand function for simple Confgetti setup that returns desired
     variables in dictionary.
@@ -297,10 +864,55 @@ def get_variables(path, keys, use_env=True, use_consul=True):
     :type use_env: boolean
     :param use_consul: Should method look into consul for variable or no
     :type use_consul: boolean
+    :param bulk: Should all values under path be fetched at once or no
+    :type bulk: boolean
+    :param max_workers: number of threads fetching keys from Consul
+    :type max_workers: integer/None
+    :param snapshot_store: store of last fetched Consul values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+    :param environ: environment variables, `os.environ` by default
+    :type environ: mapping/None
+    :param stats: stats collecting Consul requests and conversion failures
+    :type stats: confgetti.stats.Stats/None
+    :param shared_cache: cache of Consul values shared between processes
+    :type shared_cache: confgetti.shared.SharedCache/None
+    :param batch: Should keys be fetched with Consul transactions or no
+    :type batch: boolean
 
     :returns: dictionary including fetched variables.
     :rtype: dict
     """
-    cgtti = Confgetti()
+    cgtti = Confgetti(
+        snapshot_store=snapshot_store, environ=environ, stats=stats,
+        shared_cache=shared_cache)
+
+    return cgtti.get_variables(
+        path, keys, use_env, use_consul, bulk, max_workers=max_workers,
+        batch=batch)
+
+
+def get_tree(
+        path,
+        snapshot_store=None,
+        stats=None,
+        shared_cache=None):
+    """
+    Shorthand function for simple Confgetti setup that returns values
+    stored under `path` as nested dictionary, see `Confgetti.get_tree`.
+
+    :param path: location of variables on Consul storage.
+    :type path: string
+    :param snapshot_store: store of last fetched Consul values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+    :param stats: stats collecting Consul requests and conversion failures
+    :type stats: confgetti.stats.Stats/None
+    :param shared_cache: cache of Consul values shared between processes
+    :type shared_cache: confgetti.shared.SharedCache/None
+
+    :returns: nested values
+    :rtype: dict
+    """
+    cgtti = Confgetti(
+        snapshot_store=snapshot_store, stats=stats, shared_cache=shared_cache)
 
-    return cgtti.get_variables(path, keys, use_env, use_consul)
+    return cgtti.get_tree(path)
@@ -0,0 +1,334 @@
+import sys
+import logging
+import threading
+
+from confgetti.logger import rate_limit_filter
+
+
+log = logging.getLogger(__name__)
+log.addFilter(rate_limit_filter)
+
+_missing = object()
+
+
+class ConfigDiff(object):
+    """
+    Structural difference between two configs. Values of changed keys
+    which are dictionaries in both configs are compared further, and their
+    differences are kept in `nested`.
+    """
+    def __init__(self, added=None, removed=None, changed=None, nested=None):
+        """
+        :param added: new values of keys missing from old config
+        :type added: dictionary/None
+        :param removed: old values of keys missing from new config
+        :type removed: dictionary/None
+        :param changed: old and new value of changed keys
+        :type changed: dictionary/None
+        :param nested: differences of changed dictionary values
+        :type nested: dictionary/None
+        """
+        self.added = {} if added is None else added
+        self.removed = {} if removed is None else removed
+        self.changed = {} if changed is None else changed
+        self.nested = {} if nested is None else nested
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __eq__(self, other):
+        if not isinstance(other, ConfigDiff):
+            return NotImplemented
+
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return 'ConfigDiff(added={0!r}, removed={1!r}, changed={2!r})'.format(
+            self.added, self.removed, self.changed)
+
+    @property
+    def keys(self):
+        """
+        :returns: added, removed and changed keys
+        :rtype: set
+        """
+        return set(self.added) | set(self.removed) | set(self.changed)
+
+    @property
+    def updated(self):
+        """
+        :returns: new values of added and changed keys
+        :rtype: dictionary
+        """
+        updated = dict(self.added)
+        updated.update(
+            (key, new) for key, (old, new) in self.changed.items())
+
+        return updated
+
+    def get_paths(self):
+        """
+        :returns: paths of added, removed and changed values, going into
+            nested differences, e.g. `('db', 'host')`
+        :rtype: set
+        """
+        paths = set()
+
+        for key in self.keys:
+            if key in self.nested:
+                paths.update(
+                    (key,) + path for path in self.nested[key].get_paths())
+            else:
+                paths.add((key,))
+
+        return paths
+
+    def subset(self, keys):
+        """
+        :param keys: keys to keep
+        :type keys: list/set
+
+        :returns: difference of given keys only
+        :rtype: ConfigDiff
+        """
+        keys = set(keys)
+
+        def select(values):
+            return {key: value for key, value in values.items()
+                    if key in keys}
+
+        return ConfigDiff(
+            select(self.added), select(self.removed), select(self.changed),
+            select(self.nested))
+
+    def as_dict(self):
+        """
+        :returns: added, removed and changed values with nested
+            differences
+        :rtype: dictionary
+        """
+        return {
+            'added': self.added,
+            'removed': self.removed,
+            'changed': self.changed,
+            'nested': {
+                key: diff.as_dict() for key, diff in self.nested.items()
+            }
+        }
+
+
+def diff_config(old, new):
+    """
+    Computes difference between old and new config.
+
+    :param old: old config
+    :type old: dictionary
+    :param new: new config
+    :type new: dictionary
+
+    :returns: difference of configs
+    :rtype: ConfigDiff
+    """
+    diff = ConfigDiff()
+
+    for key, value in new.items():
+        old_value = old.get(key, _missing)
+
+        if old_value is _missing:
+            diff.added[key] = value
+        elif type(old_value) is not type(value) or old_value != value:
+            diff.changed[key] = (old_value, value)
+
+            if isinstance(old_value, dict) and isinstance(value, dict):
+                diff.nested[key] = diff_config(old_value, value)
+
+    for key, value in old.items():
+        if key not in new:
+            diff.removed[key] = value
+
+    return diff
+
+
+class ConfigApplier(object):
+    """
+    Applies configs to config module by setting only changed values, and
+    calls subscribers of changed keys. Values module defined before key was
+    applied first are remembered, so they are restored once key is missing
+    from new config.
+    """
+    def __init__(self, config_module_name):
+        """
+        :param config_module_name: name of the python module to set config to.
+        :type config_module_name: string
+        """
+        self.config_module_name = config_module_name
+        self.applied_keys = set()
+        self.module_defaults = {}
+        self.subscriptions = []
+        self._lock = threading.RLock()
+
+    def subscribe(self, callback, keys=None):
+        """
+        Registers callback which is called with difference of config every
+        time some of `keys` change.
+
+        :param callback: function accepting `ConfigDiff` of subscribed keys
+        :type callback: callable
+        :param keys: subscribed keys, all keys if None
+        :type keys: list/set/None
+        """
+        keys = None if keys is None else frozenset(keys)
+
+        with self._lock:
+            self.subscriptions.append((callback, keys))
+
+    def unsubscribe(self, callback):
+        """
+        :param callback: previously subscribed function
+        :type callback: callable
+        """
+        with self._lock:
+            self.subscriptions = [
+                subscription for subscription in self.subscriptions
+                if subscription[0] != callback
+            ]
+
+    def get_applied_config(self, keys=()):
+        """
+        :param keys: keys read from config module besides applied keys
+        :type keys: iterable
+
+        :returns: current values of applied keys and given keys, which are
+            set on config module
+        :rtype: dictionary
+        """
+        module_vars = vars(sys.modules[self.config_module_name])
+
+        return {
+            key: module_vars[key]
+            for key in self.applied_keys.union(keys) if key in module_vars
+        }
+
+    def diff(self, config):
+        """
+        :param config: new config
+        :type config: dictionary
+
+        :returns: difference between config set on module and new config,
+            in which keys applied before but missing from new config are
+            changed back to module defaults or removed if module had none
+        :rtype: ConfigDiff
+        """
+        new_config = {
+            key: self.module_defaults[key]
+            for key in self.applied_keys.difference(config)
+            if self.module_defaults.get(key, _missing) is not _missing
+        }
+        new_config.update(config)
+
+        return diff_config(self.get_applied_config(config), new_config)
+
+    def apply(self, config):
+        """
+        Sets added and changed values to config module and restores module
+        defaults of keys which were applied before but are missing from new
+        config, or removes them if module had none, with single update of
+        module namespace. Then subscribers of changed keys are called.
+
+        :param config: new config
+        :type config: dictionary
+
+        :returns: applied difference
+        :rtype: ConfigDiff
+        """
+        with self._lock:
+            module_vars = vars(sys.modules[self.config_module_name])
+
+            for key in config:
+                if key not in self.module_defaults:
+                    self.module_defaults[key] = module_vars.get(
+                        key, _missing)
+
+            diff = self.diff(config)
+            module_vars.update(diff.updated)
+
+            for key in diff.removed:
+                module_vars.pop(key, None)
+
+            self.applied_keys = set(config)
+            subscriptions = list(self.subscriptions)
+
+        if diff:
+            self.notify(diff, subscriptions)
+
+        return diff
+
+    def notify(self, diff, subscriptions=None):
+        """
+        Calls subscribers of keys changed in `diff`.
+
+        :param diff: applied difference
+        :type diff: ConfigDiff
+        :param subscriptions: subscriptions to notify, all if None
+        :type subscriptions: list/None
+        """
+        if subscriptions is None:
+            subscriptions = list(self.subscriptions)
+
+        changed_keys = diff.keys
+
+        for callback, keys in subscriptions:
+            if keys is not None and keys.isdisjoint(changed_keys):
+                continue
+
+            try:
+                callback(diff if keys is None else diff.subset(keys))
+            except Exception:
+                log.error('Config subscriber failed', exc_info=True)
+
+
+_appliers = {}
+_appliers_lock = threading.Lock()
+
+
+def get_config_applier(config_module_name, create=True):
+    """
+    :param config_module_name: name of the python module to set config to.
+    :type config_module_name: string
+    :param create: should applier be created if there is none
+    :type create: boolean
+
+    :returns: applier of config module, shared by all loaders of module
+    :rtype: ConfigApplier/None
+    """
+    with _appliers_lock:
+        applier = _appliers.get(config_module_name)
+
+        if applier is None and create is True:
+            applier = _appliers[config_module_name] = ConfigApplier(
+                config_module_name)
+
+        return applier
+
+
+def subscribe(config_module_name, callback, keys=None):
+    """
+    Registers callback called with `ConfigDiff` of subscribed keys every
+    time some of `keys` change on config module. Once module has
+    subscribers, reloaded configs are applied to it by setting only
+    changed values.
+
+    :param config_module_name: name of the python module config is set to.
+    :type config_module_name: string
+    :param callback: function accepting `ConfigDiff` of subscribed keys
+    :type callback: callable
+    :param keys: subscribed keys, all keys if None
+    :type keys: list/set/None
+
+    :returns: applier of config module
+    :rtype: ConfigApplier
+    """
+    applier = get_config_applier(config_module_name)
+    applier.subscribe(callback, keys)
+
+    return applier
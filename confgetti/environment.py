@@ -0,0 +1,70 @@
+import os
+import threading
+
+from collections.abc import Mapping
+
+
+class EnvironmentIndex(Mapping):
+    """
+    Read only snapshot of environment variables which groups variables by
+    prefix, so repeated lookups do not scan whole environment.
+    Snapshot is not updated when environment changes, `refresh` has to be
+    called after environment is modified.
+    """
+    def __init__(self, environ=None):
+        """
+        Takes snapshot of environment.
+
+        :param environ: source environment, `os.environ` by default
+        :type environ: mapping/None
+        """
+        self.source = os.environ if environ is None else environ
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """
+        Takes new snapshot of source environment and drops grouped
+        variables.
+        """
+        with self._lock:
+            self._variables = dict(self.source)
+            self._prefixes = {}
+
+    def __getitem__(self, key):
+        return self._variables[key]
+
+    def __iter__(self):
+        return iter(self._variables)
+
+    def __len__(self):
+        return len(self._variables)
+
+    def get(self, key, default=None):
+        return self._variables.get(key, default)
+
+    def get_prefixed(self, prefix):
+        """
+        Gets variables whose names start with `prefix`, with prefix and
+        separator removed from names and names lowercased.
+        Variables are grouped by single pass over snapshot on first call
+        for prefix and reused until snapshot is refreshed.
+
+        :param prefix: prefix of variable names
+        :type prefix: string
+
+        :returns: variables by lowercased names without prefix
+        :rtype: dictionary
+        """
+        variables = self._prefixes.get(prefix)
+
+        if variables is None:
+            with self._lock:
+                variables = {
+                    key[len(prefix) + 1:].lower(): value
+                    for key, value in self._variables.items()
+                    if key.startswith(prefix) and len(key) > len(prefix)
+                }
+                self._prefixes[prefix] = variables
+
+        return dict(variables)
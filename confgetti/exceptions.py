@@ -1,4 +1,3 @@
-
 class UndefinedConnectionError(Exception):
     """
     Raise exception when connection to service is not defined
@@ -11,3 +10,11 @@ class ConvertValueError(Exception):
     Raise exception when coversion of value is not possible
     """
     pass
+
+
+class FrozenConfigError(AttributeError):
+    """
+    Raise exception when frozen config is modified
+    """
+    pass
+
@@ -0,0 +1,393 @@
+import re
+import os
+import json
+import mmap
+import threading
+
+
+BYTES_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+JSON_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+JSON_SPECIAL = re.compile(rb'["\[\]{}]')
+JSON_SCALAR = re.compile(rb'[^,\]}\s]+')
+DOTENV_LINE = re.compile(
+    r'^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=\s*'
+    r'(?:"((?:[^"\\]|\\.)*)"|\'([^\']*)\'|([^#]*?))\s*(?:#.*)?$')
+DOTENV_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class FileLoader(object):
+    """
+    Base class of config file loaders, which declares file extensions
+    loader is used for.
+    Parsed files are cached and parsed again only when inode, size or
+    modification time of file changes.
+    """
+    extensions = ()
+
+    def __init__(self):
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def get_signature(self, stat):
+        """
+        :param stat: result of `os.stat` for loaded file
+        :type stat: os.stat_result
+
+        :returns: values identifying version of file
+        :rtype: tuple
+        """
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def load(self, path, keys=None, uppercase=False):
+        """
+        Loads config from file, or returns config parsed on previous load
+        if file did not change.
+
+        :param path: path to config file
+        :type path: string
+        :param keys: top-level keys to load, all keys if None
+        :type keys: dictionary/list/None
+        :param uppercase: should keys be matched as uppercase or no
+        :type uppercase: boolean
+
+        :returns: config
+        :rtype: dictionary
+        """
+        wanted = None if keys is None else frozenset(keys)
+        cache_key = (path, wanted, uppercase)
+
+        with open(path, 'rb') as f:
+            signature = self.get_signature(os.fstat(f.fileno()))
+
+            with self._lock:
+                cached = self._files.get(cache_key)
+
+            if cached is not None and cached[0] == signature:
+                return dict(cached[1])
+
+            if wanted is None:
+                config = self.parse(f)
+            else:
+                config = self.extract(f, wanted, uppercase)
+
+        if not isinstance(config, dict):
+            raise ValueError(
+                'Config file "{}" does not contain mapping'.format(path))
+
+        with self._lock:
+            self._files[cache_key] = (signature, config)
+
+        return dict(config)
+
+    def parse(self, f):
+        """
+        :param f: config file opened in binary mode
+        :type f: file object
+
+        :returns: config
+        :rtype: dictionary
+        """
+        raise NotImplementedError
+
+    def extract(self, f, keys, uppercase=False):
+        """
+        Parses file and keeps only values of `keys`.
+
+        :param f: config file opened in binary mode
+        :type f: file object
+        :param keys: top-level keys to load
+        :type keys: frozenset
+        :param uppercase: should keys be matched as uppercase or no
+        :type uppercase: boolean
+
+        :returns: config
+        :rtype: dictionary
+        """
+        config = self.parse(f)
+
+        if not isinstance(config, dict):
+            return config
+
+        return {
+            key: value for key, value in config.items()
+            if (key.upper() if uppercase is True else key) in keys
+        }
+
+
+class JsonFileLoader(FileLoader):
+    """
+    Loads JSON config files. If keys are passed, file is memory mapped and
+    scanned as bytes, so it is never decoded or held in memory as a whole.
+    Only top-level values of those keys are decoded, values of other keys
+    are skipped by matching their strings and brackets, and scanning stops
+    as soon as all keys are found.
+    """
+    extensions = ('.json',)
+
+    def parse(self, f):
+        return json.load(f)
+
+    def extract(self, f, keys, uppercase=False):
+        """
+        Decodes values of `keys` from top-level object of memory mapped
+        JSON file. Skipped values are only checked to be balanced, not to
+        be valid JSON.
+
+        :param f: opened JSON file
+        :type f: file object
+        :param keys: top-level keys to load
+        :type keys: frozenset
+        :param uppercase: should keys be matched as uppercase or no
+        :type uppercase: boolean
+
+        :returns: config
+        :rtype: dictionary
+        """
+        if os.fstat(f.fileno()).st_size == 0:
+            raise json.JSONDecodeError('Expecting value', '', 0)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return self._extract(buffer, keys, uppercase)
+
+    def skip_value(self, buffer, pos):
+        """
+        :param buffer: JSON document
+        :type buffer: bytes/mmap.mmap
+        :param pos: position where value starts
+        :type pos: integer
+
+        :returns: position after value
+        :rtype: integer
+        """
+        char = buffer[pos:pos + 1]
+
+        if char == b'"':
+            match = JSON_STRING.match(buffer, pos)
+
+            if match is None:
+                raise json.JSONDecodeError('Unterminated string', '', pos)
+
+            return match.end()
+
+        if char in (b'{', b'['):
+            depth = 0
+            end = pos
+
+            while True:
+                match = JSON_SPECIAL.search(buffer, end)
+
+                if match is None:
+                    raise json.JSONDecodeError('Unterminated value', '', pos)
+
+                token = match.group()
+                end = match.end()
+
+                if token == b'"':
+                    match = JSON_STRING.match(buffer, match.start())
+
+                    if match is None:
+                        raise json.JSONDecodeError(
+                            'Unterminated string', '', end - 1)
+
+                    end = match.end()
+                elif token in (b'{', b'['):
+                    depth += 1
+                else:
+                    depth -= 1
+
+                    if depth == 0:
+                        return end
+
+        match = JSON_SCALAR.match(buffer, pos)
+
+        if match is None:
+            raise json.JSONDecodeError('Expecting value', '', pos)
+
+        return match.end()
+
+    def _extract(self, buffer, keys, uppercase):
+        config = {}
+        remaining = set(keys)
+        pos = BYTES_WHITESPACE.match(buffer, 0).end()
+
+        if buffer[pos:pos + 1] != b'{':
+            raise json.JSONDecodeError('Expecting object', '', pos)
+
+        pos = BYTES_WHITESPACE.match(buffer, pos + 1).end()
+
+        if buffer[pos:pos + 1] == b'}':
+            return config
+
+        while remaining:
+            match = JSON_STRING.match(buffer, pos)
+
+            if match is None:
+                raise json.JSONDecodeError(
+                    'Expecting property name enclosed in double quotes',
+                    '', pos)
+
+            name = match.group()[1:-1]
+            name = json.loads(match.group()) if b'\\' in name \
+                else name.decode('utf-8')
+            pos = BYTES_WHITESPACE.match(buffer, match.end()).end()
+
+            if buffer[pos:pos + 1] != b':':
+                raise json.JSONDecodeError("Expecting ':' delimiter", '', pos)
+
+            pos = BYTES_WHITESPACE.match(buffer, pos + 1).end()
+            end = self.skip_value(buffer, pos)
+            key = name.upper() if uppercase is True else name
+
+            if key in remaining:
+                config[name] = json.loads(buffer[pos:end])
+                remaining.discard(key)
+
+            pos = BYTES_WHITESPACE.match(buffer, end).end()
+            delimiter = buffer[pos:pos + 1]
+
+            if delimiter == b'}':
+                break
+            elif delimiter != b',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", '', pos)
+
+            pos = BYTES_WHITESPACE.match(buffer, pos + 1).end()
+
+        return config
+
+
+class YamlFileLoader(FileLoader):
+    """
+    Loads YAML config files, requires PyYAML package.
+    """
+    extensions = ('.yaml', '.yml')
+
+    def parse(self, f):
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError(
+                'Loading YAML config files requires PyYAML package, '
+                'install it with `pip install confgetti[yaml]`') from e
+
+        config = yaml.safe_load(f)
+
+        return {} if config is None else config
+
+
+class TomlFileLoader(FileLoader):
+    """
+    Loads TOML config files with `tomllib` on Python 3.11+, otherwise
+    requires toml package.
+    """
+    extensions = ('.toml',)
+
+    def parse(self, f):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import toml
+            except ImportError as e:
+                raise ImportError(
+                    'Loading TOML config files before Python 3.11 requires '
+                    'toml package, install it with '
+                    '`pip install confgetti[toml]`') from e
+
+            return toml.loads(f.read().decode('utf-8'))
+
+        return tomllib.load(f)
+
+
+class DotEnvFileLoader(FileLoader):
+    """
+    Loads .env files with `NAME=value` lines. Names are lowercased, same
+    as names of variables loaded from environment.
+    """
+    extensions = ('.env',)
+
+    def parse(self, f):
+        config = {}
+
+        for number, line in enumerate(f.read().decode('utf-8').splitlines()):
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+
+            match = DOTENV_LINE.match(line)
+
+            if match is None:
+                raise ValueError('Invalid line {0} in .env file: {1}'.format(
+                    number + 1, line))
+
+            name, double_quoted, single_quoted, value = match.groups()
+
+            if double_quoted is not None:
+                value = re.sub(
+                    r'\\(.)',
+                    lambda escape: DOTENV_ESCAPES.get(
+                        escape.group(1), escape.group(1)),
+                    double_quoted)
+            elif single_quoted is not None:
+                value = single_quoted
+
+            config[name.lower()] = value
+
+        return config
+
+
+class FileLoaderRegistry(object):
+    """
+    Selects config file loader by file extension. Files with unknown
+    extension are loaded with default loader.
+    """
+    def __init__(self, default=None):
+        """
+        :param default: loader of files with unknown extension
+        :type default: FileLoader/None
+        """
+        self.default = JsonFileLoader() if default is None else default
+        self._loaders = {}
+
+    def register(self, loader, extensions=None):
+        """
+        Registers loader for extensions, which replaces loader previously
+        registered for same extensions.
+
+        :param loader: config file loader
+        :type loader: FileLoader
+        :param extensions: extensions with leading dot, loader's if None
+        :type extensions: list/tuple/None
+        """
+        for extension in extensions or loader.extensions:
+            self._loaders[extension.lower()] = loader
+
+    def get_loader(self, path):
+        """
+        :param path: path to config file
+        :type path: string
+
+        :returns: loader registered for extension of file
+        :rtype: FileLoader
+        """
+        name = os.path.basename(path).lower()
+        extension = os.path.splitext(name)[1] or name
+
+        return self._loaders.get(extension, self.default)
+
+    def load(self, path, keys=None, uppercase=False):
+        """
+        Loads config file with loader registered for its extension.
+        Arguments are same as in `FileLoader.load`.
+
+        :returns: config
+        :rtype: dictionary
+        """
+        return self.get_loader(path).load(path, keys, uppercase)
+
+
+json_file_loader = JsonFileLoader()
+
+file_loaders = FileLoaderRegistry(json_file_loader)
+file_loaders.register(json_file_loader)
+file_loaders.register(YamlFileLoader())
+file_loaders.register(TomlFileLoader())
+file_loaders.register(DotEnvFileLoader())
@@ -0,0 +1,201 @@
+import sys
+import threading
+
+from confgetti.exceptions import FrozenConfigError
+
+
+class FrozenConfig(object):
+    """
+    Base class of generated config classes. Values are stored in slots,
+    set once on initialization and can't be changed later.
+    Config is hashable if all its values are hashable.
+    """
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, **values):
+        """
+        :param values: values of fields, missing fields are set to None
+        :type values: any
+        """
+        unknown = set(values) - set(self._fields)
+
+        if unknown:
+            raise TypeError('Unknown config fields: {}'.format(
+                ', '.join(sorted(unknown))))
+
+        for field in self._fields:
+            object.__setattr__(self, field, values.get(field))
+
+    def __setattr__(self, name, value):
+        raise FrozenConfigError('Can not set "{}" of frozen config'.format(
+            name))
+
+    def __delattr__(self, name):
+        raise FrozenConfigError(
+            'Can not delete "{}" of frozen config'.format(name))
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.as_tuple() == other.as_tuple()
+
+    def __hash__(self):
+        return hash(self.as_tuple())
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(
+            '{0}={1!r}'.format(field, getattr(self, field))
+            for field in self._fields))
+
+    def __reduce__(self):
+        return make_config_instance, (
+            type(self).__name__, self._fields, self.as_dict())
+
+    def as_tuple(self):
+        """
+        :returns: values of fields in order of fields
+        :rtype: tuple
+        """
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def as_dict(self):
+        """
+        :returns: values of fields by field name
+        :rtype: dictionary
+        """
+        return {field: getattr(self, field) for field in self._fields}
+
+    def replace(self, **changes):
+        """
+        :param changes: changed values of fields
+        :type changes: any
+
+        :returns: new config of same class with changed values
+        :rtype: FrozenConfig
+        """
+        values = self.as_dict()
+        values.update(changes)
+
+        return type(self)(**values)
+
+
+_classes = {}
+_classes_lock = threading.Lock()
+
+
+def get_key_name(key):
+    """
+    Markers exist only once voluptuous is imported, so voluptuous is not
+    imported to check for them.
+
+    :param key: config key or schema key, e.g. `voluptuous.Required`
+    :type key: any
+
+    :returns: name of key
+    :rtype: any
+    """
+    voluptuous = sys.modules.get('voluptuous')
+
+    if voluptuous is not None and isinstance(key, voluptuous.Marker):
+        return key.schema
+
+    return key
+
+
+def get_fields(keys, uppercase=False):
+    """
+    :param keys: config keys or schema keys
+    :type keys: dictionary/list
+    :param uppercase: should fields be uppercase or no
+    :type uppercase: boolean
+
+    :returns: field names of config keys
+    :rtype: tuple
+    """
+    fields = []
+
+    for key in keys:
+        key = get_key_name(key)
+        field = key.upper() if uppercase is True else key
+
+        if field not in fields:
+            fields.append(field)
+
+    return tuple(fields)
+
+
+def make_config_class(fields, name='Config'):
+    """
+    Generates frozen config class with slot for each field. Classes are
+    cached, so same fields always give same class.
+
+    :param fields: field names, which must be valid identifiers
+    :type fields: list/tuple
+    :param name: name of generated class
+    :type name: string
+
+    :returns: generated config class
+    :rtype: type
+    """
+    fields = tuple(fields)
+    cache_key = (name, fields)
+
+    with _classes_lock:
+        config_class = _classes.get(cache_key)
+
+        if config_class is None:
+            invalid = [field for field in fields if not field.isidentifier()]
+
+            if invalid:
+                raise ValueError(
+                    'Config fields must be identifiers: {}'.format(
+                        ', '.join(invalid)))
+
+            config_class = _classes[cache_key] = type(name, (FrozenConfig,), {
+                '__slots__': fields,
+                '_fields': fields
+            })
+
+    return config_class
+
+
+def make_config_instance(name, fields, values):
+    """
+    :param name: name of config class
+    :type name: string
+    :param fields: field names
+    :type fields: list/tuple
+    :param values: values of fields
+    :type values: dictionary
+
+    :returns: config of generated class
+    :rtype: FrozenConfig
+    """
+    return make_config_class(fields, name)(**values)
+
+
+def freeze_config(config, keys=None, uppercase=False, name='Config'):
+    """
+    Creates frozen config with fields of `keys`, followed by other keys of
+    `config`. Fields of keys missing from config are set to None.
+
+    :param config: validated config
+    :type config: dictionary
+    :param keys: config keys or schema keys
+    :type keys: dictionary/list/None
+    :param uppercase: should fields of keys be uppercase or no
+    :type uppercase: boolean
+    :param name: name of generated class
+    :type name: string
+
+    :returns: frozen config
+    :rtype: FrozenConfig
+    """
+    fields = get_fields(list(keys or []) + list(config), uppercase)
+
+    return make_config_instance(name, fields, config)
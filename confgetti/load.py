@@ -1,15 +1,19 @@
 import logging
 import sys
 import os
-import json
+import threading
 
-from voluptuous import Schema
-
-from confgetti.base import get_variables
+from confgetti.stats import default_stats
+from confgetti.files import json_file_loader, file_loaders
+from confgetti.environment import EnvironmentIndex
+from confgetti.frozen import freeze_config, get_key_name
+from confgetti.diff import get_config_applier
 
 
 log = logging.getLogger(__name__)
 
+_missing = object()
+
 
 def set_values(config_module_name, values):
     """
@@ -25,6 +29,63 @@ def set_values(config_module_name, values):
         setattr(config_module, key, value)
 
 
+def set_frozen_config(
+        config_module_name, values, keys=None, uppercase=False,
+        name='config'):
+    """
+    Set given values to config module as single frozen config object,
+    which is replaced as a whole when config is loaded again.
+
+    :param config_module_name: name of the python module to set config to.
+    :type config_module_name: string
+    :param values: keys and values of config
+    :type values: dictionary
+    :param keys: config keys, used as fields even if missing from values
+    :type keys: dictionary/list/None
+    :param uppercase: should fields of keys be uppercase or no
+    :type uppercase: boolean
+    :param name: name of module attribute holding frozen config
+    :type name: string
+
+    :returns: frozen config
+    :rtype: confgetti.frozen.FrozenConfig
+    """
+    config = freeze_config(values, keys, uppercase)
+    setattr(sys.modules[config_module_name], name, config)
+
+    return config
+
+
+def apply_config(
+        config_module_name, values, keys=None, uppercase=False,
+        frozen=False):
+    """
+    Set given values to config module, as module attributes or as frozen
+    config object.
+    If config module has subscribers of its keys, only changed values are
+    set and subscribers are notified, see `confgetti.diff.subscribe`.
+
+    :param config_module_name: name of the python module to set config to.
+    :type config_module_name: string
+    :param values: keys and values to set
+    :type values: dictionary
+    :param keys: config keys
+    :type keys: dictionary/list/None
+    :param uppercase: should keys be uppercase or no
+    :type uppercase: boolean
+    :param frozen: should values be set as frozen config object or no
+    :type frozen: boolean
+    """
+    applier = get_config_applier(config_module_name, create=False)
+
+    if frozen is True:
+        set_frozen_config(config_module_name, values, keys, uppercase)
+    elif applier is None:
+        set_values(config_module_name, values)
+    else:
+        applier.apply(values)
+
+
 def dict_keys_to_uppercase(dict_for_convert):
     """
     Converts keys of provided dict to uppercase with same value
@@ -43,60 +104,858 @@ def dict_keys_to_uppercase(dict_for_convert):
     return converted_dict
 
 
-def load_from_json(env_var):
+def get_schema_keys(schema):
+    """
+    Voluptuous is imported only when schema is given, so loading config
+    without schema does not import it.
+
+    :param schema: schema to use for config validation.
+    :type schema: voluptuous.Schema/None
+
+    :returns: keys of schema, None if schema is not `voluptuous.Schema`
+    :rtype: list/None
+    """
+    if schema is None:
+        return None
+
+    from voluptuous import Schema
+
+    if isinstance(schema, Schema):
+        return list(schema.schema.keys())
+
+    return None
+
+
+def get_config_path(env_var, environ=None):
+    """
+    Gets path to config file and checks that file exists.
+
+    :param env_var: name of the env var containing path to config file.
+    :type env_var: string
+    :param environ: environment variables, `os.environ` by default
+    :type environ: mapping/None
+
+    :returns: path to config file or None
+    :rtype: string/None
+    """
+    environ = os.environ if environ is None else environ
+    path = environ.get(env_var)
+    if path is None:
+        log.warning("Config path set to None, unable to load "
+                    "configuration: %s", env_var)
+        return None
+
+    if not os.path.isfile(path):
+        log.warning("Config file does not exist, unable to load "
+                    "configuration: %s", path)
+        return None
+
+    return path
+
+
+def load_from_json(env_var, environ=None, keys=None, uppercase=False):
     """
     Load config from json file.
+    File is parsed again only if it changed since it was last loaded.
+    If `keys` are passed, only values of those top-level keys are decoded.
 
     :param env_var: name of the env var containing path to json file.
     :type env_var: string
+    :param environ: environment variables, `os.environ` by default
+    :type environ: mapping/None
+    :param keys: top-level keys to load, all keys if None
+    :type keys: dictionary/list/None
+    :param uppercase: should keys be matched as uppercase or no
+    :type uppercase: boolean
 
     :returns: config
     :rtype: dictionary
     """
-    path_to_json = os.environ.get(env_var)
+    path_to_json = get_config_path(env_var, environ)
     if path_to_json is None:
-        log.warning("Config path set to None, unable to load "
-                    "configuration: {}".format(env_var))
         return {}
 
-    if not os.path.isfile(path_to_json):
-        log.warning("Config file does not exist, unable to load "
-                    "configuration: {}".format(path_to_json))
+    return json_file_loader.load(path_to_json, keys, uppercase)
+
+
+def load_from_file(env_var, environ=None, keys=None, uppercase=False):
+    """
+    Load config from file with loader selected by file extension,
+    see `confgetti.files.file_loaders`. Files with unknown extension are
+    loaded as json. Arguments are same as in `load_from_json`.
+
+    :returns: config
+    :rtype: dictionary
+    """
+    path = get_config_path(env_var, environ)
+    if path is None:
         return {}
 
-    with open(path_to_json, "r") as f:
-        return json.load(f)
+    return file_loaders.load(path, keys, uppercase)
 
 
-def load_from_env(env_prefix):
+def load_from_env(env_prefix, environ=None):
     """
     Load config from env variables.
+    If environment is `EnvironmentIndex`, variables grouped under prefix
+    are taken from it instead of scanning whole environment.
 
     :param env_prefix: prefix of env var names to get values from.
     :type env_prefix: string
+    :param environ: environment variables, `os.environ` by default
+    :type environ: mapping/None
 
     :returns: config
     :rtype: dictionary
     """
+    environ = os.environ if environ is None else environ
+
+    if isinstance(environ, EnvironmentIndex):
+        return environ.get_prefixed(env_prefix)
+
     return {key[len(env_prefix) + 1:].lower(): value
-            for key, value in os.environ.items()
+            for key, value in environ.items()
             if key.startswith(env_prefix) and len(key) > len(env_prefix)}
 
 
-def load_from_config_server(namespace, keys):
+def load_from_config_server(
+        namespace,
+        keys,
+        bulk=True,
+        snapshot_store=None,
+        stats=None,
+        shared_cache=None,
+        batch=False):
     """
     Loads configuration from configuration server.
+    By default, whole namespace is fetched with a single request.
+    In batch mode, keys are fetched with Consul transactions if whole
+    namespace is not fetched at once, or prefix reads are not permitted.
 
     :param namespace: namespace under which app configuration is located.
     :type namespace: string
     :param keys: Set of keys for variables lookup.
     :type keys: dictionary/list
+    :param bulk: Should whole namespace be fetched at once or no
+    :type bulk: boolean
+    :param snapshot_store: store of last fetched configuration server values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+    :param stats: stats collecting Consul requests and conversion failures
+    :type stats: confgetti.stats.Stats/None
+    :param shared_cache: cache of configuration server values shared
+        between processes on host
+    :type shared_cache: confgetti.shared.SharedCache/None
+    :param batch: Should keys be fetched with Consul transactions or no
+    :type batch: boolean
     """
+    from confgetti.base import get_variables
+
     return get_variables(
         path=namespace,
         keys=keys,
         use_env=False,
-        use_consul=True)
+        use_consul=True,
+        bulk=bulk,
+        snapshot_store=snapshot_store,
+        stats=stats,
+        shared_cache=shared_cache,
+        batch=batch)
+
+
+def select_keys(tree, keys=None):
+    """
+    :param tree: nested config values
+    :type tree: dictionary
+    :param keys: top-level keys to select, all keys if None
+    :type keys: dictionary/list/None
+
+    :returns: values of selected keys
+    :rtype: dictionary
+    """
+    if keys is None:
+        return tree
+
+    selected = {}
+
+    for key in keys:
+        name = get_key_name(key)
+
+        if name in tree:
+            selected[name] = tree[name]
+
+    return selected
+
+
+def load_tree_from_config_server(
+        namespace,
+        keys=None,
+        snapshot_store=None,
+        stats=None,
+        shared_cache=None):
+    """
+    Loads whole namespace from configuration server with a single request
+    and rebuilds it into nested dictionary, so keys under
+    `namespace/db/host` are loaded as `{'db': {'host': value}}` and can be
+    validated by nested schema. Values are not converted.
+
+    :param namespace: namespace under which app configuration is located.
+    :type namespace: string
+    :param keys: top-level keys to load, all keys if None
+    :type keys: dictionary/list/None
+    :param snapshot_store: store of last fetched configuration server values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+    :param stats: stats collecting Consul requests and conversion failures
+    :type stats: confgetti.stats.Stats/None
+    :param shared_cache: cache of configuration server values shared
+        between processes on host
+    :type shared_cache: confgetti.shared.SharedCache/None
+
+    :returns: nested config
+    :rtype: dictionary
+    """
+    from confgetti.base import get_tree
+
+    return select_keys(
+        get_tree(namespace, snapshot_store, stats, shared_cache), keys)
+
+
+def load_from_snapshot(namespace, keys, snapshot_store, nested=False):
+    """
+    Loads configuration server values saved to snapshot store.
+
+    :param namespace: namespace under which app configuration is located.
+    :type namespace: string
+    :param keys: Set of keys for variables lookup.
+    :type keys: dictionary/list
+    :param snapshot_store: store of last fetched configuration server values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore
+    :param nested: should values be rebuilt into nested dictionary, see
+        `load_tree_from_config_server`
+    :type nested: boolean
+
+    :returns: config or None if there is no snapshot
+    :rtype: dictionary/None
+    """
+    snapshot = snapshot_store.load(namespace)
+
+    if snapshot is None:
+        return None
+
+    from confgetti.base import (
+        Confgetti, ValueConvert, build_tree, decode_raw_values)
+
+    try:
+        values = decode_raw_values(snapshot)
+    except (TypeError, ValueError):
+        return None
+
+    if nested is True:
+        return select_keys(build_tree(values, ValueConvert().decode), keys)
+
+    return Confgetti(prepare_consul=False).get_variables(
+        path=namespace,
+        keys=keys,
+        use_env=False,
+        consul_values=values)
+
+
+class Source(object):
+    """
+    Base class of config sources used in `SourceChain`, which declares
+    name of source used in stats.
+    """
+    name = None
+
+    def load(self, env_var, keys=None, uppercase=False, environ=None):
+        """
+        Loads values of keys from source.
+
+        :param env_var: name of the env var containing path to config file.
+        :type env_var: string
+        :param keys: keys which are still unresolved, all keys if None
+        :type keys: dictionary/list/None
+        :param uppercase: should keys be matched as uppercase or no.
+        :type uppercase: boolean
+        :param environ: environment variables, `os.environ` by default
+        :type environ: mapping/None
+
+        :returns: config
+        :rtype: dictionary
+        """
+        raise NotImplementedError
+
+
+class EnvSource(Source):
+    """
+    Loads variables prefixed with `env_var` from environment.
+    """
+    name = 'env'
+
+    def load(self, env_var, keys=None, uppercase=False, environ=None):
+        return load_from_env(env_var, environ)
+
+
+class FileSource(Source):
+    """
+    Loads config file whose path is set in `env_var` variable.
+    """
+    name = 'file'
+
+    def __init__(self, stream=False):
+        """
+        :param stream: should only values of unresolved keys be loaded
+        :type stream: boolean
+        """
+        self.stream = stream
+
+    def load(self, env_var, keys=None, uppercase=False, environ=None):
+        if self.stream is True and keys is not None:
+            return load_from_file(env_var, environ, keys, uppercase)
+
+        return load_from_file(env_var, environ)
+
+
+class ConsulSource(Source):
+    """
+    Loads values of unresolved keys from configuration server.
+    In nested mode, namespace is loaded as nested dictionary, also when
+    keys are not known.
+    """
+    name = 'consul'
+
+    def __init__(
+            self, bulk=True, snapshot_store=None, stats=None,
+            shared_cache=None, nested=False, batch=False):
+        """
+        :param bulk: Should whole namespace be fetched at once or no
+        :type bulk: boolean
+        :param snapshot_store: store of last fetched configuration server
+            values
+        :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+        :param stats: stats collecting Consul requests and conversion
+            failures
+        :type stats: confgetti.stats.Stats/None
+        :param shared_cache: cache of configuration server values shared
+            between processes on host
+        :type shared_cache: confgetti.shared.SharedCache/None
+        :param nested: should whole namespace be loaded as nested
+            dictionary, see `load_tree_from_config_server`
+        :type nested: boolean
+        :param batch: Should keys be fetched with Consul transactions or no
+        :type batch: boolean
+        """
+        self.bulk = bulk
+        self.snapshot_store = snapshot_store
+        self.stats = stats
+        self.shared_cache = shared_cache
+        self.nested = nested
+        self.batch = batch
+
+    def load(self, env_var, keys=None, uppercase=False, environ=None):
+        if self.nested is True:
+            return load_tree_from_config_server(
+                env_var, keys, self.snapshot_store, self.stats,
+                self.shared_cache)
+
+        if not keys:
+            return {}
+
+        return load_from_config_server(
+            env_var, keys, self.bulk, self.snapshot_store, self.stats,
+            self.shared_cache, self.batch)
+
+
+class SnapshotSource(Source):
+    """
+    Loads values of unresolved keys from snapshot of configuration server
+    values. In nested mode, snapshot is loaded as nested dictionary, also
+    when keys are not known.
+    """
+    name = 'snapshot'
+
+    def __init__(self, snapshot_store, nested=False):
+        """
+        :param snapshot_store: store of last fetched configuration server
+            values
+        :type snapshot_store: confgetti.snapshot.SnapshotStore
+        :param nested: should whole snapshot be loaded as nested
+            dictionary, see `load_tree_from_config_server`
+        :type nested: boolean
+        """
+        self.snapshot_store = snapshot_store
+        self.nested = nested
+
+    def load(self, env_var, keys=None, uppercase=False, environ=None):
+        if self.nested is True:
+            return load_from_snapshot(
+                env_var, keys, self.snapshot_store, nested=True) or {}
+
+        if not keys:
+            return {}
+
+        return load_from_snapshot(env_var, keys, self.snapshot_store) or {}
+
+
+class ValuesSource(Source):
+    """
+    Returns already loaded values.
+    """
+    name = 'values'
+
+    def __init__(self, values):
+        """
+        :param values: loaded values
+        :type values: dictionary
+        """
+        self.values = values
+
+    def load(self, env_var, keys=None, uppercase=False, environ=None):
+        return dict(self.values)
+
+
+class SourceChain(object):
+    """
+    Ordered chain of config sources, highest priority first.
+    Every source is asked only for keys which are not resolved by sources
+    before it, and once all keys are resolved, remaining sources are not
+    asked at all. If keys are not known or empty, e.g. schema allows
+    extra keys only, every source is loaded whole.
+    Duration of every source load is recorded to stats as
+    `source.<name>` timing.
+    """
+    def __init__(self, sources, stats=None):
+        """
+        :param sources: config sources, highest priority first
+        :type sources: list
+        :param stats: stats collecting durations of sources, default if None
+        :type stats: confgetti.stats.Stats/None
+        """
+        self.sources = list(sources)
+        self.stats = default_stats if stats is None else stats
+
+    def get_unresolved(self, keys, config):
+        """
+        :param keys: Set of keys for variables lookup.
+        :type keys: dictionary/list/None
+        :param config: already resolved values
+        :type config: dictionary
+
+        :returns: keys missing from config
+        :rtype: dictionary/list/None
+        """
+        if keys is None:
+            return None
+
+        if isinstance(keys, dict):
+            return {
+                key: value for key, value in keys.items() if key not in config
+            }
+
+        return [key for key in keys if key not in config]
+
+    def load(self, env_var, keys=None, uppercase=False, environ=None):
+        """
+        Resolves config from sources. Arguments are same as in
+        `Source.load`.
+
+        :returns: config
+        :rtype: dictionary
+        """
+        config = {}
+
+        if not keys:
+            keys = None
+
+        for source in self.sources:
+            unresolved = self.get_unresolved(keys, config)
+
+            if unresolved is not None and not unresolved:
+                break
+
+            name = source.name or type(source).__name__.lower()
+
+            with self.stats.time('source.{}'.format(name)):
+                loaded = source.load(env_var, unresolved, uppercase, environ)
+
+            if uppercase is True:
+                loaded = dict_keys_to_uppercase(loaded)
+
+            for key, value in loaded.items():
+                config.setdefault(key, value)
+
+        return config
+
+
+def load_config(
+        env_var,
+        schema=None,
+        keys=None,
+        uppercase=False,
+        config_server_values=None,
+        snapshot_store=None,
+        environ=None,
+        stream_json=False,
+        sources=None,
+        stats=None,
+        shared_cache=None,
+        nested=False):
+    """
+    Load config from environment, config file and configuration server,
+    in that order of priority, and validate it.
+    Configuration server is asked only for keys which are not set in
+    environment or config file.
+    In nested mode, whole configuration server namespace is loaded as
+    nested dictionary, see `load_tree_from_config_server`.
+
+    :param env_var: name of the env var containing path to config file.
+    :type env_var: string
+    :param schema: schema to use for config validation.
+    :type schema: voluptuous.Schema
+    :param keys: Set of keys for variables lookup.
+    :type keys: dictionary/list
+    :param uppercase: should keys be returned as uppercase or no.
+    :type uppercase: boolean
+    :param config_server_values: already loaded configuration server values
+    :type config_server_values: dictionary/None
+    :param snapshot_store: store of last fetched configuration server values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+    :param environ: environment variables, `os.environ` by default
+    :type environ: mapping/None
+    :param stream_json: should only values of keys be loaded from file
+    :type stream_json: boolean
+    :param sources: config sources used instead of default ones, highest
+        priority first
+    :type sources: list/None
+    :param stats: stats collecting durations of sources and validation,
+        Consul requests and conversion failures, default if None
+    :type stats: confgetti.stats.Stats/None
+    :param shared_cache: cache of configuration server values shared
+        between processes on host
+    :type shared_cache: confgetti.shared.SharedCache/None
+    :param nested: should configuration server values be loaded as nested
+        dictionary or no
+    :type nested: boolean
+
+    :returns: config
+    :rtype: dictionary
+    """
+    if keys is None:
+        keys = get_schema_keys(schema)
+
+    if sources is None:
+        if config_server_values is None:
+            config_server_source = ConsulSource(
+                snapshot_store=snapshot_store, stats=stats,
+                shared_cache=shared_cache, nested=nested)
+        else:
+            config_server_source = ValuesSource(config_server_values)
+
+        sources = [EnvSource(), FileSource(stream_json), config_server_source]
+
+    chain = SourceChain(sources, stats)
+    config = chain.load(env_var, keys, uppercase, environ)
+
+    if schema is not None:
+        with chain.stats.time('validation'):
+            config = schema(config)
+
+    return config
+
+
+class LazyConfig(object):
+    """
+    Declares classes for easier override if custom logic is needed,
+    `confgetti.base.Confgetti` is used if class is None.
+    """
+    confgetti_class = None
+
+    def __init__(
+            self,
+            config_module_name,
+            env_var,
+            schema=None,
+            keys=None,
+            uppercase=False,
+            environ=None):
+        """
+        Prepares lazy loading of config keys. Every key is loaded,
+        converted and validated on first access and then set to config
+        module, so keys which are never accessed are never loaded.
+        Schema must be `voluptuous.Schema` of dictionary, so each key
+        can be validated on its own.
+
+        :param config_module_name: name of the python module to set config to.
+        :type config_module_name: string
+        :param env_var: name of the env var containing path to config file.
+        :type env_var: string
+        :param schema: schema to use for config validation.
+        :type schema: voluptuous.Schema
+        :param keys: Set of keys for variables lookup.
+        :type keys: dictionary/list
+        :param uppercase: should keys be returned as uppercase or no.
+        :type uppercase: boolean
+        :param environ: environment variables, `os.environ` by default
+        :type environ: mapping/None
+        """
+        if schema is not None:
+            from voluptuous import Schema
+
+            if not (isinstance(schema, Schema) and
+                    isinstance(schema.schema, dict)):
+                raise TypeError('lazy config requires "schema" to be '
+                                'voluptuous.Schema of dict')
+
+        if keys is None and schema is not None:
+            keys = list(schema.schema.keys())
+
+        keys = [] if keys is None else keys
+
+        if isinstance(keys, dict) is True:
+            convert_map = keys
+        else:
+            convert_map = dict.fromkeys(keys)
+
+        self.config_module_name = config_module_name
+        self.env_var = env_var
+        self.schema = schema
+        self.uppercase = uppercase
+        self.environ = environ
+        self.keys = {}
+        self.validators = {}
+        self.defaults = {}
+        self.previous_getattr = None
+        self.confgetti = None
+        self._json_config = None
+        self._env_config = None
+        self._lock = threading.RLock()
+
+        for key, convert_to in convert_map.items():
+            key = get_key_name(key)
+            name = key.upper() if uppercase is True else key
+            self.keys[name] = (key, convert_to)
+
+        if schema is not None:
+            for key, validator in schema.schema.items():
+                name = get_key_name(key)
+                self.validators[name] = Schema(
+                    {key: validator},
+                    required=schema.required,
+                    extra=schema.extra)
+
+    def install(self):
+        """
+        Removes default values of config keys from config module, so their
+        access falls through to module `__getattr__`, which is set to
+        this object. Module `__getattr__` is supported since Python 3.7,
+        so on older versions it raises `RuntimeError` before module is
+        changed.
+
+        :returns: lazy config
+        :rtype: LazyConfig
+        """
+        if sys.version_info < (3, 7):
+            raise RuntimeError('lazy config requires Python 3.7 or newer')
+
+        config_module = sys.modules[self.config_module_name]
+        module_vars = vars(config_module)
+
+        for name in self.keys:
+            if name in module_vars:
+                self.defaults[name] = module_vars.pop(name)
+
+        self.previous_getattr = module_vars.get('__getattr__')
+        config_module.__getattr__ = self
+
+        return self
+
+    def _load_source(self, loaded):
+        return dict_keys_to_uppercase(loaded) \
+            if self.uppercase is True else loaded
+
+    def get_env_config(self):
+        """
+        :returns: config loaded from env variables, loaded once
+        :rtype: dictionary
+        """
+        if self._env_config is None:
+            self._env_config = self._load_source(
+                load_from_env(self.env_var, self.environ))
+
+        return self._env_config
+
+    def get_json_config(self):
+        """
+        :returns: config loaded from config file, loaded once
+        :rtype: dictionary
+        """
+        if self._json_config is None:
+            self._json_config = self._load_source(
+                load_from_file(self.env_var, self.environ))
+
+        return self._json_config
+
+    def get_config_server_value(self, key, convert_to):
+        """
+        :param key: key of variable on configuration server
+        :type key: string
+        :param convert_to: wanted value type
+        :type convert_to: type/string/None
+
+        :returns: value loaded from configuration server or None
+        :rtype: any
+        """
+        if self.confgetti is None:
+            confgetti_class = self.confgetti_class
+
+            if confgetti_class is None:
+                from confgetti.base import Confgetti as confgetti_class
+
+            self.confgetti = confgetti_class(environ=self.environ)
+
+        return self.confgetti.get_variable(
+            key, path=self.env_var, convert_to=convert_to, use_env=False)
+
+    def load(self, name):
+        """
+        Loads single key from environment, config file or configuration
+        server, in that order, and validates it.
+
+        :param name: name of config key
+        :type name: string
+
+        :returns: validated value
+        :rtype: any
+        """
+        key, convert_to = self.keys[name]
+        value = self.get_env_config().get(name, _missing)
+
+        if value is _missing:
+            value = self.get_json_config().get(name, _missing)
+
+        if value is _missing:
+            value = self.get_config_server_value(key, convert_to)
+            value = _missing if value is None else value
+
+        validator = self.validators.get(name)
+
+        if validator is not None:
+            config = {} if value is _missing else {name: value}
+            value = validator(config).get(name, _missing)
+
+        if value is _missing:
+            value = self.defaults.get(name, _missing)
+
+        return value
+
+    def __call__(self, name):
+        """
+        Module `__getattr__` which loads config key, sets it to config
+        module and returns it.
+
+        :param name: name of accessed attribute
+        :type name: string
+
+        :returns: attribute value
+        :rtype: any
+        """
+        if name not in self.keys:
+            if self.previous_getattr is not None:
+                return self.previous_getattr(name)
+
+            raise AttributeError('module {!r} has no attribute {!r}'.format(
+                self.config_module_name, name))
+
+        with self._lock:
+            config_module = sys.modules[self.config_module_name]
+
+            if name in vars(config_module):
+                return vars(config_module)[name]
+
+            try:
+                value = self.load(name)
+            except:
+                log.error("Config error", exc_info=True)
+                raise
+
+            if value is _missing:
+                raise AttributeError(
+                    'module {!r} has no attribute {!r}'.format(
+                        self.config_module_name, name))
+
+            setattr(config_module, name, value)
+
+            return value
+
+
+def refresh_config(
+        config_module_name,
+        env_var,
+        schema=None,
+        keys=None,
+        uppercase=False,
+        snapshot_store=None,
+        environ=None,
+        stream_json=False,
+        sources=None,
+        stats=None,
+        shared_cache=None,
+        frozen=False,
+        nested=False):
+    """
+    Load config, validate and set to given module in background thread.
+    Errors are logged and module is left with previous values.
+
+    :param config_module_name: name of the python module to set config to.
+    :type config_module_name: string
+    :param env_var: name of the env var containing path to config file.
+    :type env_var: string
+    :param schema: schema to use for config validation.
+    :type schema: voluptuous.Schema
+    :param uppercase: should keys be returned as uppercase or no.
+    :type uppercase: boolean
+    :param snapshot_store: store of last fetched configuration server values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+    :param environ: environment variables, `os.environ` by default
+    :type environ: mapping/None
+    :param stream_json: should only values of keys be loaded from file
+    :type stream_json: boolean
+    :param sources: config sources used instead of default ones, highest
+        priority first
+    :type sources: list/None
+    :param stats: stats collecting config loading metrics, default if None
+    :type stats: confgetti.stats.Stats/None
+    :param shared_cache: cache of configuration server values shared
+        between processes on host
+    :type shared_cache: confgetti.shared.SharedCache/None
+    :param frozen: should config be set as frozen `config` object or no
+    :type frozen: boolean
+    :param nested: should configuration server values be loaded as nested
+        dictionary or no
+    :type nested: boolean
+
+    :returns: started thread
+    :rtype: threading.Thread
+    """
+    def refresh():
+        try:
+            config = load_config(
+                env_var, schema, keys, uppercase,
+                snapshot_store=snapshot_store, environ=environ,
+                stream_json=stream_json, sources=sources, stats=stats,
+                shared_cache=shared_cache, nested=nested)
+
+            apply_config(
+                config_module_name, config, keys, uppercase, frozen)
+        except Exception:
+            log.error("Config refresh error", exc_info=True)
+
+    thread = threading.Thread(
+        target=refresh,
+        name='confgetti-refresh-{}'.format(env_var),
+        daemon=True)
+    thread.start()
+
+    return thread
 
 
 def load_and_validate_config(
@@ -104,9 +963,30 @@ def load_and_validate_config(
         env_var,
         schema=None,
         keys=None,
-        uppercase=False):
+        uppercase=False,
+        snapshot_store=None,
+        lazy=False,
+        environ=None,
+        stream_json=False,
+        sources=None,
+        stats=None,
+        shared_cache=None,
+        frozen=False,
+        nested=False):
     """
     Load config, validate and set to given module.
+    If snapshot store is passed and holds snapshot of configuration server
+    values, config is loaded from snapshot instantly and then refreshed
+    from configuration server in background thread, unless custom
+    sources are passed.
+    In lazy mode, every key is loaded and validated on its first access,
+    see `LazyConfig`.
+    In frozen mode, config is set to module as single immutable `config`
+    object of generated slotted class, see `confgetti.frozen`.
+    In nested mode, whole configuration server namespace is loaded as
+    nested dictionary, so keys under `namespace/db/host` are validated by
+    nested schema `{'db': {'host': str}}`, see
+    `load_tree_from_config_server`.
 
     :param config_module_name: name of the python module to set config to.
     :type config_module_name: string
@@ -116,29 +996,76 @@ def load_and_validate_config(
     :type schema: voluptuous.Schema
     :param uppercase: should keys be returned as uppercase or no.
     :type uppercase: boolean
+    :param snapshot_store: store of last fetched configuration server values
+    :type snapshot_store: confgetti.snapshot.SnapshotStore/None
+    :param lazy: should keys be loaded on first access or no
+    :type lazy: boolean
+    :param environ: environment variables, `os.environ` by default
+    :type environ: mapping/None
+    :param stream_json: should only values of keys be loaded from file
+    :type stream_json: boolean
+    :param sources: config sources used instead of default ones, highest
+        priority first, see `SourceChain`
+    :type sources: list/None
+    :param stats: stats collecting config loading metrics, default if None
+    :type stats: confgetti.stats.Stats/None
+    :param shared_cache: cache of configuration server values shared
+        between processes on host
+    :type shared_cache: confgetti.shared.SharedCache/None
+    :param frozen: should config be set as frozen `config` object or no
+    :type frozen: boolean
+    :param nested: should configuration server values be loaded as nested
+        dictionary or no
+    :type nested: boolean
+
+    :returns: background refresh thread if config was loaded from snapshot,
+        lazy config in lazy mode
+    :rtype: threading.Thread/LazyConfig/None
     """
-    if keys is None and isinstance(schema, Schema):
-        keys = list(schema.schema.keys())
+    if lazy is True and frozen is True:
+        raise ValueError('lazy and frozen config can not be combined')
 
-    try:
-        config = {}
+    if lazy is True and nested is True:
+        raise ValueError('lazy and nested config can not be combined')
 
-        loaded_configs = [
-            load_from_config_server(env_var, keys),
-            load_from_json(env_var),
-            load_from_env(env_var),
-        ]
+    if lazy is True:
+        return LazyConfig(
+            config_module_name, env_var, schema, keys, uppercase, environ
+        ).install()
 
-        for loaded in loaded_configs:
-            if uppercase is True:
-                loaded = dict_keys_to_uppercase(loaded)
+    if keys is None:
+        keys = get_schema_keys(schema)
+
+    try:
+        if snapshot_store is not None and sources is None:
+            snapshot = load_from_snapshot(
+                env_var, keys, snapshot_store, nested)
 
-            config.update(loaded)
+            if snapshot is not None:
+                try:
+                    config = load_config(
+                        env_var, schema, keys, uppercase,
+                        config_server_values=snapshot, environ=environ,
+                        stream_json=stream_json, stats=stats)
+                except Exception:
+                    log.warning("Snapshot config error", exc_info=True)
+                else:
+                    apply_config(
+                        config_module_name, config, keys, uppercase, frozen)
 
-        if schema is not None:
-            config = schema(config)
+                    return refresh_config(
+                        config_module_name, env_var, schema, keys,
+                        uppercase, snapshot_store, environ, stream_json,
+                        stats=stats, shared_cache=shared_cache,
+                        frozen=frozen, nested=nested)
+
+        config = load_config(
+            env_var, schema, keys, uppercase,
+            snapshot_store=snapshot_store, environ=environ,
+            stream_json=stream_json, sources=sources, stats=stats,
+            shared_cache=shared_cache, nested=nested)
 
-        set_values(config_module_name, config)
+        apply_config(config_module_name, config, keys, uppercase, frozen)
     except:
         log.error("Config error", exc_info=True)
         raise
@@ -1,3 +1,4 @@
+import time
 import logging
 
 
@@ -23,3 +24,136 @@ class DuplicateFilter(logging.Filter):
             return True
 
         return False
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Logging filter limiting rate of messages with same module, level and
+    message template, so messages differing only in arguments are limited
+    together. Every template has token bucket holding up to `burst`
+    messages, which is refilled with `rate` messages per second.
+    Only `max_keys` most recently logged templates are tracked.
+    Number of suppressed messages is logged when message passes again, or
+    at most every `summary_interval` seconds.
+    Records are never formatted by filter, so suppressed records cost only
+    a lookup. Filter does not lock, because dictionary operations it does
+    are atomic, so concurrent logging can only make limits approximate.
+    Declares default settings for easier override.
+    """
+    default_rate = 0.1
+    default_burst = 10
+    default_max_keys = 512
+    default_summary_interval = 60
+    summary_message = 'Suppressed %d messages like: %s'
+
+    def __init__(
+            self,
+            rate=None,
+            burst=None,
+            max_keys=None,
+            summary_interval=None):
+        """
+        :param rate: messages per second refilled to bucket of template
+        :type rate: float/None
+        :param burst: maximum number of messages logged at once
+        :type burst: integer/None
+        :param max_keys: maximum number of tracked templates
+        :type max_keys: integer/None
+        :param summary_interval: seconds between summaries of suppressed
+            messages
+        :type summary_interval: integer/float/None
+        """
+        super(RateLimitFilter, self).__init__()
+        self.rate = self.default_rate if rate is None else rate
+        self.burst = self.default_burst if burst is None else burst
+        self.max_keys = self.default_max_keys \
+            if max_keys is None else max_keys
+        self.summary_interval = self.default_summary_interval \
+            if summary_interval is None else summary_interval
+        self.reset()
+
+    def reset(self):
+        """
+        Drops all tracked templates.
+        """
+        self._buckets = {}
+        self._last_summary = time.monotonic()
+        self._summarizing = False
+
+    def _get_bucket(self, key, record, now):
+        bucket = self._buckets.pop(key, None)
+
+        if bucket is None:
+            while len(self._buckets) >= self.max_keys:
+                try:
+                    self._buckets.pop(next(iter(self._buckets)), None)
+                except (StopIteration, RuntimeError):
+                    break
+
+            # tokens, last refill time, suppressed count, logger name
+            bucket = [self.burst, now, 0, record.name]
+        else:
+            bucket[0] = min(
+                self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        # reinserted, so dictionary order is order of recent use
+        self._buckets[key] = bucket
+
+        return bucket
+
+    def _summarize(self, key, bucket):
+        suppressed = bucket[2]
+
+        if not suppressed:
+            return
+
+        bucket[2] = 0
+        self._summarizing = True
+
+        try:
+            logging.getLogger(bucket[3]).log(
+                key[1], self.summary_message, suppressed, key[2])
+        finally:
+            self._summarizing = False
+
+    def summarize(self):
+        """
+        Logs number of suppressed messages of every tracked template.
+        """
+        self._last_summary = time.monotonic()
+
+        for key, bucket in list(self._buckets.items()):
+            self._summarize(key, bucket)
+
+    def filter(self, record):
+        """
+        Takes token from bucket of record's template.
+
+        :param record: message record
+        :type record: logging.LogRecord
+
+        :returns: boolean indicating if message should be displayed or no
+        :rtype: boolean
+        """
+        if self._summarizing is True:
+            return True
+
+        now = time.monotonic()
+        key = (record.module, record.levelno, record.msg)
+        bucket = self._get_bucket(key, record, now)
+
+        if now - self._last_summary >= self.summary_interval:
+            self.summarize()
+
+        if bucket[0] < 1:
+            bucket[2] += 1
+            return False
+
+        bucket[0] -= 1
+        self._summarize(key, bucket)
+
+        return True
+
+
+rate_limit_filter = RateLimitFilter()
@@ -1,12 +1,361 @@
 import os
+import re
+import json
+import time
+import base64
+import hashlib
+import random
+import threading
 import consul
 
-from requests.exceptions import ConnectionError
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+
+from consul import ACLPermissionDenied, ConsulException
+from consul.base import ACLDisabled, BadRequest, ClientError, NotFound
+from requests.exceptions import ConnectionError, Timeout
+from confgetti.stats import default_stats
 from confgetti.exceptions import UndefinedConnectionError
 
 
+class CircuitOpenError(ConnectionError):
+    """
+    Raise exception when requests to service are stopped by open circuit
+    breaker after consecutive failures
+    """
+    pass
+
+
+# Consul errors of requests which were answered by healthy service
+CLIENT_ERRORS = (
+    ACLDisabled, ACLPermissionDenied, BadRequest, ClientError, NotFound)
+
+DURATION_PART = re.compile(r'(\d+(?:\.\d*)?)(ns|us|ms|s|m|h)')
+
+DURATION_UNITS = {
+    'ns': 1e-9, 'us': 1e-6, 'ms': 1e-3, 's': 1, 'm': 60, 'h': 3600
+}
+
+
+def parse_duration(duration):
+    """
+    :param duration: Consul duration, e.g. '30s', '1m30s' or '500ms'
+    :type duration: string
+
+    :returns: seconds of duration or None if it is not valid
+    :rtype: float/None
+    """
+    parts = DURATION_PART.findall(duration)
+
+    if not parts or ''.join(
+            number + unit for number, unit in parts) != duration:
+        return None
+
+    return sum(float(number) * DURATION_UNITS[unit] for number, unit in parts)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter which applies default timeout to requests sent without
+    explicit one. Read timeout of blocking query is extended by its `wait`
+    duration, so only queries Consul fails to answer in time time out.
+    """
+    def __init__(self, timeout=None, *args, **kwargs):
+        """
+        :param timeout: seconds to wait for connection and response
+        :type timeout: float/tuple/None
+        """
+        self.timeout = timeout
+
+        super(TimeoutHTTPAdapter, self).__init__(*args, **kwargs)
+
+    def get_timeout(self, request):
+        """
+        :param request: prepared HTTP request
+        :type request: requests.PreparedRequest
+
+        :returns: default timeout, with read timeout extended by `wait`
+            and up to 1/16 of it Consul adds to blocking queries
+        :rtype: float/tuple/None
+        """
+        if self.timeout is None:
+            return None
+
+        wait = parse_qs(urlsplit(request.url).query).get('wait')
+        seconds = parse_duration(wait[0]) if wait else None
+
+        if seconds is None:
+            return self.timeout
+
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+        else:
+            connect = read = self.timeout
+
+        if read is not None:
+            read += seconds + seconds / 16
+
+        return connect, read
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.get_timeout(request)
+
+        return super(TimeoutHTTPAdapter, self).send(request, **kwargs)
+
+
+def mount_adapter(session, pool_size=None, timeout=None):
+    """
+    Mounts adapter keeping `pool_size` keep-alive connections per host
+    and applying `timeout` to every request of session.
+
+    :param session: HTTP session of Consul client
+    :type session: requests.Session
+    :param pool_size: number of connections kept open per host
+    :type pool_size: integer/None
+    :param timeout: seconds to wait for connection and response
+    :type timeout: float/tuple/None
+
+    :returns: mounted adapter
+    :rtype: TimeoutHTTPAdapter
+    """
+    adapter = TimeoutHTTPAdapter(
+        timeout,
+        pool_maxsize=DEFAULT_POOLSIZE if pool_size is None else pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return adapter
+
+
+class CircuitBreaker(object):
+    """
+    Stops requests to Consul service after `failure_threshold` consecutive
+    failures, so callers fail fast instead of waiting for every request
+    to time out. After `reset_timeout` seconds single probe request is let
+    through, which closes circuit if it succeeds or opens it again if it
+    fails.
+    Declares default settings for easier override.
+    """
+    default_failure_threshold = 5
+    default_reset_timeout = 30
+
+    def __init__(self, failure_threshold=None, reset_timeout=None):
+        """
+        :param failure_threshold: consecutive failures which open circuit
+        :type failure_threshold: integer/None
+        :param reset_timeout: seconds after which open circuit is probed
+        :type reset_timeout: integer/float/None
+        """
+        self.failure_threshold = self.default_failure_threshold \
+            if failure_threshold is None else failure_threshold
+        self.reset_timeout = self.default_reset_timeout \
+            if reset_timeout is None else reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_closed(self):
+        """
+        :returns: are requests let through without limit or no
+        :rtype: boolean
+        """
+        return self.opened_at is None
+
+    def before_request(self):
+        """
+        Raises `CircuitOpenError` if circuit is open and request is not
+        a probe of half-open circuit.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+
+            if self.probing is False and \
+                    time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.probing = True
+                return
+
+        raise CircuitOpenError(
+            'Requests to Consul are stopped after {} consecutive '
+            'failures'.format(self.failures))
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+            if self.probing is True or \
+                    self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+    def reset(self):
+        """
+        Closes circuit.
+        """
+        self.record_success()
+
+
+class ConnectionRegistry(object):
+    """
+    Process wide registry of Consul clients, so every interface connecting
+    with same configuration shares one pool of keep-alive connections
+    and one circuit breaker.
+    Registry is reset in child process after fork, so connections are
+    never shared between processes.
+    """
+    def __init__(self):
+        self._connections = {}
+        self._circuit_breakers = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _get_key(self, config):
+        return tuple(sorted(
+            (name, str(value)) for name, value in config.items()
+            if name not in ('pool_size', 'timeout')
+        ))
+
+    def get_connection(self, config):
+        """
+        Returns Consul client for given configuration, creating it if it
+        does not exist. Besides Consul client arguments, configuration can
+        hold `pool_size` and `timeout` of HTTP session.
+
+        :param config: dictionary holding consul configuration data
+        :type config: dictionary
+
+        :returns: instance of consul client
+        :rtype: consul.std.Consul object
+        """
+        config = dict(config)
+        pool_size = config.pop('pool_size', None)
+        timeout = config.pop('timeout', None)
+        key = self._get_key(config)
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+
+            connection = self._connections.get(key)
+
+            if connection is None:
+                connection = consul.Consul(**config)
+                mount_adapter(connection.http.session, pool_size, timeout)
+                self._connections[key] = connection
+
+            return connection
+
+    def resize_pool(self, connection, pool_size):
+        """
+        Grows connection pool of shared Consul client, so it keeps at
+        least `pool_size` connections open. Pool is never shrunk, because
+        it is shared by all interfaces with same configuration, and
+        replaced adapter is closed, so its idle connections are released.
+
+        :param connection: Consul client created by registry
+        :type connection: consul.std.Consul object
+        :param pool_size: number of connections kept open per host
+        :type pool_size: integer
+        """
+        session = connection.http.session
+
+        with self._lock:
+            adapter = session.get_adapter('http://')
+
+            if getattr(adapter, '_pool_maxsize', 0) >= pool_size:
+                return
+
+            mount_adapter(
+                session, pool_size, getattr(adapter, 'timeout', None))
+
+        adapter.close()
+
+    def get_circuit_breaker(self, config):
+        """
+        Returns circuit breaker of Consul service with given configuration,
+        creating it if it does not exist.
+
+        :param config: dictionary holding consul configuration data
+        :type config: dictionary
+
+        :returns: circuit breaker
+        :rtype: CircuitBreaker
+        """
+        key = self._get_key(config)
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+
+            circuit_breaker = self._circuit_breakers.get(key)
+
+            if circuit_breaker is None:
+                circuit_breaker = self._circuit_breakers[key] = \
+                    CircuitBreaker()
+
+            return circuit_breaker
+
+    def _reset(self):
+        for connection in self._connections.values():
+            connection.http.session.close()
+
+        self._connections.clear()
+        self._circuit_breakers.clear()
+        self._pid = os.getpid()
+
+    def reset(self):
+        """
+        Closes all pooled connections and clears registry.
+        """
+        with self._lock:
+            self._reset()
+
+    def reset_after_fork(self):
+        """
+        Clears registry in child process after fork. Lock is replaced
+        instead of acquired, because other thread of parent process may
+        have held it at fork time, and inherited connections are dropped
+        without closing them, because locks of their pools may be held
+        the same way.
+        """
+        self._lock = threading.Lock()
+        self._connections = {}
+        self._circuit_breakers = {}
+        self._pid = os.getpid()
+
+
+connection_registry = ConnectionRegistry()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=connection_registry.reset_after_fork)
+
+
 class ConsulInterface(object):
-    def __init__(self, prepare_connection=False):
+    """
+    Declares maximum number of operations in single Consul transaction
+    and retry settings for easier override.
+    """
+    txn_max_operations = 64
+    max_retries = 2
+    retry_backoff = 0.1
+    retry_backoff_max = 2
+
+    def __init__(
+            self,
+            prepare_connection=False,
+            stats=None,
+            retries=None,
+            circuit_breaker=None):
         """
         Sets empty connection upon initialization.
         Constructs default consul configuration, that will be used in
@@ -17,14 +366,32 @@ class ConsulInterface(object):
 
         :param prepare_connection: Initialization creates connection or not
         :type prepare_connection: boolean
+        :param stats: stats collecting request metrics, default if None
+        :type stats: confgetti.stats.Stats/None
+        :param retries: number of retries of failed request, read from
+            `CONSUL_RETRIES` environment variable if None
+        :type retries: integer/None
+        :param circuit_breaker: circuit breaker of requests, shared by all
+            interfaces connected with same configuration if None
+        :type circuit_breaker: CircuitBreaker/None
         """
         self.connection = None
+        self.stats = default_stats if stats is None else stats
+        self.modify_indexes = {}
+        self.prefix_indexes = {}
+        self.retries = int(os.environ.get(
+            'CONSUL_RETRIES', self.max_retries)) if retries is None \
+            else retries
+        self.circuit_breaker = circuit_breaker
         self.default_consul_config = {
             'host': os.environ.get('CONSUL_HOST', 'consul'),
             'port': os.environ.get('CONSUL_PORT', 8500),
             'scheme': os.environ.get('CONSUL_SCHEME', 'http'),
             'token': os.environ.get('CONSUL_TOKEN'),
-            'dc': os.environ.get('CONSUL_DC')
+            'dc': os.environ.get('CONSUL_DC'),
+            'pool_size': int(os.environ.get('CONSUL_POOL_SIZE', 10)),
+            'timeout': float(os.environ['CONSUL_TIMEOUT'])
+            if os.environ.get('CONSUL_TIMEOUT') else None
         }
 
         if prepare_connection is True:
@@ -35,6 +402,8 @@ class ConsulInterface(object):
         Creates connection to Consul service.
         Uses default consul configuration constructed from environment
         variables if alternate configuration is not passed to method.
+        Connections are shared through process wide registry, so all
+        interfaces with same configuration use one connection pool.
 
         :param config: Initialization creates connection or not
         :type config: dictionary/None
@@ -45,10 +414,47 @@ class ConsulInterface(object):
         config = self.default_consul_config if config is None else config
 
         if self.connection is None:
-            self.connection = consul.Consul(**config)
+            self.connection = connection_registry.get_connection(config)
+
+        if self.circuit_breaker is None:
+            self.circuit_breaker = \
+                connection_registry.get_circuit_breaker(config)
 
         return self.connection
 
+    def resize_pool(self, pool_size):
+        """
+        Makes sure that HTTP session of current connection keeps at least
+        `pool_size` connections open, so it can be shared by that many
+        threads without opening new connection for every request.
+        Session is shared through process wide registry, so pool is only
+        grown, see `ConnectionRegistry.resize_pool`.
+
+        :param pool_size: number of connections kept open per host
+        :type pool_size: integer
+        """
+        if self.connection is None:
+            return
+
+        connection_registry.resize_pool(self.connection, pool_size)
+
+    def get_connection_digest(self):
+        """
+        Hashes settings which decide what values current connection reads,
+        so values read through different agents, datacenters or tokens
+        are never mixed up, e.g. in shared cache.
+
+        :returns: hex digest of host, port, scheme, datacenter and token
+        :rtype: string
+        """
+        self._check_connection()
+        http = self.connection.http
+        settings = json.dumps([
+            http.host, http.port, http.scheme,
+            self.connection.dc, self.connection.token])
+
+        return hashlib.sha256(settings.encode('utf-8')).hexdigest()[:16]
+
     def _check_connection(self):
         """
         In case when connection object is not defined on class instance,
@@ -57,6 +463,127 @@ class ConsulInterface(object):
         if self.connection is None:
             raise UndefinedConnectionError('Consul connection is not defined!')
 
+    def _get_key_path(self, key, path=None):
+        """
+        Constructs key path if `path` is provided.
+
+        :param key: key for desired value
+        :type key: string
+        :param path: path where key is stored on Consul service
+        :type path: string/None
+
+        :returns: full path of key on Consul service
+        :rtype: string
+        """
+        if path is None:
+            return key
+
+        return '{0}/{1}'.format(path, key)
+
+    def get_retry_delay(self, attempt):
+        """
+        :param attempt: number of retry, starting with 1
+        :type attempt: integer
+
+        :returns: seconds to wait before retry, random up to exponentially
+            growing limit
+        :rtype: float
+        """
+        return random.uniform(0, min(
+            self.retry_backoff_max, self.retry_backoff * 2 ** (attempt - 1)))
+
+    def _request(self, method, *args, **kwargs):
+        """
+        Runs request to Consul service and records its duration, number
+        of requests, errors and retries.
+        Request failing with connection error, timeout or Consul server
+        error is retried up to `retries` times with jittered exponential
+        backoff, and raised as `ConnectionError` once retries run out.
+        If circuit breaker is open, `CircuitOpenError` is raised without
+        sending request.
+
+        :param method: consul client method sending request
+        :type method: callable
+
+        :returns: result of method
+        :rtype: any
+        """
+        circuit_breaker = self.circuit_breaker
+        attempt = 0
+
+        while True:
+            if circuit_breaker is not None:
+                try:
+                    circuit_breaker.before_request()
+                except CircuitOpenError:
+                    self.stats.increment('consul.circuit_open')
+                    raise
+
+            self.stats.increment('consul.requests')
+
+            try:
+                with self.stats.time('consul.request'):
+                    result = method(*args, **kwargs)
+            except CLIENT_ERRORS:
+                if circuit_breaker is not None:
+                    circuit_breaker.record_success()
+
+                raise
+            except (ConnectionError, Timeout, ConsulException) as e:
+                self.stats.increment('consul.errors')
+
+                if circuit_breaker is not None:
+                    circuit_breaker.record_failure()
+
+                if attempt >= self.retries or (
+                        circuit_breaker is not None and
+                        not circuit_breaker.is_closed):
+                    if isinstance(e, ConnectionError):
+                        raise
+
+                    raise ConnectionError(
+                        e, request=getattr(e, 'request', None)) from e
+
+                attempt += 1
+                self.stats.increment('consul.retries')
+                time.sleep(self.get_retry_delay(attempt))
+
+                continue
+            except Exception:
+                if circuit_breaker is not None:
+                    circuit_breaker.record_success()
+
+                raise
+
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
+
+            return result
+
+    def _get(self, key_path, **kwargs):
+        """
+        Reads key or prefix from Consul's key value storage and records
+        request metrics and received value bytes.
+
+        :param key_path: full path of key or prefix on Consul service
+        :type key_path: string
+
+        :returns: Consul index and fetched data
+        :rtype: tuple
+        """
+        index, data = self._request(
+            self.connection.kv.get, key_path, **kwargs)
+
+        entries = data if isinstance(data, list) else [data]
+        size = sum(
+            len(entry.get('Value') or b'') for entry in entries
+            if isinstance(entry, dict))
+
+        if size:
+            self.stats.increment('consul.bytes', size)
+
+        return index, data
+
     def get_raw_value(self, key, path=None):
         """
         Gets value from Consul's key value storage.
@@ -76,16 +603,369 @@ class ConsulInterface(object):
         self._check_connection()
 
         value = None
-        key_path = key
+        key_path = self._get_key_path(key, path)
 
-        if path is not None:
-            key_path = '{0}/{1}'.format(
-                path, key
-            )
-
-        index, data = self.connection.kv.get(key_path)
+        index, data = self._get(key_path)
 
         if data is not None:
             value = data.get('Value')
+            self.modify_indexes[key_path] = data.get('ModifyIndex')
+        else:
+            self.modify_indexes.pop(key_path, None)
+
+        return value
+
+    def get_modify_index(self, key, path=None):
+        """
+        :param key: key for desired value
+        :type key: string
+        :param path: path where key is stored on Consul service
+        :type path: string/None
+
+        :returns: Consul `ModifyIndex` of key when its value was fetched
+            last time, None if it was not fetched
+        :rtype: integer/None
+        """
+        return self.modify_indexes.get(self._get_key_path(key, path))
+
+    def get_prefix_index(self, path):
+        """
+        :param path: path under which keys are stored on Consul service
+        :type path: string
+
+        :returns: Consul index of `path` prefix when its values were
+            fetched last time, None if they were not fetched
+        :rtype: string/None
+        """
+        return self.prefix_indexes.get(path.rstrip('/'))
+
+    def fetch_prefix_index(self, path):
+        """
+        Fetches current Consul index of `path` prefix by listing only
+        names of its keys, without their values.
+        Firstly, calls method for checking connection.
+
+        :param path: path under which keys are stored on Consul service
+        :type path: string
+
+        :returns: Consul index of prefix
+        :rtype: string
+        """
+        self._check_connection()
+
+        index, data = self._get(
+            '{0}/'.format(path.rstrip('/')), keys=True)
+
+        return index
+
+    def has_changed(self, path):
+        """
+        Checks whether anything under `path` prefix has changed since its
+        values were fetched last time, with one request which does not
+        transfer values.
+
+        :param path: path under which keys are stored on Consul service
+        :type path: string
+
+        :returns: has prefix changed or no, True if it was never fetched
+        :rtype: boolean
+        """
+        index = self.get_prefix_index(path)
+
+        return index is None or self.fetch_prefix_index(path) != index
+
+    def get_raw_values(self, path):
+        """
+        Gets all values stored under `path` prefix from Consul's key value
+        storage with a single recursive read.
+        Every returned entry is indexed by its key relative to `path`.
+        If used token is not permitted to do recursive reads, it returns
+        None so caller can fall back to reading keys one by one.
+
+        :param path: path under which keys are stored on Consul service
+        :type path: string
+
+        :returns: fetched values indexed by relative key or None
+        :rtype: dictionary/None
+        """
+        index, values = self.get_indexed_raw_values(path)
+
+        return values
+
+    def get_indexed_raw_values(self, path, index=None, wait=None):
+        """
+        Gets all values stored under `path` prefix together with Consul
+        index of the prefix.
+        Firstly, calls method for checking connection.
+        If `index` is passed, request is a blocking query which returns
+        when something under prefix changes or `wait` time passes.
+        Every returned entry is indexed by its key relative to `path`.
+        Index of prefix and `ModifyIndex` of every entry are kept, see
+        `get_prefix_index` and `get_modify_index`.
+        If used token is not permitted to do recursive reads, values are
+        returned as None.
+
+        :param path: path under which keys are stored on Consul service
+        :type path: string
+        :param index: last known Consul index of the prefix
+        :type index: string/None
+        :param wait: maximum blocking duration, e.g. '30s'
+        :type wait: string/None
+
+        :returns: Consul index and fetched values indexed by relative key
+        :rtype: tuple
+        """
+        self._check_connection()
+
+        values = {}
+        modify_indexes = {}
+        prefix = '{0}/'.format(path.rstrip('/'))
+
+        try:
+            index, data = self._get(
+                prefix, index=index, wait=wait, recurse=True)
+        except ACLPermissionDenied:
+            return index, None
+
+        for entry in data or []:
+            key = entry['Key'][len(prefix):]
+
+            if key:
+                values[key] = entry.get('Value')
+                modify_indexes[entry['Key']] = entry.get('ModifyIndex')
+
+        for key_path in list(self.modify_indexes):
+            if key_path.startswith(prefix) and key_path not in modify_indexes:
+                self.modify_indexes.pop(key_path, None)
+
+        self.modify_indexes.update(modify_indexes)
+        self.prefix_indexes[path.rstrip('/')] = index
+
+        return index, values
+
+    def get_batched_raw_values(self, key_paths):
+        """
+        Gets values of keys stored under arbitrary paths with Consul
+        transactions, reading up to `txn_max_operations` keys with one
+        request.
+        Firstly, calls method for checking connection.
+        Every key is read with `get-tree` operation, because `get`
+        operation fails whole transaction if key does not exist, so only
+        entries whose key matches exactly are returned.
+        If used token is not permitted to run transactions, or transaction
+        fails, it returns None so caller can fall back to reading keys one
+        by one.
+
+        :param key_paths: full paths of keys on Consul service
+        :type key_paths: list
+
+        :returns: fetched values indexed by key path, None for missing keys
+        :rtype: dictionary/None
+        """
+        self._check_connection()
+
+        values = dict.fromkeys(key_paths)
+        key_paths = list(values)
+
+        size = self.txn_max_operations
+
+        for start in range(0, len(key_paths), size):
+            payload = [
+                {'KV': {'Verb': 'get-tree', 'Key': key_path}}
+                for key_path in key_paths[start:start + size]
+            ]
+
+            try:
+                result = self._request(self.connection.txn.put, payload)
+            except (ACLPermissionDenied, ClientError):
+                return None
+
+            if not isinstance(result, dict) or result.get('Errors'):
+                return None
+
+            received = 0
+
+            for entry in result.get('Results') or []:
+                kv = entry.get('KV') or {}
+
+                if kv.get('Key') in values and kv.get('Value') is not None:
+                    value = base64.b64decode(kv['Value'])
+                    values[kv['Key']] = value
+                    self.modify_indexes[kv['Key']] = kv.get('ModifyIndex')
+                    received += len(value)
+
+            if received:
+                self.stats.increment('consul.bytes', received)
+
+        return values
+
+
+class CachingConsulInterface(ConsulInterface):
+    """
+    Consul interface which keeps fetched values in bounded LRU cache for
+    limited time. Missing keys are cached too, so repeated lookups of not
+    existing keys do not hit Consul service.
+    Declares default cache settings for easier override.
+    """
+    cache_ttl = 60
+    cache_negative_ttl = 60
+    cache_max_size = 1024
+
+    def __init__(
+            self,
+            prepare_connection=False,
+            ttl=None,
+            negative_ttl=None,
+            max_size=None,
+            stats=None,
+            retries=None,
+            circuit_breaker=None):
+        """
+        Prepares empty cache and its counters.
+
+        :param prepare_connection: Initialization creates connection or not
+        :type prepare_connection: boolean
+        :param ttl: seconds for which fetched value is cached
+        :type ttl: integer/float/None
+        :param negative_ttl: seconds for which missing key is cached
+        :type negative_ttl: integer/float/None
+        :param max_size: maximum number of cached keys
+        :type max_size: integer/None
+        :param stats: stats collecting request metrics, default if None
+        :type stats: confgetti.stats.Stats/None
+        :param retries: number of retries of failed request
+        :type retries: integer/None
+        :param circuit_breaker: circuit breaker of requests
+        :type circuit_breaker: CircuitBreaker/None
+        """
+        self.ttl = self.cache_ttl if ttl is None else ttl
+        self.negative_ttl = self.cache_negative_ttl \
+            if negative_ttl is None else negative_ttl
+        self.max_size = self.cache_max_size if max_size is None else max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        super(CachingConsulInterface, self).__init__(
+            prepare_connection, stats, retries, circuit_breaker)
+
+    def _store(self, key_path, value, now):
+        """
+        Stores value in cache and evicts least recently used keys if cache
+        is full.
+
+        :param key_path: full path of key on Consul service
+        :type key_path: string
+        :param value: fetched value
+        :type value: bytes/None
+        :param now: monotonic time of fetch
+        :type now: float
+        """
+        ttl = self.negative_ttl if value is None else self.ttl
+
+        with self._cache_lock:
+            self._cache[key_path] = (now + ttl, value)
+            self._cache.move_to_end(key_path)
+
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def get_raw_value(self, key, path=None):
+        """
+        Gets value from cache if it is cached and not expired, otherwise
+        fetches it from Consul's key value storage and caches it.
+
+        :param key: key for desired value
+        :type key: string
+        :param path: path where key is stored on Consul service
+        :type path: string/None
+
+        :returns: fetched value from cache or Consul service.
+        :rtype: bytes/None
+        """
+        key_path = self._get_key_path(key, path)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            cached = self._cache.get(key_path)
+
+            if cached is not None and cached[0] > now:
+                self._cache.move_to_end(key_path)
+                self.hits += 1
+                self.stats.increment('consul.cache.hits')
+                return cached[1]
+
+            self.misses += 1
+            self.stats.increment('consul.cache.misses')
+
+        value = super(CachingConsulInterface, self).get_raw_value(key, path)
+        self._store(key_path, value, now)
 
         return value
+
+    def get_raw_values(self, path):
+        """
+        Gets all values stored under `path` prefix with one recursive read
+        and caches every fetched value.
+
+        :param path: path under which keys are stored on Consul service
+        :type path: string
+
+        :returns: fetched values indexed by relative key or None
+        :rtype: dictionary/None
+        """
+        now = time.monotonic()
+        values = super(CachingConsulInterface, self).get_raw_values(path)
+
+        for key, value in (values or {}).items():
+            self._store(self._get_key_path(key, path.rstrip('/')), value, now)
+
+        return values
+
+    def invalidate(self, key, path=None):
+        """
+        Removes single key from cache.
+
+        :param key: key for desired value
+        :type key: string
+        :param path: path where key is stored on Consul service
+        :type path: string/None
+        """
+        with self._cache_lock:
+            self._cache.pop(self._get_key_path(key, path), None)
+
+    def invalidate_prefix(self, prefix=None):
+        """
+        Removes all keys stored under `prefix` from cache.
+        If prefix is not passed, whole cache is cleared.
+
+        :param prefix: path under which keys are stored on Consul service
+        :type prefix: string/None
+        """
+        with self._cache_lock:
+            if prefix is None:
+                self._cache.clear()
+                return
+
+            prefix = prefix.rstrip('/')
+            nested_prefix = '{0}/'.format(prefix)
+
+            for key_path in list(self._cache):
+                if key_path == prefix or key_path.startswith(nested_prefix):
+                    del self._cache[key_path]
+
+    def cache_info(self):
+        """
+        :returns: cache hits, misses, evictions and current size
+        :rtype: dictionary
+        """
+        with self._cache_lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._cache)
+            }
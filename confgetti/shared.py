@@ -0,0 +1,289 @@
+import os
+import json
+import mmap
+import time
+import struct
+import threading
+
+from contextlib import contextmanager
+from urllib.parse import quote
+
+from confgetti.snapshot import (
+    check_private_directory,
+    get_default_directory,
+    make_private_directory
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class SharedCache(object):
+    """
+    Declares shared file layout for easier override.
+    Shared file starts with magic bytes and sequence number, followed by
+    version, write time and length of JSON payload, and the payload itself.
+    Sequence number is odd while payload is being written, so readers
+    retry until they read same even sequence number before and after
+    reading payload.
+    """
+    magic = b'CGM1'
+    sequence_format = struct.Struct('>Q')
+    header_format = struct.Struct('>QdI')
+    extension = '.shm'
+    read_retries = 100
+
+    def __init__(self, directory=None, ttl=60):
+        """
+        Sets directory in which shared files are stored. If directory is
+        not passed, it is read from `CONFGETTI_SHARED_DIR` environment
+        variable, or `confgetti-<uid>` directory in `/dev/shm` or in
+        system temp directory is used. Directory is created accessible
+        only by current user, and shared files are not read from nor
+        written to directory which is not owned by current user or is
+        writable by others.
+
+        :param directory: path of directory holding shared files
+        :type directory: string/None
+        :param ttl: seconds for which shared values are used without
+            loading them again
+        :type ttl: integer/float
+        """
+        if directory is None:
+            directory = os.environ.get('CONFGETTI_SHARED_DIR')
+
+        if directory is None:
+            directory = get_default_directory('confgetti')
+
+            if os.path.isdir('/dev/shm'):
+                directory = os.path.join(
+                    '/dev/shm', os.path.basename(directory))
+
+        self.directory = directory
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @property
+    def sequence_offset(self):
+        return len(self.magic)
+
+    @property
+    def header_offset(self):
+        return self.sequence_offset + self.sequence_format.size
+
+    @property
+    def payload_offset(self):
+        return self.header_offset + self.header_format.size
+
+    def get_path(self, namespace, scope=None):
+        """
+        :param namespace: namespace of shared values
+        :type namespace: string
+        :param scope: identifier separating values of same namespace, e.g.
+            hash of connection settings values were read with
+        :type scope: string/None
+
+        :returns: path of shared file for namespace
+        :rtype: string
+        """
+        name = quote(namespace, safe='')
+
+        if scope is not None:
+            name = '{0}.{1}'.format(name, quote(scope, safe=''))
+
+        return os.path.join(self.directory, name + self.extension)
+
+    def _read_sequence(self, buffer):
+        return self.sequence_format.unpack_from(
+            buffer, self.sequence_offset)[0]
+
+    def read(self, namespace, scope=None):
+        """
+        Reads values of namespace from shared file.
+
+        :param namespace: namespace of shared values
+        :type namespace: string
+        :param scope: identifier separating values of same namespace
+        :type scope: string/None
+
+        :returns: version, write time and values, or None if there are no
+            shared values or directory is not private to current user
+        :rtype: tuple/None
+        """
+        try:
+            check_private_directory(self.directory)
+        except OSError:
+            return None
+
+        for _ in range(self.read_retries):
+            try:
+                with open(self.get_path(namespace, scope), 'rb') as f:
+                    if os.fstat(f.fileno()).st_size < self.payload_offset:
+                        return None
+
+                    with mmap.mmap(
+                            f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                        if buffer[:len(self.magic)] != self.magic:
+                            return None
+
+                        sequence = self._read_sequence(buffer)
+
+                        if sequence % 2:
+                            time.sleep(0)
+                            continue
+
+                        version, written, length = \
+                            self.header_format.unpack_from(
+                                buffer, self.header_offset)
+                        end = self.payload_offset + length
+                        payload = buffer[self.payload_offset:end]
+
+                        if self._read_sequence(buffer) != sequence \
+                                or len(payload) != length:
+                            continue
+            except OSError:
+                return None
+
+            if version == 0:
+                return None
+
+            return version, written, json.loads(payload.decode('utf-8'))
+
+        return None
+
+    def get_version(self, namespace, scope=None):
+        """
+        :param namespace: namespace of shared values
+        :type namespace: string
+        :param scope: identifier separating values of same namespace
+        :type scope: string/None
+
+        :returns: version of shared values, incremented on every write, or
+            None if there are no shared values
+        :rtype: integer/None
+        """
+        shared = self.read(namespace, scope)
+
+        return None if shared is None else shared[0]
+
+    @contextmanager
+    def _exclusive(self, namespace, scope=None):
+        """
+        Holds lock of namespace shared between threads and processes.
+        Raises `OSError` if directory can't be created or is not private.
+        """
+        make_private_directory(self.directory)
+        path = self.get_path(namespace, scope) + '.lock'
+
+        with self._lock, open(path, 'wb') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _write(self, namespace, values, scope=None):
+        payload = json.dumps(
+            values, separators=(',', ':'), sort_keys=True).encode('utf-8')
+        size = self.payload_offset + len(payload)
+        fd = os.open(
+            self.get_path(namespace, scope), os.O_RDWR | os.O_CREAT, 0o600)
+
+        with os.fdopen(fd, 'r+b') as f:
+            # file only grows, so readers never map beyond its end
+            if os.fstat(fd).st_size < size:
+                f.truncate(size)
+
+            with mmap.mmap(fd, 0) as buffer:
+                sequence = version = 0
+
+                if buffer[:len(self.magic)] == self.magic:
+                    sequence = self._read_sequence(buffer)
+                    version = self.header_format.unpack_from(
+                        buffer, self.header_offset)[0]
+                else:
+                    buffer[:len(self.magic)] = self.magic
+
+                sequence += 1 if sequence % 2 == 0 else 2
+                self.sequence_format.pack_into(
+                    buffer, self.sequence_offset, sequence)
+
+                buffer[self.payload_offset:size] = payload
+                self.header_format.pack_into(
+                    buffer, self.header_offset,
+                    version + 1, time.time(), len(payload))
+
+                self.sequence_format.pack_into(
+                    buffer, self.sequence_offset, sequence + 1)
+
+        return version + 1
+
+    def write(self, namespace, values, scope=None):
+        """
+        Writes values of namespace to shared file and increments their
+        version.
+
+        :param namespace: namespace of shared values
+        :type namespace: string
+        :param values: JSON serializable values
+        :type values: dictionary
+        :param scope: identifier separating values of same namespace
+        :type scope: string/None
+
+        :returns: new version of shared values
+        :rtype: integer
+        """
+        with self._exclusive(namespace, scope):
+            return self._write(namespace, values, scope)
+
+    def is_fresh(self, shared):
+        """
+        :param shared: result of `read`
+        :type shared: tuple/None
+
+        :returns: are shared values younger than ttl or no
+        :rtype: boolean
+        """
+        return shared is not None and time.time() - shared[1] < self.ttl
+
+    def get_or_load(self, namespace, load, scope=None):
+        """
+        Gets shared values of namespace if they are fresh, otherwise loads
+        them with `load` and shares them. Only one process loads values at
+        a time, others wait for it and then read its values.
+        Values loaded as None are returned but not shared.
+        Raises `OSError` if shared file can't be locked or written.
+
+        :param namespace: namespace of shared values
+        :type namespace: string
+        :param load: function returning JSON serializable values or None
+        :type load: callable
+        :param scope: identifier separating values of same namespace, e.g.
+            hash of connection settings values are loaded with
+        :type scope: string/None
+
+        :returns: values
+        :rtype: dictionary/None
+        """
+        shared = self.read(namespace, scope)
+
+        if self.is_fresh(shared):
+            return shared[2]
+
+        with self._exclusive(namespace, scope):
+            shared = self.read(namespace, scope)
+
+            if self.is_fresh(shared):
+                return shared[2]
+
+            values = load()
+
+            if values is not None:
+                self._write(namespace, values, scope)
+
+            return values
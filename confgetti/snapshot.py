@@ -0,0 +1,204 @@
+import os
+import json
+import zlib
+import stat
+import struct
+import logging
+import tempfile
+import threading
+
+from urllib.parse import quote
+
+from confgetti.logger import rate_limit_filter
+
+
+log = logging.getLogger(__name__)
+log.addFilter(rate_limit_filter)
+
+
+def get_default_directory(name):
+    """
+    :param name: name of directory
+    :type name: string
+
+    :returns: path of directory in system temp directory, suffixed with
+        id of current user, so users never share it
+    :rtype: string
+    """
+    if hasattr(os, 'getuid'):
+        name = '{0}-{1}'.format(name, os.getuid())
+
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+def check_private_directory(directory):
+    """
+    Raises `OSError` if `directory` is not a directory owned by current
+    user and writable only by it, so other local users could not plant
+    files in it.
+
+    :param directory: path of directory
+    :type directory: string
+    """
+    info = os.lstat(directory)
+
+    if not stat.S_ISDIR(info.st_mode):
+        raise NotADirectoryError(
+            '"{}" is not a directory'.format(directory))
+
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+        raise PermissionError(
+            'Directory "{}" is not owned by current user'.format(directory))
+
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(
+            'Directory "{}" is writable by other users'.format(directory))
+
+
+def make_private_directory(directory):
+    """
+    Creates directory accessible only by current user if it does not
+    exist, and checks it with `check_private_directory`.
+
+    :param directory: path of directory
+    :type directory: string
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    check_private_directory(directory)
+
+
+class SnapshotStore(object):
+    """
+    Declares snapshot file format for easier override.
+    Snapshot file starts with magic bytes, followed by CRC32 checksum
+    of zlib compressed JSON payload and the payload itself.
+    """
+    magic = b'CGS1'
+    extension = '.snapshot'
+
+    def __init__(self, directory=None):
+        """
+        Sets directory in which snapshots are stored. If directory is not
+        passed, it is read from `CONFGETTI_SNAPSHOT_DIR` environment
+        variable, or `confgetti-<uid>` directory in system temp directory
+        is used. Directory is created accessible only by current user, and
+        snapshots are neither saved to nor loaded from directory which is
+        not owned by current user or is writable by others.
+
+        :param directory: path of directory holding snapshots
+        :type directory: string/None
+        """
+        if directory is None:
+            directory = os.environ.get(
+                'CONFGETTI_SNAPSHOT_DIR', get_default_directory('confgetti'))
+
+        self.directory = directory
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def get_path(self, namespace):
+        """
+        :param namespace: namespace of stored values
+        :type namespace: string
+
+        :returns: path of snapshot file for namespace
+        :rtype: string
+        """
+        return os.path.join(
+            self.directory, quote(namespace, safe='') + self.extension)
+
+    def save(self, namespace, values):
+        """
+        Atomically writes values to snapshot file of namespace, by writing
+        to temporary file which then replaces existing snapshot.
+        Snapshots are best effort, so if they can't be written, warning is
+        logged instead of raising error.
+
+        :param namespace: namespace of stored values
+        :type namespace: string
+        :param values: JSON serializable values
+        :type values: dictionary
+        """
+        with self._lock:
+            if self._snapshots.get(namespace) == values:
+                return
+
+            payload = zlib.compress(json.dumps(
+                values, separators=(',', ':'), sort_keys=True
+            ).encode('utf-8'))
+            checksum = struct.pack('>I', zlib.crc32(payload))
+
+            temp_path = None
+
+            try:
+                make_private_directory(self.directory)
+                fd, temp_path = tempfile.mkstemp(dir=self.directory)
+
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self.magic + checksum + payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                os.replace(temp_path, self.get_path(namespace))
+            except OSError:
+                log.warning('Unable to save snapshot of "%s"', namespace,
+                            exc_info=True)
+
+                if temp_path is not None:
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+
+                return
+
+            self._snapshots[namespace] = dict(values)
+
+    def load(self, namespace):
+        """
+        Loads values from snapshot file of namespace. Loaded snapshots are
+        kept in memory, so file is read only once.
+        If file does not exist, its checksum does not match, or snapshot
+        directory is not private to current user, it returns None.
+
+        :param namespace: namespace of stored values
+        :type namespace: string
+
+        :returns: stored values or None
+        :rtype: dictionary/None
+        """
+        with self._lock:
+            if namespace in self._snapshots:
+                return self._snapshots[namespace]
+
+            path = self.get_path(namespace)
+
+            try:
+                check_private_directory(self.directory)
+            except FileNotFoundError:
+                return None
+            except OSError:
+                log.warning('Ignoring snapshots in "%s"', self.directory,
+                            exc_info=True)
+                return None
+
+            try:
+                with open(path, 'rb') as f:
+                    content = f.read()
+            except OSError:
+                return None
+
+            header_size = len(self.magic) + 4
+            magic = content[:len(self.magic)]
+            checksum = content[len(self.magic):header_size]
+            payload = content[header_size:]
+
+            if magic != self.magic or \
+                    checksum != struct.pack('>I', zlib.crc32(payload)):
+                log.warning('Snapshot "%s" is corrupted', path)
+                return None
+
+            values = json.loads(zlib.decompress(payload).decode('utf-8'))
+            self._snapshots[namespace] = values
+
+            return values
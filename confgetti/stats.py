@@ -0,0 +1,196 @@
+import logging
+import threading
+
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+from confgetti.logger import rate_limit_filter
+
+
+log = logging.getLogger(__name__)
+log.addFilter(rate_limit_filter)
+
+
+class Histogram(object):
+    """
+    Declares default bucket bounds, in seconds, for easier override.
+    """
+    default_buckets = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1,
+        2.5, 5, 10)
+
+    def __init__(self, buckets=None):
+        """
+        Prepares empty histogram of observed durations.
+
+        :param buckets: ascending upper bounds of buckets
+        :type buckets: list/tuple/None
+        """
+        self.buckets = tuple(
+            self.default_buckets if buckets is None else buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        """
+        :param value: observed duration
+        :type value: float
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def as_dict(self):
+        """
+        :returns: count, sum, max and cumulative counts by bucket upper
+            bound, with last bucket bound being infinity
+        :rtype: dictionary
+        """
+        buckets = {}
+        total = 0
+
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            buckets[bound] = total
+
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'max': self.max,
+            'buckets': buckets
+        }
+
+
+class Stats(object):
+    """
+    Collects durations, counters and conversion failures of config
+    loading. Every recorded metric is also passed to registered hooks,
+    which can forward it to monitoring systems.
+    Declares classes for easier override if custom logic is needed.
+    """
+    histogram_class = Histogram
+
+    def __init__(self):
+        self.hooks = []
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Drops all collected metrics, registered hooks are kept.
+        """
+        with self._lock:
+            self.timings = {}
+            self.counters = Counter()
+            self.conversion_failures = Counter()
+
+    def add_hook(self, hook):
+        """
+        Registers hook which is called for every recorded metric with
+        metric type, which is 'timing', 'counter' or 'conversion_failure',
+        metric name and value.
+
+        :param hook: function accepting type, name and value of metric
+        :type hook: callable
+        """
+        self.hooks.append(hook)
+
+    def _call_hooks(self, kind, name, value):
+        for hook in self.hooks:
+            try:
+                hook(kind, name, value)
+            except Exception:
+                log.error('Stats hook failed', exc_info=True)
+
+    def timing(self, name, seconds):
+        """
+        Records duration to histogram of `name`.
+
+        :param name: name of measured operation, e.g. 'source.consul'
+        :type name: string
+        :param seconds: duration of operation
+        :type seconds: float
+        """
+        with self._lock:
+            histogram = self.timings.get(name)
+
+            if histogram is None:
+                histogram = self.timings[name] = self.histogram_class()
+
+            histogram.observe(seconds)
+
+        self._call_hooks('timing', name, seconds)
+
+    @contextmanager
+    def time(self, name):
+        """
+        Records duration of `with` block to histogram of `name`, even if
+        block raises.
+
+        :param name: name of measured operation
+        :type name: string
+        """
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.timing(name, perf_counter() - start)
+
+    def increment(self, name, value=1):
+        """
+        :param name: name of counter, e.g. 'consul.requests'
+        :type name: string
+        :param value: value added to counter
+        :type value: integer
+        """
+        with self._lock:
+            self.counters[name] += value
+
+        self._call_hooks('counter', name, value)
+
+    def conversion_failed(self, key):
+        """
+        :param key: key whose value could not be converted
+        :type key: string
+        """
+        with self._lock:
+            self.conversion_failures[key] += 1
+
+        self._call_hooks('conversion_failure', key, 1)
+
+    @property
+    def cache_hit_ratio(self):
+        """
+        :returns: ratio of Consul cache hits to all cache lookups, None if
+            cache was not used
+        :rtype: float/None
+        """
+        hits = self.counters['consul.cache.hits']
+        lookups = hits + self.counters['consul.cache.misses']
+
+        return hits / lookups if lookups else None
+
+    def as_dict(self):
+        """
+        :returns: all collected metrics
+        :rtype: dictionary
+        """
+        with self._lock:
+            return {
+                'timings': {
+                    name: histogram.as_dict()
+                    for name, histogram in self.timings.items()
+                },
+                'counters': dict(self.counters),
+                'conversion_failures': dict(self.conversion_failures),
+                'cache_hit_ratio': self.cache_hit_ratio
+            }
+
+
+default_stats = Stats()
@@ -0,0 +1,152 @@
+import threading
+
+from voluptuous import Schema, Marker, Exclusive, Inclusive, Remove
+
+
+def is_same_value(value, other):
+    """
+    Compares values together with their types, so e.g. `1` and `True`
+    are different values.
+
+    :param value: compared value
+    :type value: any
+    :param other: compared value
+    :type other: any
+
+    :returns: are values same or no
+    :rtype: boolean
+    """
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return value.keys() == other.keys() and all(
+            is_same_value(item, other[key]) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return len(value) == len(other) and all(
+            is_same_value(item, other_item)
+            for item, other_item in zip(value, other))
+
+    return value == other
+
+
+class CachedSchema(Schema):
+    """
+    Schema remembering raw and validated values of last validated config,
+    so on next validation only values of keys whose raw value changed are
+    validated again, each with schema of its own key.
+    Whole config is validated when set of keys changes, or when schema is
+    not dictionary of plain keys, e.g. when it holds `Exclusive` or
+    `Inclusive` keys or is wrapped in validators checking several keys
+    together.
+    """
+    cross_key_markers = (Exclusive, Inclusive, Remove)
+
+    def __init__(self, schema, required=False, extra=0):
+        super().__init__(schema, required, extra)
+        self._key_schemas = None
+        self._raw = None
+        self._validated = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_schema(cls, schema):
+        """
+        :param schema: schema to cache validation of
+        :type schema: voluptuous.Schema
+
+        :returns: cached schema with same rules as `schema`
+        :rtype: CachedSchema
+        """
+        return cls(schema.schema, required=schema.required, extra=schema.extra)
+
+    @property
+    def is_incremental(self):
+        """
+        :returns: can keys be validated one by one or no
+        :rtype: boolean
+        """
+        return self.get_key_schemas() is not None
+
+    def get_key_schemas(self):
+        """
+        :returns: schemas of single keys by key, None if keys can't be
+            validated one by one
+        :rtype: dictionary/None
+        """
+        if self._key_schemas is not None or not isinstance(self.schema, dict):
+            return self._key_schemas
+
+        key_schemas = {}
+
+        for key, validator in self.schema.items():
+            if isinstance(key, self.cross_key_markers):
+                return None
+
+            name = key.schema if isinstance(key, Marker) else key
+
+            if not isinstance(name, str):
+                return None
+
+            key_schemas[name] = Schema(
+                {key: validator}, required=self.required, extra=self.extra)
+
+        self._key_schemas = key_schemas
+
+        return key_schemas
+
+    def clear(self):
+        """
+        Drops remembered values, so next config is validated as a whole.
+        """
+        with self._lock:
+            self._raw = None
+            self._validated = None
+
+    def __call__(self, data):
+        """
+        Validates config, reusing validated values of keys whose raw value
+        did not change since last validation.
+
+        :param data: config to validate
+        :type data: any
+
+        :returns: validated config
+        :rtype: any
+        """
+        key_schemas = self.get_key_schemas()
+
+        if key_schemas is None or not isinstance(data, dict):
+            return super().__call__(data)
+
+        with self._lock:
+            raw, validated = self._raw, self._validated
+
+        if raw is None or raw.keys() != data.keys():
+            return self._remember(data, super().__call__(data))
+
+        changed = [
+            key for key, value in data.items()
+            if not is_same_value(value, raw[key])
+        ]
+
+        if not changed:
+            return dict(validated)
+
+        if any(key not in key_schemas for key in changed):
+            return self._remember(data, super().__call__(data))
+
+        validated = dict(validated)
+
+        for key in changed:
+            validated.update(key_schemas[key]({key: data[key]}))
+
+        return self._remember(data, validated)
+
+    def _remember(self, data, validated):
+        with self._lock:
+            self._raw = dict(data)
+            self._validated = validated
+
+        return dict(validated)
@@ -0,0 +1,255 @@
+import logging
+import threading
+
+from requests.exceptions import ConnectionError
+from voluptuous import Schema
+
+from confgetti.base import Confgetti
+from confgetti.load import load_config
+from confgetti.diff import get_config_applier
+from confgetti.logger import rate_limit_filter
+from confgetti.validation import CachedSchema
+from confgetti.exceptions import UndefinedConnectionError
+
+
+log = logging.getLogger(__name__)
+log.addFilter(rate_limit_filter)
+
+
+class ConfigWatcher(object):
+    """
+    Declares classes for easier override if custom logic is needed.
+    """
+    confgetti_class = Confgetti
+
+    def __init__(
+            self,
+            config_module_name,
+            env_var,
+            schema=None,
+            keys=None,
+            uppercase=False,
+            consul_config=None,
+            wait='30s',
+            retry_interval=5,
+            environ=None):
+        """
+        Prepares watcher of configuration stored under `env_var` namespace
+        on Consul service. Watching is done with Consul blocking queries in
+        background thread, which is started with `start` method.
+        Plain `voluptuous.Schema` is turned into `CachedSchema`, so reloads
+        validate only values which changed.
+
+        :param config_module_name: name of the python module to set config to.
+        :type config_module_name: string
+        :param env_var: name of the env var containing path to config file.
+        :type env_var: string
+        :param schema: schema to use for config validation.
+        :type schema: voluptuous.Schema
+        :param keys: Set of keys for variables lookup.
+        :type keys: dictionary/list
+        :param uppercase: should keys be returned as uppercase or no.
+        :type uppercase: boolean
+        :param consul_config: dictionary holding consul configuration data
+        :type consul_config: dictionary/None
+        :param wait: maximum duration of single blocking query, e.g. '30s'
+        :type wait: string
+        :param retry_interval: seconds to wait before retry after failure
+        :type retry_interval: integer/float
+        :param environ: environment variables, `os.environ` by default
+        :type environ: mapping/None
+        """
+        if keys is None and isinstance(schema, Schema):
+            keys = list(schema.schema.keys())
+
+        if type(schema) is Schema:
+            schema = CachedSchema.from_schema(schema)
+
+        self.config_module_name = config_module_name
+        self.env_var = env_var
+        self.schema = schema
+        self.keys = keys
+        self.uppercase = uppercase
+        self.wait = wait
+        self.retry_interval = retry_interval
+        self.environ = environ
+        self.index = None
+        self.callbacks = []
+        self.confgetti = self.confgetti_class(consul_config)
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def add_callback(self, callback):
+        """
+        Registers callback which is called with dictionary of changed
+        values every time changes are applied to config module.
+
+        :param callback: function accepting dictionary of changed values
+        :type callback: callable
+        """
+        self.callbacks.append(callback)
+
+    def reload(self, consul_values):
+        """
+        Resolves keys from raw Consul values, merges them with json file
+        and environment config and validates result.
+        Only values which differ from ones currently set on config module
+        are applied, with a single update of module namespace, so readers
+        never see partially applied change, and subscribers of changed
+        keys are called, see `confgetti.diff.subscribe`.
+        If validation fails, error is logged and config module is left
+        with previous values.
+
+        :param consul_values: raw values fetched from watched namespace
+        :type consul_values: dictionary
+
+        :returns: applied changed values
+        :rtype: dictionary
+        """
+        config_server_values = self.confgetti.get_variables(
+            path=self.env_var,
+            keys=self.keys,
+            use_env=False,
+            consul_values=consul_values)
+
+        try:
+            config = load_config(
+                self.env_var,
+                self.schema,
+                self.keys,
+                self.uppercase,
+                config_server_values,
+                environ=self.environ)
+        except Exception:
+            log.error('Config reload failed, keeping previous config',
+                      exc_info=True)
+            return {}
+
+        changed = get_config_applier(
+            self.config_module_name).apply(config).updated
+
+        if changed:
+            for callback in self.callbacks:
+                try:
+                    callback(changed)
+                except Exception:
+                    log.error('Config change callback failed', exc_info=True)
+
+        return changed
+
+    def poll(self):
+        """
+        Runs single blocking query for watched namespace and reloads config
+        if Consul index of namespace has changed. If reading namespace is
+        not permitted, it logs warning and waits `retry_interval` seconds.
+
+        :returns: applied changed values
+        :rtype: dictionary
+        """
+        index, consul_values = self.confgetti.consul.get_indexed_raw_values(
+            self.env_var, index=self.index, wait=self.wait)
+
+        # denied read returns index it was given without blocking, so
+        # watcher waits before it asks again
+        if consul_values is None:
+            log.warning('Not permitted to read "%s" prefix, retrying config '
+                        'watch in %s seconds', self.env_var,
+                        self.retry_interval)
+            self.index = index
+            self._stop_event.wait(self.retry_interval)
+            return {}
+
+        if index == self.index:
+            return {}
+
+        # index going backwards means Consul state was reset
+        if self.index is not None and index is not None \
+                and int(index) < int(self.index):
+            self.index = None
+            return {}
+
+        self.index = index
+
+        return self.reload(consul_values)
+
+    def run(self):
+        """
+        Polls Consul until watcher is stopped.
+        If Consul is not reachable, it logs warning and retries after
+        `retry_interval` seconds. Any other error, e.g. Consul server error
+        during leader election, is logged and retried the same way, so
+        watching never stops before watcher is stopped.
+        """
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except (ConnectionError, UndefinedConnectionError):
+                log.warning('Not connected to consul, retrying config '
+                            'watch in %s seconds', self.retry_interval)
+                self._stop_event.wait(self.retry_interval)
+            except Exception:
+                log.error('Config watch failed, retrying in %s seconds',
+                          self.retry_interval, exc_info=True)
+                self._stop_event.wait(self.retry_interval)
+
+    def start(self):
+        """
+        Starts watching in background daemon thread.
+
+        :returns: watcher instance
+        :rtype: ConfigWatcher
+        """
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self.run,
+            name='confgetti-watch-{}'.format(self.env_var),
+            daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self, timeout=None):
+        """
+        Stops watching. Thread finishes after currently running blocking
+        query returns.
+
+        :param timeout: seconds to wait for thread to finish
+        :type timeout: integer/float/None
+        """
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def watch_config(
+        config_module_name,
+        env_var,
+        schema=None,
+        keys=None,
+        uppercase=False,
+        **kwargs):
+    """
+    Shorthand function that starts watcher hot reloading config module
+    every time configuration under `env_var` namespace changes on Consul.
+
+    :param config_module_name: name of the python module to set config to.
+    :type config_module_name: string
+    :param env_var: name of the env var containing path to config file.
+    :type env_var: string
+    :param schema: schema to use for config validation.
+    :type schema: voluptuous.Schema
+    :param keys: Set of keys for variables lookup.
+    :type keys: dictionary/list
+    :param uppercase: should keys be returned as uppercase or no.
+    :type uppercase: boolean
+
+    :returns: started watcher
+    :rtype: ConfigWatcher
+    """
+    watcher = ConfigWatcher(
+        config_module_name, env_var, schema, keys, uppercase, **kwargs)
+
+    return watcher.start()
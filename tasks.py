@@ -5,3 +5,16 @@ from invoke import task
 def bumpversion(c, version):
     c.run(f"bumpversion {version}")
     c.run("git push origin --tags")
+
+
+@task
+def bench(c, keys=100, latency=1.0, repeat=5):
+    c.run(
+        "python -m benchmarks.bench_resolution "
+        f"--keys {keys} --latency {latency} --repeat {repeat}"
+    )
+
+
+@task
+def bench_import(c, repeat=20):
+    c.run(f"python -m benchmarks.bench_import --repeat {repeat}")
@@ -0,0 +1,8 @@
+import pytest
+
+from confgetti.logger import rate_limit_filter
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit_filter():
+    rate_limit_filter.reset()
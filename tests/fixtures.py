@@ -1,3 +1,4 @@
+import json
 import base64
 import responses
 
@@ -60,6 +61,50 @@ CONSUL_DUMMY_RESPONSES_NAMESPACED = [
     }
 ]
 
+CONSUL_DUMMY_RESPONSES_NESTED = [
+    {
+        "LockIndex": 0,
+        "Key": "MYAPP/debug",
+        "Flags": 0,
+        "Value": get_encoded_value('true'),
+        "CreateIndex": 924,
+        "ModifyIndex": 924
+    },
+    {
+        "LockIndex": 0,
+        "Key": "MYAPP/cache/",
+        "Flags": 0,
+        "Value": None,
+        "CreateIndex": 924,
+        "ModifyIndex": 924
+    },
+    {
+        "LockIndex": 0,
+        "Key": "MYAPP/db/host",
+        "Flags": 0,
+        "Value": get_encoded_value('localhost'),
+        "CreateIndex": 924,
+        "ModifyIndex": 924
+    },
+    {
+        "LockIndex": 0,
+        "Key": "MYAPP/db/port",
+        "Flags": 0,
+        "Value": get_encoded_value('5432'),
+        "CreateIndex": 924,
+        "ModifyIndex": 924
+    },
+    {
+        "LockIndex": 0,
+        "Key": "MYAPP/db/replica/host",
+        "Flags": 0,
+        "Value": get_encoded_value('replica'),
+        "CreateIndex": 924,
+        "ModifyIndex": 924
+    }
+]
+
+
 def make_namespaced_responses():
     responses.add(
         responses.GET,
@@ -89,3 +134,62 @@ def make_namespaced_responses():
         headers={'X-Consul-Index': '924'},
         status=200
     )
+
+
+def make_namespaced_prefix_response(host='foobar'):
+    responses.add(
+        responses.GET,
+        'http://{}:8500/v1/kv/MYAPP/?recurse=1'.format(host),
+        json=CONSUL_DUMMY_RESPONSES_NAMESPACED,
+        headers={'X-Consul-Index': '924'},
+        status=200
+    )
+
+
+def make_nested_prefix_response():
+    responses.add(
+        responses.GET,
+        'http://foobar:8500/v1/kv/MYAPP/?recurse=1',
+        json=CONSUL_DUMMY_RESPONSES_NESTED,
+        headers={'X-Consul-Index': '924'},
+        status=200
+    )
+
+
+def make_txn_response(host='foobar', entries=CONSUL_DUMMY_RESPONSES_NAMESPACED):
+    def callback(request):
+        results = []
+
+        for operation in json.loads(request.body):
+            results.extend(
+                {'KV': entry} for entry in entries
+                if entry['Key'].startswith(operation['KV']['Key'])
+            )
+
+        return (200, {'X-Consul-Index': '924'},
+                json.dumps({'Results': results, 'Errors': None}))
+
+    responses.add_callback(
+        responses.PUT,
+        'http://{}:8500/v1/txn'.format(host),
+        callback=callback,
+        content_type='application/json'
+    )
+
+
+def make_non_ascii_prefix_response(host='foobar'):
+    entry = {
+        "LockIndex": 0,
+        "Key": "MYAPP/city",
+        "Flags": 0,
+        "Value": base64.b64encode('Zagreb ć'.encode('utf-8')).decode('ascii'),
+        "CreateIndex": 924,
+        "ModifyIndex": 924
+    }
+    responses.add(
+        responses.GET,
+        'http://{}:8500/v1/kv/MYAPP/?recurse=1'.format(host),
+        json=CONSUL_DUMMY_RESPONSES_NAMESPACED + [entry],
+        headers={'X-Consul-Index': '924'},
+        status=200
+    )
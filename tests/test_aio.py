@@ -0,0 +1,150 @@
+import os
+import asyncio
+import pytest
+import responses
+
+from unittest import TestCase, mock
+from fixtures import (
+    CONSUL_DUMMY_RESPONSE,
+    make_namespaced_responses,
+    make_namespaced_prefix_response
+)
+
+from confgetti.aio import AsyncConfgetti, AsyncConsulInterface
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncConsulInterfaceTestCase(TestCase):
+    def test_create_connection(self):
+        ci = AsyncConsulInterface()
+        connection = ci.create_connection({'host': 'bar'})
+
+        assert ci.connection is connection
+        assert connection.http.host == 'bar'
+
+    @responses.activate
+    def test_get_raw_value(self):
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/my_variable',
+            json=[CONSUL_DUMMY_RESPONSE],
+            headers={'X-Consul-Index': '924'},
+            status=200
+        )
+
+        ci = AsyncConsulInterface(prepare_connection=True)
+
+        assert run(ci.get_raw_value('my_variable')) == b'foo'
+
+
+class AsyncConfgettiTestCase(TestCase):
+    def setUp(self):
+        self.cfgtti = AsyncConfgetti(consul_config={'host': 'foobar'})
+
+    @mock.patch.dict(os.environ, {
+        'MY_DUMMY_VAR': 'True'
+    })
+    def test_get_variable_from_env(self):
+        variable = run(self.cfgtti.get_variable(
+            'MY_DUMMY_VAR', convert_to=bool))
+
+        assert variable is True
+
+    @responses.activate
+    def test_get_variable_from_consul(self):
+        responses.add(
+            responses.GET,
+            'http://foobar:8500/v1/kv/MY_DUMMY_VAR',
+            json=[CONSUL_DUMMY_RESPONSE],
+            headers={'X-Consul-Index': '924'},
+            status=200
+        )
+
+        variable = run(self.cfgtti.get_variable('MY_DUMMY_VAR'))
+
+        assert variable == 'foo'
+
+    def test_get_variable_fallback(self):
+        variable = run(self.cfgtti.get_variable(
+            'MY_DUMMY_VAR', fallback='bar', use_consul=False))
+
+        assert variable == 'bar'
+
+    @mock.patch.dict(os.environ, {
+        'my_int': '2'
+    })
+    @responses.activate
+    def test_get_variables(self):
+        make_namespaced_responses()
+
+        variables = run(self.cfgtti.get_variables(
+            path='MYAPP',
+            keys={
+                'my_string_0': str,
+                'my_string_1': str,
+                'my_int': int,
+                'my_bool': bool,
+                'not_existing': str
+            }
+        ))
+
+        assert list(variables.items()) == [
+            ('my_string_0', 'foo'),
+            ('my_string_1', 'bar'),
+            ('my_int', 2),
+            ('my_bool', False)
+        ]
+
+    @responses.activate
+    def test_get_variables_bulk(self):
+        make_namespaced_prefix_response()
+
+        variables = run(self.cfgtti.get_variables(
+            path='MYAPP', keys=['my_string_0', 'my_int'], bulk=True))
+
+        assert variables == {'my_string_0': 'foo', 'my_int': '1'}
+        assert len(responses.calls) == 1
+
+    def test_get_variables_bounded_concurrency(self):
+        cfgtti = AsyncConfgetti(
+            consul_config={'host': 'foobar'}, max_concurrency=2)
+        running = []
+        peak = []
+
+        async def get_raw_value(key, path=None):
+            running.append(key)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(key)
+            return key.encode('ascii')
+
+        cfgtti.consul.get_raw_value = get_raw_value
+
+        variables = run(cfgtti.get_variables(
+            keys=['a', 'b', 'c', 'd', 'e'], use_env=False))
+
+        assert variables == {key: key for key in 'abcde'}
+        assert max(peak) == 2
+
+    def test_get_variables_with_wrong_type(self):
+        with pytest.raises(TypeError):
+            run(self.cfgtti.get_variables(path='MYAPP', keys='wrong'))
+
+
+def test_get_variables_connection_failed(caplog):
+    cfgtti = AsyncConfgetti(consul_config={'host': 'unreachable-async'})
+    variables = run(cfgtti.get_variables(
+        path='MYAPP', keys=['MY_DUMMY_VAR'], bulk=True))
+    variable = run(cfgtti.get_variable('MY_DUMMY_VAR'))
+
+    assert 'Not connected to consul' in caplog.text
+    assert variables == {}
+    assert variable is None
@@ -6,11 +6,29 @@ from unittest import TestCase, mock
 from fixtures import (
     CONSUL_DUMMY_RESPONSE,
     CONSUL_DUMMY_RESPONSE_LEVELED,
-    make_namespaced_responses
+    CONSUL_DUMMY_RESPONSES_NAMESPACED,
+    get_encoded_value,
+    make_namespaced_responses,
+    make_namespaced_prefix_response,
+    make_non_ascii_prefix_response,
+    make_nested_prefix_response,
+    make_txn_response
 )
 
-from confgetti.base import Confgetti, ValueConvert
+from confgetti.base import (
+    Confgetti,
+    ValueConvert,
+    build_tree,
+    decode_raw_values,
+    encode_raw_values,
+    get_tree,
+    get_variables
+)
 from confgetti.exceptions import ConvertValueError
+from confgetti.environment import EnvironmentIndex
+from confgetti.shared import SharedCache
+from confgetti.snapshot import SnapshotStore
+from confgetti.stats import Stats
 
 
 class ValueConvertTestCase(TestCase):
@@ -91,6 +109,47 @@ class ValueConvertTestCase(TestCase):
 
         assert value == dummy_value
 
+    def test_get_converter_is_cached(self):
+        converter = self.value_convert.get_converter(int)
+
+        assert self.value_convert.get_converter(int) is converter
+        assert self.value_convert.get_converter('int') is not converter
+        assert converter(b'3') == 3
+
+    def test_get_converter_without_type_decodes(self):
+        converter = self.value_convert.get_converter()
+
+        assert converter(b'foo') == 'foo'
+        assert converter(3) == 3
+
+    def test_compile_dict_keys(self):
+        plan = self.value_convert.compile({'a': int, 'b': bool, 'c': None})
+
+        assert plan['a'](b'1') == 1
+        assert plan['b']('true') is True
+        assert plan['c'](b'x') == 'x'
+
+    def test_compile_list_keys(self):
+        plan = self.value_convert.compile(['a', 'b'])
+
+        assert plan['a'](b'1') == '1'
+        assert plan['b']('x') == 'x'
+
+    def test_compile_is_cached(self):
+        plan = self.value_convert.compile({'a': int, 'b': bool})
+
+        assert self.value_convert.compile({'a': int, 'b': bool}) is plan
+        assert self.value_convert.compile({'a': int}) is not plan
+
+
+def test_compiled_converter_warnings(caplog):
+    plan = ValueConvert().compile({'a': int, 'b': 'hex'})
+
+    assert plan['a'](b'abc') == 'abc'
+    assert plan['b'](b'ff') == 'ff'
+    assert '"abc" cannot be converted to int!' in caplog.text
+    assert 'method for "hex" does not exist!' in caplog.text
+
 
 class ConfgettiTestCase(TestCase):
     def setUp(self):
@@ -125,6 +184,21 @@ class ConfgettiTestCase(TestCase):
 
         assert variable == 'foo'
 
+    def test_get_variable_conversion_failure_is_counted(self):
+        stats = Stats()
+        cfgtti = Confgetti(
+            prepare_consul=False, environ={'MY_INT': 'foo'}, stats=stats)
+
+        assert cfgtti.get_variable('MY_INT', convert_to=int) == 'foo'
+        assert stats.conversion_failures == {'MY_INT': 1}
+
+    def test_get_variable_from_custom_environ(self):
+        cfgtti = Confgetti(
+            prepare_consul=False,
+            environ=EnvironmentIndex({'MY_DUMMY_VAR': '1'}))
+
+        assert cfgtti.get_variable('MY_DUMMY_VAR', convert_to=int) == 1
+
     @responses.activate
     def test_get_variable_from_consul(self):
         responses.add(
@@ -230,6 +304,148 @@ class ConfgettiTestCase(TestCase):
         assert variables['my_bool'] == 'false'
         assert variables.get('not_existing') is None
 
+    @responses.activate
+    def test_get_variables_bulk(self):
+        make_namespaced_prefix_response()
+
+        variables = self.cfgtti.get_variables(
+            path='MYAPP',
+            keys={
+                'my_string_0': str,
+                'my_int': int,
+                'my_bool': bool,
+                'not_existing': str
+            },
+            bulk=True
+        )
+
+        assert variables == {
+            'my_string_0': 'foo',
+            'my_int': 1,
+            'my_bool': False
+        }
+        assert len(responses.calls) == 1
+
+    @mock.patch.dict(os.environ, {
+        'my_int': '2'
+    })
+    @responses.activate
+    def test_get_variables_bulk_env_first(self):
+        make_namespaced_prefix_response()
+
+        variables = self.cfgtti.get_variables(
+            path='MYAPP',
+            keys={'my_int': int, 'my_string_1': str},
+            bulk=True
+        )
+
+        assert variables == {'my_int': 2, 'my_string_1': 'bar'}
+
+    @mock.patch.dict(os.environ, {
+        'my_bool': 'true'
+    })
+    @responses.activate
+    def test_get_variables_batch(self):
+        make_txn_response()
+
+        variables = self.cfgtti.get_variables(
+            keys={
+                'MYAPP/my_string_0': str,
+                'MYAPP/my_int': int,
+                'my_bool': bool,
+                'MYAPP/not_existing': str
+            },
+            batch=True
+        )
+
+        assert variables == {
+            'MYAPP/my_string_0': 'foo',
+            'MYAPP/my_int': 1,
+            'my_bool': True
+        }
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_variables_batch_not_permitted(self):
+        responses.add(
+            responses.PUT,
+            'http://foobar:8500/v1/txn',
+            body='Permission denied',
+            status=403
+        )
+        make_namespaced_responses()
+
+        variables = self.cfgtti.get_variables(
+            path='MYAPP',
+            keys=['my_string_0', 'my_int'],
+            batch=True
+        )
+
+        assert variables == {'my_string_0': 'foo', 'my_int': '1'}
+
+    @responses.activate
+    def test_get_variables_bulk_permission_denied(self):
+        responses.add(
+            responses.GET,
+            'http://foobar:8500/v1/kv/MYAPP/?recurse=1',
+            body='Permission denied',
+            status=403
+        )
+        make_namespaced_responses()
+
+        variables = self.cfgtti.get_variables(
+            path='MYAPP',
+            keys=['my_string_0', 'my_int'],
+            bulk=True
+        )
+
+        assert variables == {'my_string_0': 'foo', 'my_int': '1'}
+        assert len(responses.calls) == 3
+
+    @mock.patch.dict(os.environ, {
+        'my_int': '2'
+    })
+    @responses.activate
+    def test_get_variables_concurrently(self):
+        make_namespaced_responses()
+        self.cfgtti.consul.retries = 0
+
+        variables = self.cfgtti.get_variables(
+            path='MYAPP',
+            keys={
+                'my_string_0': str,
+                'my_string_1': str,
+                'my_int': int,
+                'my_bool': bool,
+                'not_existing': str
+            },
+            max_workers=4
+        )
+
+        assert list(variables.items()) == [
+            ('my_string_0', 'foo'),
+            ('my_string_1', 'bar'),
+            ('my_int', 2),
+            ('my_bool', False)
+        ]
+        assert len(responses.calls) == 4
+
+    @mock.patch.dict(os.environ, {
+        'my_int': '2'
+    })
+    @responses.activate
+    def test_get_variables_concurrently_without_env(self):
+        make_namespaced_responses()
+
+        variables = self.cfgtti.get_variables(
+            path='MYAPP',
+            keys=['my_int', 'my_bool'],
+            use_env=False,
+            max_workers=2
+        )
+
+        assert variables == {'my_int': '1', 'my_bool': 'false'}
+
     @responses.activate
     def test_get_variables_with_wrong_type(self):
         with self.assertRaises(TypeError):
@@ -245,3 +461,349 @@ def test_get_variable_connection_failed(caplog):
 
     assert 'Not connected to consul' in caplog.text
     assert variable is None
+
+
+@mock.patch('confgetti.base.Confgetti.get_variables')
+def test_get_variables_shorthand(get_variables_mock):
+    get_variables(
+        'MYAPP', ['my_int'], bulk=True, max_workers=2, batch=True)
+
+    get_variables_mock.assert_called_once_with(
+        'MYAPP', ['my_int'], True, True, True, max_workers=2, batch=True)
+
+
+def test_get_variables_connection_failed_uses_snapshot(caplog):
+    snapshot_store = mock.Mock()
+    snapshot_store.load.return_value = encode_raw_values({'my_int': '3'})
+    cfgtti = Confgetti(
+        consul_config={'host': 'unreachable-snapshot'},
+        snapshot_store=snapshot_store)
+
+    variables = cfgtti.get_variables(
+        path='MYAPP', keys={'my_int': int, 'my_bool': bool}, bulk=True)
+    variable = cfgtti.get_variable('my_int', path='MYAPP', convert_to=int)
+
+    assert 'Using snapshot of "MYAPP" consul values' in caplog.text
+    assert variables == {'my_int': 3}
+    assert variable == 3
+    snapshot_store.load.assert_called_with('MYAPP')
+
+
+def test_get_variables_batch_connection_failed_uses_snapshot(caplog):
+    snapshot_store = mock.Mock()
+    snapshot_store.load.return_value = encode_raw_values({'my_int': '3'})
+    cfgtti = Confgetti(
+        consul_config={'host': 'unreachable-batch'},
+        snapshot_store=snapshot_store)
+
+    variables = cfgtti.get_variables(
+        path='MYAPP', keys={'my_int': int, 'my_bool': bool}, batch=True)
+
+    assert 'Not connected to consul on host "unreachable-batch"' \
+        in caplog.text
+    assert variables == {'my_int': 3}
+
+
+def test_get_variable_connection_failed_without_snapshot():
+    snapshot_store = mock.Mock()
+    snapshot_store.load.return_value = None
+    cfgtti = Confgetti(
+        consul_config={'host': 'unreachable-snapshot'},
+        snapshot_store=snapshot_store)
+
+    assert cfgtti.get_variable('my_int', path='MYAPP') is None
+    assert cfgtti.get_variable('my_int') is None
+    snapshot_store.load.assert_called_once_with('MYAPP')
+
+
+@responses.activate
+def test_get_variables_bulk_skips_conversion_of_unchanged_values():
+    make_namespaced_prefix_response()
+    changed = [
+        dict(entry, ModifyIndex=925, Value=get_encoded_value('{"a": 2}'))
+        if entry['Key'] == 'MYAPP/my_string_0' else entry
+        for entry in CONSUL_DUMMY_RESPONSES_NAMESPACED
+    ]
+    responses.add(
+        responses.GET,
+        'http://foobar:8500/v1/kv/MYAPP/?recurse=1',
+        json=changed,
+        headers={'X-Consul-Index': '925'},
+        status=200
+    )
+    stats = Stats()
+    cfgtti = Confgetti(consul_config={'host': 'foobar'}, stats=stats)
+    keys = {'my_int': int, 'my_string_0': None}
+
+    first = cfgtti.get_variables('MYAPP', keys, use_env=False, bulk=True)
+    second = cfgtti.get_variables('MYAPP', keys, use_env=False, bulk=True)
+
+    assert first == {'my_int': 1, 'my_string_0': 'foo'}
+    assert second == {'my_int': 1, 'my_string_0': '{"a": 2}'}
+    assert stats.counters['consul.unchanged'] == 1
+
+
+@responses.activate
+def test_get_consul_values_saves_snapshot():
+    make_namespaced_prefix_response()
+    snapshot_store = mock.Mock()
+    cfgtti = Confgetti(
+        consul_config={'host': 'foobar'}, snapshot_store=snapshot_store)
+
+    cfgtti.get_consul_values('MYAPP')
+
+    snapshot_store.save.assert_called_once_with('MYAPP', encode_raw_values({
+        'my_string_0': b'foo',
+        'my_string_1': b'bar',
+        'my_int': b'1',
+        'my_bool': b'false'
+    }))
+
+
+@responses.activate
+def test_get_variables_bulk_with_unusable_snapshot_directory(tmpdir):
+    make_namespaced_prefix_response()
+    tmpdir.join('file').write('')
+    cfgtti = Confgetti(
+        consul_config={'host': 'foobar'},
+        snapshot_store=SnapshotStore(str(tmpdir.join('file', 'snapshots'))))
+
+    assert cfgtti.get_variables(
+        path='MYAPP', keys=['my_int'], use_env=False, bulk=True) == {
+            'my_int': '1'
+        }
+
+
+@responses.activate
+def test_get_variables_bulk_snapshot_keeps_non_ascii_values(tmpdir):
+    make_non_ascii_prefix_response()
+    snapshot_store = SnapshotStore(str(tmpdir))
+    cfgtti = Confgetti(
+        consul_config={'host': 'foobar'}, snapshot_store=snapshot_store)
+
+    assert cfgtti.get_variables(
+        path='MYAPP', keys={'my_int': 'int'}, use_env=False, bulk=True) == {
+            'my_int': 1
+        }
+
+    values = SnapshotStore(str(tmpdir)).load('MYAPP')
+    assert decode_raw_values(values)['city'] == 'Zagreb ć'.encode('utf-8')
+
+
+def test_get_snapshot_values_ignores_unreadable_snapshot(caplog):
+    snapshot_store = mock.Mock()
+    snapshot_store.load.return_value = {'my_int': 'not base64!'}
+    cfgtti = Confgetti(prepare_consul=False, snapshot_store=snapshot_store)
+
+    assert cfgtti.get_snapshot_values('MYAPP') == {}
+    assert 'Ignoring unreadable snapshot of "MYAPP"' in caplog.text
+
+
+@responses.activate
+def test_get_variables_bulk_uses_shared_cache(tmpdir):
+    make_namespaced_prefix_response()
+    shared_cache = SharedCache(str(tmpdir))
+    stats = Stats()
+    keys = {'my_int': 'int', 'my_string_0': None}
+
+    for _ in range(3):
+        cfgtti = Confgetti(
+            consul_config={'host': 'foobar'}, stats=stats,
+            shared_cache=shared_cache)
+
+        assert cfgtti.get_variables(
+            path='MYAPP', keys=keys, use_env=False, bulk=True) == {
+                'my_int': 1, 'my_string_0': 'foo'
+            }
+
+    assert len(responses.calls) == 1
+    assert stats.counters['consul.shared_cache.misses'] == 1
+    assert stats.counters['consul.shared_cache.hits'] == 2
+    assert shared_cache.get_version(
+        'MYAPP', cfgtti.consul.get_connection_digest()) == 1
+    assert shared_cache.get_version('MYAPP') is None
+
+
+@responses.activate
+def test_get_variables_bulk_shared_cache_keeps_non_ascii_values(tmpdir):
+    make_non_ascii_prefix_response()
+    shared_cache = SharedCache(str(tmpdir))
+
+    for _ in range(2):
+        cfgtti = Confgetti(
+            consul_config={'host': 'foobar'}, shared_cache=shared_cache)
+
+        assert cfgtti.get_variables(
+            path='MYAPP', keys={'my_int': 'int'}, use_env=False,
+            bulk=True) == {'my_int': 1}
+        assert cfgtti.fetch_consul_values('MYAPP')['city'] == \
+            'Zagreb ć'.encode('utf-8')
+
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_fetch_consul_values_ignores_unreadable_shared_values(tmpdir):
+    make_namespaced_prefix_response()
+    shared_cache = SharedCache(str(tmpdir))
+    cfgtti = Confgetti(
+        consul_config={'host': 'foobar'}, stats=Stats(),
+        shared_cache=shared_cache)
+    shared_cache.write(
+        'MYAPP', {'my_int': 'not base64!'},
+        scope=cfgtti.consul.get_connection_digest())
+
+    assert cfgtti.fetch_consul_values('MYAPP')['my_int'] == b'1'
+    assert cfgtti.stats.counters['consul.shared_cache.errors'] == 1
+
+
+@responses.activate
+def test_get_variables_bulk_shared_cache_separates_tokens(tmpdir):
+    for token in ('first', 'second'):
+        responses.add(
+            responses.GET,
+            'http://foobar:8500/v1/kv/MYAPP/?recurse=1&token=' + token,
+            json=CONSUL_DUMMY_RESPONSES_NAMESPACED,
+            headers={'X-Consul-Index': '924'},
+            status=200)
+
+    shared_cache = SharedCache(str(tmpdir))
+    stats = Stats()
+
+    for token in ('first', 'second'):
+        cfgtti = Confgetti(
+            consul_config={'host': 'foobar', 'token': token}, stats=stats,
+            shared_cache=shared_cache)
+
+        assert cfgtti.get_variables(
+            path='MYAPP', keys=['my_string_0'], use_env=False,
+            bulk=True) == {'my_string_0': 'foo'}
+
+    assert len(responses.calls) == 2
+    assert stats.counters['consul.shared_cache.misses'] == 2
+    assert len(tmpdir.listdir(lambda path: path.ext == '.shm')) == 2
+
+
+@responses.activate
+def test_get_variables_bulk_with_unusable_shared_cache(tmpdir):
+    make_namespaced_prefix_response()
+    directory = tmpdir.join('shared')
+    directory.mkdir()
+    directory.chmod(0o777)
+    stats = Stats()
+    cfgtti = Confgetti(
+        consul_config={'host': 'foobar'}, stats=stats,
+        shared_cache=SharedCache(str(directory)))
+
+    assert cfgtti.get_variables(
+        path='MYAPP', keys=['my_string_0'], use_env=False, bulk=True) == {
+            'my_string_0': 'foo'
+        }
+    assert len(responses.calls) == 1
+    assert stats.counters['consul.shared_cache.errors'] == 1
+    assert directory.listdir() == []
+
+
+def test_get_consul_values_connection_failed_skips_shared_cache(tmpdir):
+    shared_cache = SharedCache(str(tmpdir))
+    cfgtti = Confgetti(
+        consul_config={'host': 'unreachable-shared'},
+        shared_cache=shared_cache)
+
+    assert cfgtti.get_consul_values('MYAPP') == {}
+    assert shared_cache.read('MYAPP') is None
+
+
+@mock.patch('time.sleep')
+def test_get_variables_fail_fast_on_open_circuit(sleep_mock):
+    stats = Stats()
+    cfgtti = Confgetti(
+        consul_config={'host': 'unreachable-breaker'}, stats=stats)
+    keys = ['key_{}'.format(number) for number in range(10)]
+
+    assert cfgtti.get_variables(path='MYAPP', keys=keys, use_env=False) == {}
+    assert stats.counters['consul.requests'] == 5
+    assert stats.counters['consul.retries'] == 3
+    assert stats.counters['consul.circuit_open'] == 8
+
+
+def test_get_variables_bulk_connection_failed(caplog):
+    cfgtti = Confgetti(consul_config={'host': 'unreachable'})
+    variables = cfgtti.get_variables(
+        path='MYAPP', keys=['MY_DUMMY_VAR'], bulk=True)
+
+    assert 'Not connected to consul' in caplog.text
+    assert variables == {}
+
+
+def test_build_tree():
+    tree = build_tree({
+        'debug': b'true',
+        'cache/': None,
+        'db/host': b'localhost',
+        'db/replica/host': b'replica',
+        'db/user': None
+    }, ValueConvert().decode)
+
+    assert tree == {
+        'debug': 'true',
+        'cache': {},
+        'db': {'host': 'localhost', 'replica': {'host': 'replica'}}
+    }
+
+
+def test_build_tree_keeps_nested_keys(caplog):
+    expected = {'db': {'host': 'localhost'}}
+
+    assert build_tree({'db': 'url', 'db/host': 'localhost'}) == expected
+    assert build_tree({'db/host': 'localhost', 'db': 'url'}) == expected
+    assert caplog.text.count('Value of "db" is shadowed by nested keys') == 2
+
+
+@responses.activate
+def test_get_tree():
+    make_nested_prefix_response()
+    cfgtti = Confgetti(consul_config={'host': 'foobar'})
+
+    assert cfgtti.get_tree('MYAPP') == {
+        'debug': 'true',
+        'cache': {},
+        'db': {
+            'host': 'localhost',
+            'port': '5432',
+            'replica': {'host': 'replica'}
+        }
+    }
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_tree_permission_denied(caplog):
+    responses.add(
+        responses.GET,
+        'http://foobar:8500/v1/kv/MYAPP/?recurse=1',
+        body='Permission denied',
+        status=403
+    )
+    cfgtti = Confgetti(consul_config={'host': 'foobar'})
+
+    assert cfgtti.get_tree('MYAPP') == {}
+    assert 'Recursive reads of "MYAPP" are not permitted' in caplog.text
+
+
+def test_get_tree_connection_failed_uses_snapshot():
+    snapshot_store = mock.Mock()
+    snapshot_store.load.return_value = encode_raw_values(
+        {'db/host': 'localhost'})
+    cfgtti = Confgetti(
+        consul_config={'host': 'unreachable-tree'},
+        snapshot_store=snapshot_store)
+
+    assert cfgtti.get_tree('MYAPP') == {'db': {'host': 'localhost'}}
+
+
+@mock.patch('confgetti.base.Confgetti.get_tree')
+def test_get_tree_shorthand(get_tree_mock):
+    get_tree('MYAPP')
+
+    get_tree_mock.assert_called_once_with('MYAPP')
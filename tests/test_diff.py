@@ -0,0 +1,160 @@
+import sys
+import types
+import unittest
+
+from unittest.mock import Mock, patch
+
+from confgetti.diff import (
+    ConfigDiff, ConfigApplier, diff_config, get_config_applier, subscribe)
+from confgetti.load import apply_config
+
+
+def test_diff_config():
+    diff = diff_config(
+        {'a': 1, 'b': 'x', 'c': True, 'd': {'host': 'h', 'port': 1}},
+        {'a': 1, 'b': 'y', 'c': 1, 'd': {'host': 'h', 'port': 2}, 'e': 5})
+
+    assert diff.added == {'e': 5}
+    assert diff.removed == {}
+    assert diff.changed == {
+        'b': ('x', 'y'),
+        'c': (True, 1),
+        'd': ({'host': 'h', 'port': 1}, {'host': 'h', 'port': 2})
+    }
+    assert diff.nested == {'d': ConfigDiff(changed={'port': (1, 2)})}
+    assert diff.keys == {'b', 'c', 'd', 'e'}
+    assert diff.updated == {
+        'b': 'y', 'c': 1, 'd': {'host': 'h', 'port': 2}, 'e': 5}
+    assert diff.get_paths() == {('b',), ('c',), ('d', 'port'), ('e',)}
+
+
+def test_diff_config_removed():
+    diff = diff_config({'a': 1, 'b': 2}, {'a': 1})
+
+    assert diff.removed == {'b': 2}
+    assert bool(diff) is True
+    assert bool(diff_config({'a': 1}, {'a': 1})) is False
+
+
+def test_subset():
+    diff = diff_config(
+        {'a': 1, 'b': {'c': 1}}, {'a': 2, 'b': {'c': 2}, 'd': 3})
+
+    assert diff.subset(['b', 'd']).as_dict() == {
+        'added': {'d': 3},
+        'removed': {},
+        'changed': {'b': ({'c': 1}, {'c': 2})},
+        'nested': {
+            'b': {
+                'added': {}, 'removed': {}, 'changed': {'c': (1, 2)},
+                'nested': {}
+            }
+        }
+    }
+
+
+class ConfigApplierTestCase(unittest.TestCase):
+    def setUp(self):
+        self.module = types.ModuleType('diff_config')
+        self.module.a = 1
+        self.module.b = 'x'
+        sys.modules['diff_config'] = self.module
+        self.applier = ConfigApplier('diff_config')
+
+    def tearDown(self):
+        del sys.modules['diff_config']
+
+    def test_apply_sets_only_changed_values(self):
+        diff = self.applier.apply({'a': 1, 'b': 'y', 'c': 3})
+
+        assert diff == ConfigDiff(added={'c': 3}, changed={'b': ('x', 'y')})
+        assert (self.module.a, self.module.b, self.module.c) == (1, 'y', 3)
+
+    def test_apply_removes_previously_applied_keys(self):
+        self.applier.apply({'a': 1, 'c': 3})
+
+        diff = self.applier.apply({'a': 1})
+
+        assert diff.removed == {'c': 3}
+        assert not hasattr(self.module, 'c')
+        assert self.module.b == 'x'
+
+    def test_apply_restores_module_defaults_of_removed_keys(self):
+        self.applier.apply({'a': 10, 'b': 'y'})
+        self.applier.apply({'a': 20, 'b': 'z'})
+
+        diff = self.applier.apply({})
+
+        assert diff == ConfigDiff(changed={'a': (20, 1), 'b': ('z', 'x')})
+        assert (self.module.a, self.module.b) == (1, 'x')
+
+    def test_apply_keeps_module_default_unchanged_when_reapplied(self):
+        self.applier.apply({'a': 1})
+
+        assert self.applier.apply({}) == ConfigDiff()
+        assert self.module.a == 1
+
+        self.applier.apply({'a': 2})
+        self.applier.apply({})
+
+        assert self.module.a == 1
+
+    def test_subscribers_of_changed_keys_are_called(self):
+        a_callback = Mock()
+        b_callback = Mock()
+        all_callback = Mock()
+        self.applier.subscribe(a_callback, ['a'])
+        self.applier.subscribe(b_callback, ['b'])
+        self.applier.subscribe(all_callback)
+
+        self.applier.apply({'a': 1, 'b': 'y'})
+        self.applier.apply({'a': 1, 'b': 'y'})
+
+        a_callback.assert_not_called()
+        b_callback.assert_called_once_with(
+            ConfigDiff(changed={'b': ('x', 'y')}))
+        all_callback.assert_called_once_with(
+            ConfigDiff(changed={'b': ('x', 'y')}))
+
+    def test_failing_subscriber_does_not_stop_others(self):
+        callback = Mock()
+        self.applier.subscribe(Mock(side_effect=Exception))
+        self.applier.subscribe(callback)
+
+        self.applier.apply({'a': 2})
+
+        callback.assert_called_once_with(ConfigDiff(changed={'a': (1, 2)}))
+
+    def test_unsubscribe(self):
+        callback = Mock()
+        self.applier.subscribe(callback, ['a'])
+        self.applier.unsubscribe(callback)
+
+        self.applier.apply({'a': 2})
+
+        callback.assert_not_called()
+
+
+class SubscribeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.module = types.ModuleType('subscribed_config')
+        self.module.a = 1
+        sys.modules['subscribed_config'] = self.module
+
+    def tearDown(self):
+        del sys.modules['subscribed_config']
+
+    def test_apply_config_notifies_subscribers(self):
+        callback = Mock()
+        applier = subscribe('subscribed_config', callback, ['a'])
+
+        with patch('confgetti.load.set_values') as set_values_mock:
+            apply_config('subscribed_config', {'a': 2, 'b': 3})
+
+        set_values_mock.assert_not_called()
+        assert get_config_applier('subscribed_config') is applier
+        assert (self.module.a, self.module.b) == (2, 3)
+        callback.assert_called_once_with(ConfigDiff(changed={'a': (1, 2)}))
+
+    def test_get_config_applier_without_create(self):
+        assert get_config_applier('not_subscribed', create=False) is None
@@ -0,0 +1,42 @@
+import unittest
+
+from confgetti.environment import EnvironmentIndex
+
+
+class EnvironmentIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.source = {
+            'PREFIX_A_B': 'abc',
+            'PREFIX_C_D': '123',
+            'WRONG_PREFIX_E': 'def',
+            'PREFIX': 'not'
+        }
+        self.environ = EnvironmentIndex(self.source)
+
+    def test_mapping(self):
+        assert self.environ['PREFIX_A_B'] == 'abc'
+        assert self.environ.get('PREFIX_C_D') == '123'
+        assert self.environ.get('MISSING', 'default') == 'default'
+        assert len(self.environ) == 4
+        assert set(self.environ) == set(self.source)
+
+    def test_get_prefixed(self):
+        assert self.environ.get_prefixed('PREFIX') == {
+            'a_b': 'abc', 'c_d': '123'}
+
+    def test_get_prefixed_returns_copy(self):
+        self.environ.get_prefixed('PREFIX')['a_b'] = 'changed'
+
+        assert self.environ.get_prefixed('PREFIX')['a_b'] == 'abc'
+
+    def test_snapshot_is_kept_until_refresh(self):
+        self.environ.get_prefixed('PREFIX')
+        self.source['PREFIX_F'] = 'new'
+
+        assert 'PREFIX_F' not in self.environ
+        assert 'f' not in self.environ.get_prefixed('PREFIX')
+
+        self.environ.refresh()
+
+        assert self.environ['PREFIX_F'] == 'new'
+        assert self.environ.get_prefixed('PREFIX')['f'] == 'new'
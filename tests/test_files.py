@@ -0,0 +1,213 @@
+import os
+import json
+import shutil
+import pytest
+import tempfile
+import unittest
+
+from unittest import mock
+
+from confgetti.files import (
+    JsonFileLoader,
+    YamlFileLoader,
+    TomlFileLoader,
+    DotEnvFileLoader,
+    FileLoaderRegistry,
+    file_loaders
+)
+
+
+def importorskip_toml():
+    try:
+        import tomllib  # noqa: F401
+    except ImportError:
+        pytest.importorskip("toml")
+
+
+CONFIG = {
+    "routes": [{"path": "/a", "target": "b"}, {"path": "/{x}", "s": "\\"}],
+    "name": "app \"quoted\" } ]",
+    "matrix": {"a": {"b": [1, 2, {"c": None}]}},
+    "debug": True,
+    "port": 8000,
+    "ratio": -1.5e3
+}
+
+
+class JsonFileLoaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "config.json")
+        self.write(json.dumps(CONFIG, indent=2))
+        self.loader = JsonFileLoader()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, content):
+        with open(self.path, "w") as f:
+            f.write(content)
+
+    def test_load_all_keys(self):
+        assert self.loader.load(self.path) == CONFIG
+
+    def test_load_selected_keys(self):
+        for key in CONFIG:
+            assert self.loader.load(self.path, [key]) == {key: CONFIG[key]}
+
+        assert self.loader.load(self.path, {"port": int, "missing": str}) \
+            == {"port": 8000}
+
+    def test_load_selected_keys_uppercase(self):
+        assert self.loader.load(self.path, ["PORT", "DEBUG"], True) == {
+            "port": 8000, "debug": True}
+
+    def test_load_selected_keys_compact(self):
+        self.write(json.dumps(CONFIG, separators=(",", ":")))
+
+        assert self.loader.load(self.path, list(CONFIG)) == CONFIG
+
+    def test_load_empty_object(self):
+        self.write(" {\n} ")
+
+        assert self.loader.load(self.path, ["port"]) == {}
+
+    def test_load_selected_keys_does_not_decode_skipped_values(self):
+        with open(self.path, "wb") as f:
+            f.write(b'{"blob": "\xff\xfe", "nested": {"a": ["}", "\\""]},'
+                    b' "port": 8000, "name": "\xc5\xbe"}')
+
+        assert self.loader.load(self.path, ["port", "name"]) == {
+            "port": 8000, "name": "\u017e"}
+
+    def test_invalid_json(self):
+        for content in ("", "[1]", "{port: 1}", '{"port" 1}', '{"a": [1',
+                        '{"a": "1', '{"a": 1 "port": 2}', '{"a": ,}'):
+            self.write(content)
+
+            with self.assertRaises(ValueError):
+                self.loader.load(self.path, ["port"])
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        self.loader.load(self.path)
+        self.loader.load(self.path, ["port"])
+
+        with mock.patch("confgetti.files.json.load") as load_mock, \
+                mock.patch.object(self.loader, "extract") as extract_mock:
+            assert self.loader.load(self.path) == CONFIG
+            assert self.loader.load(self.path, ["port"]) == {"port": 8000}
+
+        load_mock.assert_not_called()
+        extract_mock.assert_not_called()
+
+    def test_changed_file_is_parsed_again(self):
+        assert self.loader.load(self.path, ["port"]) == {"port": 8000}
+
+        self.write('{"port": 9000, "debug": false}')
+
+        assert self.loader.load(self.path, ["port"]) == {"port": 9000}
+
+    def test_returned_config_is_copy(self):
+        self.loader.load(self.path)["port"] = 1
+
+        assert self.loader.load(self.path)["port"] == 8000
+
+
+class FileLoadersTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+
+        with open(path, "w") as f:
+            f.write(content)
+
+        return path
+
+    def test_yaml(self):
+        pytest.importorskip("yaml")
+        path = self.write("config.yml", "a: 1\nb:\n  - x\n")
+
+        assert YamlFileLoader().load(path) == {"a": 1, "b": ["x"]}
+        assert YamlFileLoader().load(path, ["B"], True) == {"b": ["x"]}
+        assert YamlFileLoader().load(self.write("empty.yml", "")) == {}
+
+        with self.assertRaises(ValueError):
+            YamlFileLoader().load(self.write("list.yml", "- a"))
+
+    @mock.patch.dict("sys.modules", {"yaml": None})
+    def test_yaml_without_parser(self):
+        path = self.write("config.yml", "a: 1\n")
+
+        with self.assertRaisesRegex(ImportError, r"confgetti\[yaml\]"):
+            YamlFileLoader().load(path)
+
+    @mock.patch.dict("sys.modules", {"tomllib": None, "toml": None})
+    def test_toml_without_parser(self):
+        path = self.write("config.toml", "a = 1\n")
+
+        with self.assertRaisesRegex(ImportError, r"confgetti\[toml\]"):
+            TomlFileLoader().load(path)
+
+    def test_toml(self):
+        importorskip_toml()
+        path = self.write("config.toml", 'a = 1\n[b]\nc = "x"\n')
+
+        assert TomlFileLoader().load(path) == {"a": 1, "b": {"c": "x"}}
+
+    def test_dotenv(self):
+        path = self.write("config.env", "\n".join([
+            "# comment",
+            "",
+            "A=1",
+            "export B_C = value # comment",
+            'D="quoted # \\"value\\"\\nline"',
+            "E='single # \\n'",
+            "F=",
+        ]))
+
+        assert DotEnvFileLoader().load(path) == {
+            "a": "1",
+            "b_c": "value",
+            "d": 'quoted # "value"\nline',
+            "e": "single # \\n",
+            "f": ""
+        }
+
+    def test_dotenv_invalid_line(self):
+        path = self.write("config.env", "A=1\nnot valid\n")
+
+        with self.assertRaises(ValueError):
+            DotEnvFileLoader().load(path)
+
+    def test_file_is_parsed_once(self):
+        loader = DotEnvFileLoader()
+        path = self.write("config.env", "A=1")
+        loader.load(path)
+
+        with mock.patch.object(loader, "parse") as parse_mock:
+            assert loader.load(path) == {"a": "1"}
+
+        parse_mock.assert_not_called()
+
+    def test_registry(self):
+        json_loader = JsonFileLoader()
+        registry = FileLoaderRegistry(json_loader)
+        loader = DotEnvFileLoader()
+        registry.register(loader)
+        registry.register(loader, [".ENVRC"])
+
+        assert registry.get_loader("/app/.env") is loader
+        assert registry.get_loader("/app/prod.env") is loader
+        assert registry.get_loader("/app/.envrc") is loader
+        assert registry.get_loader("/app/config") is json_loader
+        assert registry.load(self.write(".env", "A=1")) == {"a": "1"}
+
+    def test_default_registry(self):
+        assert isinstance(file_loaders.get_loader("a.yaml"), YamlFileLoader)
+        assert isinstance(file_loaders.get_loader("a.toml"), TomlFileLoader)
+        assert isinstance(file_loaders.get_loader("a.json"), JsonFileLoader)
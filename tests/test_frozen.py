@@ -0,0 +1,92 @@
+import pickle
+import pytest
+
+from voluptuous import Required, Optional
+
+from confgetti.exceptions import FrozenConfigError
+from confgetti.frozen import (
+    FrozenConfig, get_fields, make_config_class, freeze_config)
+
+
+def test_get_fields():
+    assert get_fields([Required('a'), Optional('b'), 'a']) == ('a', 'b')
+    assert get_fields({'a': int}, uppercase=True) == ('A',)
+
+
+def test_make_config_class():
+    config_class = make_config_class(('a', 'b'))
+
+    assert issubclass(config_class, FrozenConfig)
+    assert config_class.__name__ == 'Config'
+    assert config_class.__slots__ == ('a', 'b')
+    assert make_config_class(['a', 'b']) is config_class
+    assert make_config_class(('a', 'b'), 'Other') is not config_class
+
+
+def test_make_config_class_invalid_field():
+    with pytest.raises(ValueError):
+        make_config_class(('a', 'not-valid'))
+
+
+def test_config_values():
+    config = make_config_class(('a', 'b'))(a=1)
+
+    assert config.a == 1
+    assert config.b is None
+    assert list(config) == ['a', 'b']
+    assert config.as_tuple() == (1, None)
+    assert config.as_dict() == {'a': 1, 'b': None}
+    assert repr(config) == 'Config(a=1, b=None)'
+    assert not hasattr(config, '__dict__')
+
+
+def test_config_unknown_field():
+    with pytest.raises(TypeError):
+        make_config_class(('a',))(b=1)
+
+
+def test_config_is_frozen():
+    config = make_config_class(('a',))(a=1)
+
+    with pytest.raises(FrozenConfigError):
+        config.a = 2
+
+    with pytest.raises(FrozenConfigError):
+        config.c = 2
+
+    with pytest.raises(AttributeError):
+        del config.a
+
+    assert config.a == 1
+
+
+def test_config_equality_and_hash():
+    config_class = make_config_class(('a', 'b'))
+
+    assert config_class(a=1, b='x') == config_class(a=1, b='x')
+    assert config_class(a=1) != config_class(a=2)
+    assert config_class(a=1) != make_config_class(('a', 'b'), 'Other')(a=1)
+    assert len({config_class(a=1), config_class(a=1)}) == 1
+
+    with pytest.raises(TypeError):
+        hash(config_class(a=[1]))
+
+
+def test_replace():
+    config = make_config_class(('a', 'b'))(a=1, b=2)
+    replaced = config.replace(b=3)
+
+    assert replaced.as_dict() == {'a': 1, 'b': 3}
+    assert config.b == 2
+
+
+def test_pickle():
+    config = make_config_class(('a',))(a=1)
+
+    assert pickle.loads(pickle.dumps(config)) == config
+
+
+def test_freeze_config():
+    config = freeze_config({'A': 1, 'B': 2}, keys=['a', 'c'], uppercase=True)
+
+    assert config.as_dict() == {'A': 1, 'C': None, 'B': 2}
@@ -0,0 +1,69 @@
+import sys
+import json
+import subprocess
+import unittest
+
+import confgetti
+
+
+def get_imported_modules(code):
+    code += (
+        '\nimport sys, json'
+        '\nprint(json.dumps(sorted(sys.modules)))'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code])
+
+    return set(json.loads(output.decode().splitlines()[-1]))
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def test_env_only_load_does_not_import_consul(self):
+        modules = get_imported_modules(
+            'import os, sys, types\n'
+            'os.environ["LAZY_HOST"] = "localhost"\n'
+            'sys.modules["lazy_config"] = types.ModuleType("lazy_config")\n'
+            'from confgetti import load_and_validate_config\n'
+            'load_and_validate_config("lazy_config", "LAZY", keys=["host"])\n'
+            'assert sys.modules["lazy_config"].host == "localhost"'
+        )
+
+        assert 'confgetti.load' in modules
+        assert modules.isdisjoint({
+            'consul', 'requests', 'voluptuous', 'confgetti.base',
+            'confgetti.remote'})
+
+    def test_name_access_imports_module(self):
+        modules = get_imported_modules('import confgetti\nconfgetti.Confgetti')
+
+        assert {'consul', 'requests', 'confgetti.base'} <= modules
+
+    def test_public_names(self):
+        from confgetti.base import Confgetti
+        from confgetti.validation import CachedSchema
+
+        assert confgetti.Confgetti is Confgetti
+        assert confgetti.CachedSchema is CachedSchema
+        assert vars(confgetti)['Confgetti'] is Confgetti
+        assert set(confgetti.__all__) <= set(dir(confgetti))
+
+        for name in confgetti.__all__:
+            assert getattr(confgetti, name) is not None
+
+    def test_submodule_access_after_package_import(self):
+        modules = get_imported_modules(
+            'import confgetti\n'
+            'assert confgetti.remote.ConsulInterface is not None\n'
+            'assert confgetti.load.load_and_validate_config is not None\n'
+        )
+
+        assert {'confgetti.remote', 'confgetti.load'} <= modules
+
+    def test_submodule_names(self):
+        from confgetti import base
+
+        assert confgetti.base is base
+        assert 'remote' in dir(confgetti)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            confgetti.missing
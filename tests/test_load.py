@@ -1,22 +1,49 @@
 import unittest
 import logging
+import types
 import sys
 import os
+import shutil
+import pytest
+import tempfile
 import responses
 
-from voluptuous import Schema, Coerce
+from voluptuous import (
+    ALLOW_EXTRA, Schema, Coerce, Required, Optional, MultipleInvalid)
 from unittest.mock import Mock, patch
 
 
-from fixtures import make_namespaced_responses
+from fixtures import (
+    make_namespaced_responses,
+    make_namespaced_prefix_response,
+    make_nested_prefix_response,
+    make_txn_response
+)
 
 from confgetti.load import (
     set_values,
     load_from_json,
+    load_from_file,
     load_from_env,
     load_from_config_server,
-    load_and_validate_config
+    load_from_snapshot,
+    load_tree_from_config_server,
+    select_keys,
+    load_config,
+    refresh_config,
+    load_and_validate_config,
+    LazyConfig,
+    Source,
+    EnvSource,
+    FileSource,
+    ConsulSource,
+    SnapshotSource,
+    ValuesSource,
+    SourceChain
 )
+from confgetti.base import encode_raw_values
+from confgetti.environment import EnvironmentIndex
+from confgetti.stats import Stats
 
 
 class SetValuesTestCase(unittest.TestCase):
@@ -66,6 +93,60 @@ class LoadFromJsonTestCase(unittest.TestCase):
         config = load_from_json("VALID_JSON")
         self.assertDictEqual(config, {"a": 1, "b": "abc"})
 
+    def test_valid_json_selected_keys(self):
+        os.environ["VALID_JSON"] = self.valid_json
+        config = load_from_json("VALID_JSON", keys=["B"], uppercase=True)
+        self.assertDictEqual(config, {"b": "abc"})
+
+
+class LoadFromFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+
+        with open(path, "w") as f:
+            f.write(content)
+
+        return path
+
+    def test_load_by_extension(self):
+        files = {
+            "config.json": '{"a": 1}',
+            "config.conf": '{"a": 1}',
+            ".env": "A=1",
+        }
+
+        for name, content in files.items():
+            path = self.write(name, content)
+            expected = {"a": "1"} if name == ".env" else {"a": 1}
+
+            self.assertDictEqual(
+                load_from_file("CONF", {"CONF": path}), expected)
+
+    def test_load_yaml_by_extension(self):
+        pytest.importorskip("yaml")
+        path = self.write("config.yaml", "a: 1")
+
+        self.assertDictEqual(load_from_file("CONF", {"CONF": path}), {"a": 1})
+
+    def test_load_toml_by_extension(self):
+        try:
+            import tomllib  # noqa: F401
+        except ImportError:
+            pytest.importorskip("toml")
+
+        path = self.write("config.toml", "a = 1")
+
+        self.assertDictEqual(load_from_file("CONF", {"CONF": path}), {"a": 1})
+
+    def test_no_file(self):
+        self.assertDictEqual(load_from_file("CONF", {}), {})
+
 
 class LoadFromEnvTestCase(unittest.TestCase):
     def test_load_from_env(self):
@@ -78,12 +159,23 @@ class LoadFromEnvTestCase(unittest.TestCase):
 
         self.assertDictEqual(config, {"a_b": "abc", "c_d": "123"})
 
+    def test_load_from_environment_index(self):
+        environ = EnvironmentIndex({
+            "PREFIX_A_B": "abc",
+            "WRONG_PREFIX_E": "def"
+        })
+
+        config = load_from_env("PREFIX", environ)
+
+        self.assertDictEqual(config, {"a_b": "abc"})
+        self.assertDictEqual(load_from_file("PREFIX", environ), {})
+
 
 class LoadAndValidateConfigTestCase(unittest.TestCase):
     def setUp(self):
-        self.load_from_json_patcher = patch(
-            "confgetti.load.load_from_json")
-        self.load_from_json_mock = self.load_from_json_patcher.start()
+        self.load_from_file_patcher = patch(
+            "confgetti.load.load_from_file")
+        self.load_from_file_mock = self.load_from_file_patcher.start()
         self.load_from_env_patcher = patch("confgetti.load.load_from_env")
         self.load_from_env_mock = self.load_from_env_patcher.start()
         self.load_from_config_server_patcher = patch(
@@ -94,33 +186,34 @@ class LoadAndValidateConfigTestCase(unittest.TestCase):
         self.schema_mock = Mock()
 
     def tearDown(self):
-        self.load_from_json_patcher.stop()
+        self.load_from_file_patcher.stop()
         self.load_from_env_patcher.stop()
+        self.load_from_config_server_patcher.stop()
         self.set_values_patcher.stop()
 
     def test_no_config(self):
-        self.load_from_json_mock.return_value = {}
+        self.load_from_file_mock.return_value = {}
         self.load_from_env_mock.return_value = {}
         load_and_validate_config("conf", "CONF", self.schema_mock)
-        self.load_from_json_mock.assert_called_once_with("CONF")
-        self.load_from_env_mock.assert_called_once_with("CONF")
+        self.load_from_file_mock.assert_called_once_with("CONF", None)
+        self.load_from_env_mock.assert_called_once_with("CONF", None)
         self.schema_mock.assert_called_once_with({})
         self.set_values_mock.assert_called_once_with(
             "conf", self.schema_mock.return_value)
 
     def test_config_overrides(self):
-        self.load_from_json_mock.return_value = {"a": 1, "b": "abc"}
+        self.load_from_file_mock.return_value = {"a": 1, "b": "abc"}
         self.load_from_env_mock.return_value = {"a": "def", "c": 3}
         load_and_validate_config("conf", "CONF", self.schema_mock)
-        self.load_from_json_mock.assert_called_once_with("CONF")
-        self.load_from_env_mock.assert_called_once_with("CONF")
+        self.load_from_file_mock.assert_called_once_with("CONF", None)
+        self.load_from_env_mock.assert_called_once_with("CONF", None)
         self.schema_mock.assert_called_once_with(
             {"a": "def", "b": "abc", "c": 3})
         self.set_values_mock.assert_called_once_with(
             "conf", self.schema_mock.return_value)
 
     def test_load_and_validate_config_uppercase_keys(self):
-        self.load_from_json_mock.return_value = {"b": "abc"}
+        self.load_from_file_mock.return_value = {"b": "abc"}
         self.load_from_env_mock.return_value = {"a": "def", "c": 3}
         load_and_validate_config(
             "conf", "CONF", self.schema_mock, uppercase=True
@@ -129,8 +222,20 @@ class LoadAndValidateConfigTestCase(unittest.TestCase):
         self.schema_mock.assert_called_once_with(
             {"A": "def", "B": "abc", "C": 3})
 
+    def test_load_and_validate_config_stream_json(self):
+        self.load_from_file_mock.return_value = {"b": "abc"}
+        self.load_from_env_mock.return_value = {}
+        self.load_from_config_server_mock.return_value = {}
+        _schema = Schema({"b": str})
+
+        load_and_validate_config("conf", "CONF", _schema, stream_json=True)
+
+        self.load_from_file_mock.assert_called_once_with(
+            "CONF", None, ["b"], False)
+        self.set_values_mock.assert_called_once_with("conf", {"b": "abc"})
+
     def test_load_and_validate_with_schema(self):
-        self.load_from_json_mock.return_value = {}
+        self.load_from_file_mock.return_value = {}
         self.load_from_env_mock.return_value = {}
         self.load_from_config_server_mock.return_value = {"a": "def", "b": "3"}
 
@@ -148,7 +253,7 @@ class LoadAndValidateConfigTestCase(unittest.TestCase):
         )
 
     def test_load_and_validate_with_list_keys_but_no_schema(self):
-        self.load_from_json_mock.return_value = {}
+        self.load_from_file_mock.return_value = {}
         self.load_from_env_mock.return_value = {}
         self.load_from_config_server_mock.return_value = {"a": "def", "b": "z"}
         
@@ -161,21 +266,319 @@ class LoadAndValidateConfigTestCase(unittest.TestCase):
             'conf', {'a': 'def', 'b': 'z'}
         )
 
+    def test_load_config_with_config_server_values(self):
+        self.load_from_file_mock.return_value = {"b": "abc"}
+        self.load_from_env_mock.return_value = {"c": 3}
+
+        config = load_config(
+            "CONF", keys=["a"], config_server_values={"a": "def"})
+
+        self.load_from_config_server_mock.assert_not_called()
+        self.set_values_mock.assert_not_called()
+        self.assertDictEqual(config, {"a": "def", "b": "abc", "c": 3})
+
+    def test_config_server_is_not_asked_for_resolved_keys(self):
+        self.load_from_file_mock.return_value = {"b": "abc"}
+        self.load_from_env_mock.return_value = {"a": "def"}
+
+        config = load_config("CONF", keys=["a", "b"])
+
+        self.load_from_config_server_mock.assert_not_called()
+        self.assertDictEqual(config, {"a": "def", "b": "abc"})
+
+    def test_config_server_is_asked_for_unresolved_keys(self):
+        self.load_from_file_mock.return_value = {}
+        self.load_from_env_mock.return_value = {"a": "def"}
+        self.load_from_config_server_mock.return_value = {"a": 1, "b": 2}
+
+        config = load_config("CONF", keys={"a": int, "b": int})
+
+        self.load_from_config_server_mock.assert_called_once_with(
+            "CONF", {"b": int}, True, None, None, None, False)
+        self.assertDictEqual(config, {"a": "def", "b": 2})
+
+    def test_load_config_with_sources(self):
+        class CustomSource(Source):
+            def load(self, env_var, keys=None, uppercase=False, environ=None):
+                return {key: env_var for key in keys}
+
+        snapshot_store = Mock()
+        snapshot_store.load.return_value = encode_raw_values({"c": "3"})
+        self.load_from_env_mock.return_value = {"a": "def"}
+
+        config = load_and_validate_config(
+            "conf", "CONF", keys=["a", "b", "c", "d"], sources=[
+                EnvSource(),
+                ValuesSource({"b": "abc", "a": "ignored"}),
+                SnapshotSource(snapshot_store),
+                CustomSource(),
+                ConsulSource()
+            ])
+
+        self.assertIsNone(config)
+        self.load_from_file_mock.assert_not_called()
+        self.load_from_config_server_mock.assert_not_called()
+        self.set_values_mock.assert_called_once_with(
+            "conf", {"a": "def", "b": "abc", "c": "3", "d": "CONF"})
+
+    def test_load_and_validate_config_frozen(self):
+        module = types.ModuleType("frozen_conf")
+        sys.modules["frozen_conf"] = module
+        self.addCleanup(sys.modules.pop, "frozen_conf")
+        self.load_from_file_mock.return_value = {"b": "abc"}
+        self.load_from_env_mock.return_value = {"a": "def"}
+
+        load_and_validate_config(
+            "frozen_conf", "CONF", Schema({"a": str, Optional("b"): str,
+                                           Optional("c"): int}),
+            frozen=True)
+
+        self.set_values_mock.assert_not_called()
+        self.load_from_config_server_mock.assert_called_once_with(
+            "CONF", ["c"], True, None, None, None, False)
+        assert module.config.as_dict() == {"a": "def", "b": "abc", "c": None}
+
+    def test_load_and_validate_config_lazy_and_frozen(self):
+        with self.assertRaises(ValueError):
+            load_and_validate_config("conf", "CONF", lazy=True, frozen=True)
+
+    @patch("sys.version_info", (3, 6, 9))
+    def test_lazy_config_requires_python_37(self):
+        module = types.ModuleType("old_lazy_config")
+        module.a = "default"
+        sys.modules["old_lazy_config"] = module
+
+        try:
+            with self.assertRaises(RuntimeError):
+                LazyConfig("old_lazy_config", "CONF", keys=["a"]).install()
+        finally:
+            del sys.modules["old_lazy_config"]
+
+        assert module.a == "default"
+
+    def test_load_and_validate_config_lazy_and_nested(self):
+        with self.assertRaises(ValueError):
+            load_and_validate_config("conf", "CONF", lazy=True, nested=True)
+
+    def test_load_nested_from_snapshot(self):
+        snapshot_store = Mock()
+        snapshot_store.load.return_value = encode_raw_values({
+            "db/host": "localhost", "db/port": "5432", "debug": "true"})
+
+        self.assertEqual(
+            load_from_snapshot(
+                "CONF", [Required("db")], snapshot_store, nested=True),
+            {"db": {"host": "localhost", "port": "5432"}})
+        self.assertEqual(
+            SnapshotSource(snapshot_store, nested=True).load("CONF"), {
+                "db": {"host": "localhost", "port": "5432"},
+                "debug": "true"})
+
+    def test_load_config_stats(self):
+        self.load_from_file_mock.return_value = {}
+        self.load_from_env_mock.return_value = {}
+        self.load_from_config_server_mock.return_value = {"a": "1"}
+        stats = Stats()
+
+        load_and_validate_config(
+            "conf", "CONF", Schema({"a": Coerce(int)}), stats=stats)
+
+        self.load_from_config_server_mock.assert_called_once_with(
+            "CONF", ["a"], True, None, stats, None, False)
+        self.assertEqual(set(stats.timings), {
+            "source.env", "source.file", "source.consul", "validation"})
+
+    def test_source_chain_without_keys(self):
+        self.load_from_file_mock.return_value = {"a": 1, "b": 2}
+        self.load_from_env_mock.return_value = {"a": "def"}
+        chain = SourceChain([EnvSource(), FileSource(stream=True)])
+
+        self.assertDictEqual(
+            chain.load("CONF", uppercase=True), {"A": "def", "B": 2})
+        self.load_from_file_mock.assert_called_once_with("CONF", None)
+
+    def test_source_chain_with_empty_keys(self):
+        self.load_from_file_mock.return_value = {"b": 2}
+        self.load_from_env_mock.return_value = {"bar": "1"}
+        chain = SourceChain([EnvSource(), FileSource(stream=True)])
+
+        self.assertDictEqual(chain.load("CONF", keys=[]), {"bar": "1", "b": 2})
+        self.load_from_env_mock.assert_called_once_with("CONF", None)
+        self.load_from_file_mock.assert_called_once_with("CONF", None)
+
+    def test_load_with_schema_without_keys(self):
+        self.load_from_env_mock.return_value = {"bar": "1"}
+
+        load_and_validate_config(
+            "conf", "CONF", Schema({}, extra=ALLOW_EXTRA))
+
+        self.set_values_mock.assert_called_once_with("conf", {"bar": "1"})
+        self.load_from_config_server_mock.assert_not_called()
+
+    def test_load_from_snapshot_and_refresh(self):
+        self.load_from_file_mock.return_value = {}
+        self.load_from_env_mock.return_value = {}
+        self.load_from_config_server_mock.return_value = {"a": "new", "b": 4}
+        snapshot_store = Mock()
+        snapshot_store.load.return_value = encode_raw_values(
+            {"a": "old", "b": "3"})
+        _schema = Schema({"a": str, "b": Coerce(int)})
+
+        thread = load_and_validate_config(
+            "conf", "CONF", _schema, snapshot_store=snapshot_store)
+        thread.join()
+
+        self.assertEqual(self.set_values_mock.call_args_list, [
+            unittest.mock.call("conf", {"a": "old", "b": 3}),
+            unittest.mock.call("conf", {"a": "new", "b": 4}),
+        ])
+        self.load_from_config_server_mock.assert_called_once_with(
+            "CONF", ["a", "b"], True, snapshot_store, None, None, False)
+
+    def test_load_from_invalid_snapshot(self):
+        self.load_from_file_mock.return_value = {}
+        self.load_from_env_mock.return_value = {}
+        self.load_from_config_server_mock.return_value = {"b": 4}
+        snapshot_store = Mock()
+        snapshot_store.load.return_value = encode_raw_values(
+            {"b": "not int"})
+        _schema = Schema({"b": Coerce(int)})
+
+        thread = load_and_validate_config(
+            "conf", "CONF", _schema, snapshot_store=snapshot_store)
+
+        self.assertIsNone(thread)
+        self.set_values_mock.assert_called_once_with("conf", {"b": 4})
+
+    def test_load_without_snapshot(self):
+        self.load_from_file_mock.return_value = {}
+        self.load_from_env_mock.return_value = {}
+        self.load_from_config_server_mock.return_value = {"b": 4}
+        snapshot_store = Mock()
+        snapshot_store.load.return_value = None
+
+        thread = load_and_validate_config(
+            "conf", "CONF", keys=["b"], snapshot_store=snapshot_store)
+
+        self.assertIsNone(thread)
+        self.set_values_mock.assert_called_once_with("conf", {"b": 4})
+
+    def test_refresh_error_is_logged(self):
+        self.load_from_file_mock.side_effect = Exception
+
+        with self.assertLogs("confgetti.load", logging.ERROR):
+            refresh_config("conf", "CONF").join()
+
+        self.set_values_mock.assert_not_called()
+
     def test_validation_error(self):
-        self.load_from_json_mock.return_value = {}
+        self.load_from_file_mock.return_value = {}
         self.load_from_env_mock.return_value = {}
         self.schema_mock.side_effect = Exception
         with self.assertRaises(Exception):
             load_and_validate_config("conf", "CONF", self.schema_mock)
 
 
+@unittest.skipIf(sys.version_info < (3, 7),
+                 'module __getattr__ requires Python 3.7')
+class LazyConfigTestCase(unittest.TestCase):
+    def setUp(self):
+        self.module = types.ModuleType("lazy_config")
+        self.module.a = "default"
+        self.module.other = 1
+        sys.modules["lazy_config"] = self.module
+
+        self.load_from_file_patcher = patch(
+            "confgetti.load.load_from_file", return_value={"b": "2"})
+        self.load_from_file_mock = self.load_from_file_patcher.start()
+        self.load_from_env_patcher = patch(
+            "confgetti.load.load_from_env", return_value={"a": "env"})
+        self.load_from_env_mock = self.load_from_env_patcher.start()
+        self.confgetti_mock = Mock()
+        self.confgetti_mock.return_value.get_variable.return_value = "5"
+        self.confgetti_patcher = patch.object(
+            LazyConfig, "confgetti_class", self.confgetti_mock)
+        self.confgetti_patcher.start()
+
+    def tearDown(self):
+        self.load_from_file_patcher.stop()
+        self.load_from_env_patcher.stop()
+        self.confgetti_patcher.stop()
+        del sys.modules["lazy_config"]
+
+    def test_load_and_validate_config_lazy(self):
+        _schema = Schema({
+            "a": str,
+            Required("b"): Coerce(int),
+            Optional("c", default=3): Coerce(int),
+            "d": Coerce(int)
+        })
+
+        lazy_config = load_and_validate_config(
+            "lazy_config", "CONF", _schema, lazy=True)
+
+        self.assertIsInstance(lazy_config, LazyConfig)
+        self.assertNotIn("a", vars(self.module))
+        self.load_from_env_mock.assert_not_called()
+
+        self.assertEqual(self.module.a, "env")
+        self.assertEqual(self.module.b, 2)
+        self.assertEqual(self.module.d, 5)
+        self.assertEqual(self.module.other, 1)
+        self.assertEqual(vars(self.module)["b"], 2)
+        self.load_from_env_mock.assert_called_once_with("CONF", None)
+        self.load_from_file_mock.assert_called_once_with("CONF", None)
+        self.confgetti_mock.return_value.get_variable.assert_any_call(
+            "d", path="CONF", convert_to=None, use_env=False)
+
+    def test_missing_key_uses_default_or_raises(self):
+        self.confgetti_mock.return_value.get_variable.return_value = None
+        self.load_from_env_mock.return_value = {}
+        self.module.x = "default"
+
+        LazyConfig("lazy_config", "CONF", keys={"x": int, "y": int}).install()
+
+        self.assertEqual(self.module.x, "default")
+
+        with self.assertRaises(AttributeError):
+            self.module.y
+
+        with self.assertRaises(AttributeError):
+            self.module.z
+
+    def test_invalid_value_raises(self):
+        _schema = Schema({"b": int})
+        LazyConfig("lazy_config", "CONF", _schema).install()
+
+        with self.assertRaises(MultipleInvalid):
+            self.module.b
+
+    def test_uppercase(self):
+        LazyConfig(
+            "lazy_config", "CONF", keys={"a": str, "b": int}, uppercase=True
+        ).install()
+
+        self.assertEqual(self.module.A, "env")
+        self.assertEqual(self.module.B, "2")
+
+    def test_previous_getattr_is_used(self):
+        self.module.__getattr__ = lambda name: "previous"
+        LazyConfig("lazy_config", "CONF", keys=["a"]).install()
+
+        self.assertEqual(self.module.z, "previous")
+
+    def test_schema_must_be_dict(self):
+        with self.assertRaises(TypeError):
+            LazyConfig("lazy_config", "CONF", Schema(str))
+
+
 class LoadFromConfigServerTestCase(unittest.TestCase):
     @unittest.mock.patch.dict(os.environ, {
         'CONSUL_HOST': 'foobar'
     })
     @responses.activate
     def test_load_from_config_server(self):
-        make_namespaced_responses()
+        make_namespaced_prefix_response()
 
         variables = load_from_config_server(
             namespace='MYAPP',
@@ -199,7 +602,7 @@ class LoadFromConfigServerTestCase(unittest.TestCase):
     })
     @responses.activate
     def test_load_from_config_server_with_conversion_dict(self):
-        make_namespaced_responses()
+        make_namespaced_prefix_response()
         convert_to = {
             'my_string_0': str,
             'my_string_1': str,
@@ -215,6 +618,104 @@ class LoadFromConfigServerTestCase(unittest.TestCase):
         assert variables['my_int'] == 1
         assert variables['my_bool'] is False
         assert variables.get('not_existing') is None
+        assert len(responses.calls) == 1
+
+    @unittest.mock.patch.dict(os.environ, {
+        'CONSUL_HOST': 'foobar'
+    })
+    @responses.activate
+    def test_load_from_config_server_batch(self):
+        make_txn_response()
+
+        variables = ConsulSource(bulk=False, batch=True).load(
+            'MYAPP', ['my_string_0', 'my_int'])
+
+        assert variables == {'my_string_0': 'foo', 'my_int': '1'}
+        assert len(responses.calls) == 1
+        assert responses.calls[0].request.method == 'PUT'
+
+    @unittest.mock.patch.dict(os.environ, {
+        'CONSUL_HOST': 'foobar'
+    })
+    @responses.activate
+    def test_load_from_config_server_without_bulk(self):
+        make_namespaced_responses()
+
+        variables = load_from_config_server(
+            namespace='MYAPP',
+            keys=['my_string_0', 'my_int'],
+            bulk=False
+        )
+
+        assert variables == {'my_string_0': 'foo', 'my_int': '1'}
+        assert len(responses.calls) == 2
+
+    def test_select_keys(self):
+        tree = {"db": {"host": "localhost"}, "debug": "true"}
+
+        assert select_keys(tree) is tree
+        assert select_keys(tree, {Required("db"): None, "missing": None}) \
+            == {"db": {"host": "localhost"}}
+
+    @unittest.mock.patch.dict(os.environ, {
+        'CONSUL_HOST': 'foobar'
+    })
+    @responses.activate
+    def test_load_tree_from_config_server(self):
+        make_nested_prefix_response()
+
+        assert load_tree_from_config_server('MYAPP', ['db', 'missing']) == {
+            'db': {
+                'host': 'localhost',
+                'port': '5432',
+                'replica': {'host': 'replica'}
+            }
+        }
+        assert load_tree_from_config_server('MYAPP')['debug'] == 'true'
+
+    @unittest.mock.patch.dict(os.environ, {
+        'CONSUL_HOST': 'foobar',
+        'MYAPP_DEBUG': 'false'
+    })
+    @responses.activate
+    def test_load_and_validate_nested_config(self):
+        make_nested_prefix_response()
+        module = types.ModuleType("nested_config")
+        sys.modules["nested_config"] = module
+        _schema = Schema({
+            Required("debug"): Coerce(str),
+            Required("db"): {
+                "host": str,
+                "port": Coerce(int),
+                Optional("replica"): {"host": str}
+            },
+            Optional("cache", default={}): {Optional("ttl"): Coerce(int)}
+        })
+
+        try:
+            load_and_validate_config(
+                "nested_config", "MYAPP", _schema, nested=True)
+        finally:
+            del sys.modules["nested_config"]
+
+        assert module.debug == "false"
+        assert module.db == {
+            "host": "localhost", "port": 5432, "replica": {"host": "replica"}}
+        assert module.cache == {}
+        assert len(responses.calls) == 1
+
+    @unittest.mock.patch.dict(os.environ, {
+        'CONSUL_HOST': 'foobar'
+    })
+    @responses.activate
+    def test_load_nested_config_without_keys(self):
+        make_nested_prefix_response()
+
+        config = load_config(
+            "MYAPP", sources=[ConsulSource(nested=True)])
+
+        assert config["db"]["port"] == "5432"
+        assert config["cache"] == {}
 
 
 def run_tests():
@@ -0,0 +1,126 @@
+import logging
+import pytest
+
+from unittest import mock
+
+from confgetti.logger import DuplicateFilter, RateLimitFilter
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger('confgetti.tests.rate_limit')
+    yield logger
+    logger.filters.clear()
+
+
+def test_duplicate_filter(logger, caplog):
+    logger.addFilter(DuplicateFilter())
+
+    logger.warning('foo')
+    logger.warning('foo')
+    logger.warning('bar')
+
+    assert [record.msg for record in caplog.records] == ['foo', 'bar']
+
+
+def test_defaults():
+    rate_limit_filter = RateLimitFilter()
+
+    assert rate_limit_filter.rate == 0.1
+    assert rate_limit_filter.burst == 10
+    assert rate_limit_filter.max_keys == 512
+    assert rate_limit_filter.summary_interval == 60
+
+
+def test_same_template_is_limited_together(logger, caplog):
+    logger.addFilter(RateLimitFilter(rate=0, burst=2))
+
+    for host in ('a', 'b', 'c', 'd'):
+        logger.warning('Not connected to "%s"', host)
+
+    logger.error('Not connected to "%s"', 'e')
+
+    assert [record.getMessage() for record in caplog.records] == [
+        'Not connected to "a"',
+        'Not connected to "b"',
+        'Not connected to "e"'
+    ]
+
+
+def test_suppressed_records_are_not_formatted(logger, caplog):
+    class Value(object):
+        formatted = 0
+
+        def __str__(self):
+            Value.formatted += 1
+            return 'value'
+
+    logger.addFilter(RateLimitFilter(rate=0, burst=1))
+
+    logger.warning('value %s', Value())
+    formatted = Value.formatted
+    logger.warning('value %s', Value())
+
+    assert Value.formatted == formatted
+
+
+@mock.patch('time.monotonic')
+def test_bucket_is_refilled(monotonic_mock, logger, caplog):
+    monotonic_mock.return_value = 0
+    logger.addFilter(RateLimitFilter(rate=1, burst=1))
+
+    logger.warning('foo')
+    logger.warning('foo')
+    monotonic_mock.return_value = 1
+    logger.warning('foo')
+
+    assert [record.getMessage() for record in caplog.records] == [
+        'foo', 'Suppressed 1 messages like: foo', 'foo'
+    ]
+
+
+@mock.patch('time.monotonic')
+def test_periodic_summary(monotonic_mock, logger, caplog):
+    monotonic_mock.return_value = 0
+    logger.addFilter(RateLimitFilter(
+        rate=0, burst=1, summary_interval=10))
+
+    logger.warning('foo')
+    logger.warning('foo')
+    logger.warning('foo')
+    monotonic_mock.return_value = 10
+    logger.error('bar')
+
+    assert [(record.levelno, record.getMessage())
+            for record in caplog.records] == [
+        (logging.WARNING, 'foo'),
+        (logging.WARNING, 'Suppressed 2 messages like: foo'),
+        (logging.ERROR, 'bar')
+    ]
+
+
+def test_least_recently_used_templates_are_evicted(logger, caplog):
+    rate_limit_filter = RateLimitFilter(rate=0, burst=1, max_keys=2)
+    logger.addFilter(rate_limit_filter)
+
+    logger.warning('foo')
+    logger.warning('bar')
+    logger.warning('foo')
+    logger.warning('baz')
+    logger.warning('bar')
+
+    assert len(rate_limit_filter._buckets) == 2
+    assert [record.msg for record in caplog.records] == [
+        'foo', 'bar', 'baz', 'bar'
+    ]
+
+
+def test_reset(logger, caplog):
+    rate_limit_filter = RateLimitFilter(rate=0, burst=1)
+    logger.addFilter(rate_limit_filter)
+
+    logger.warning('foo')
+    rate_limit_filter.reset()
+    logger.warning('foo')
+
+    assert len(caplog.records) == 2
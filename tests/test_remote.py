@@ -1,11 +1,33 @@
 import os
+import json
+import time
+import signal
 import pytest
 import responses
 
 from unittest import TestCase, mock
-from fixtures import CONSUL_DUMMY_RESPONSE, CONSUL_DUMMY_RESPONSE_LEVELED
+from fixtures import (
+    CONSUL_DUMMY_RESPONSE,
+    CONSUL_DUMMY_RESPONSE_LEVELED,
+    CONSUL_DUMMY_RESPONSES_NAMESPACED,
+    make_namespaced_prefix_response,
+    make_txn_response
+)
+from consul import ACLPermissionDenied, ConsulException
+from requests import Request
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.exceptions import ConnectionError, ReadTimeout
 
-from confgetti.remote import ConsulInterface
+from confgetti.remote import (
+    ConsulInterface,
+    CachingConsulInterface,
+    CircuitBreaker,
+    CircuitOpenError,
+    ConnectionRegistry,
+    TimeoutHTTPAdapter,
+    parse_duration
+)
+from confgetti.stats import Stats
 from confgetti.exceptions import UndefinedConnectionError
 
 
@@ -58,6 +80,176 @@ class ConsulInterfaceTestCase(TestCase):
         assert connection.http.port != dummy_consul_config.get('port')
         assert connection.dc != dummy_consul_config.get('dc')
 
+    def test_create_connection_is_shared(self):
+        dummy_consul_config = {
+            'host': 'shared',
+            'port': 8500,
+            'pool_size': 3,
+            'timeout': 2.5
+        }
+        connection = ConsulInterface().create_connection(dummy_consul_config)
+        adapter = connection.http.session.get_adapter('https://shared')
+
+        assert ConsulInterface().create_connection(
+            dict(dummy_consul_config, port='8500')) is connection
+        assert ConsulInterface().create_connection(
+            dict(dummy_consul_config, dc='other')) is not connection
+        assert adapter._pool_maxsize == 3
+        assert adapter.timeout == 2.5
+
+    @mock.patch.dict(os.environ, {
+        'CONSUL_POOL_SIZE': '30',
+        'CONSUL_TIMEOUT': '1.5'
+    })
+    def test_default_config_pool_size_and_timeout(self):
+        ci = ConsulInterface()
+
+        assert ci.default_consul_config['pool_size'] == 30
+        assert ci.default_consul_config['timeout'] == 1.5
+
+    @mock.patch('requests.adapters.HTTPAdapter.send')
+    def test_timeout_is_applied(self, send_mock):
+        adapter = TimeoutHTTPAdapter(4)
+        request = Request('GET', 'http://consul:8500/v1/kv/key').prepare()
+
+        adapter.send(request)
+        adapter.send(request, timeout=1)
+
+        assert send_mock.call_args_list == [
+            mock.call(request, timeout=4),
+            mock.call(request, timeout=1)
+        ]
+
+    def test_timeout_of_blocking_query_includes_wait(self):
+        request = Request(
+            'GET', 'http://consul:8500/v1/kv/MYAPP/',
+            params={'recurse': 1, 'index': 5, 'wait': '1m20s'}).prepare()
+
+        assert TimeoutHTTPAdapter(1).get_timeout(request) == (1, 86)
+        assert TimeoutHTTPAdapter((2, 1)).get_timeout(request) == (2, 86)
+        assert TimeoutHTTPAdapter((2, None)).get_timeout(request) == (
+            2, None)
+        assert TimeoutHTTPAdapter(None).get_timeout(request) is None
+
+    def test_parse_duration(self):
+        assert parse_duration('30s') == 30
+        assert parse_duration('1h1m') == 3660
+        assert parse_duration('500ms') == 0.5
+        assert parse_duration('30') is None
+        assert parse_duration('30s garbage') is None
+
+    @mock.patch('time.sleep')
+    def test_request_retries_server_error(self, sleep_mock):
+        stats = Stats()
+        ci = ConsulInterface(stats=stats, retries=1)
+        ci.circuit_breaker = CircuitBreaker(failure_threshold=3)
+        method = mock.Mock(side_effect=ConsulException('500 No leader'))
+
+        with pytest.raises(ConnectionError) as error:
+            ci._request(method)
+
+        assert isinstance(error.value.__cause__, ConsulException)
+        assert method.call_count == 2
+        assert stats.counters['consul.errors'] == 2
+        assert ci.circuit_breaker.failures == 2
+
+    def test_request_client_error_is_not_failure(self):
+        ci = ConsulInterface()
+        ci.circuit_breaker = CircuitBreaker()
+        ci.circuit_breaker.failures = 2
+        method = mock.Mock(side_effect=ACLPermissionDenied)
+
+        with pytest.raises(ACLPermissionDenied):
+            ci._request(method)
+
+        assert method.call_count == 1
+        assert ci.circuit_breaker.failures == 0
+
+    def test_registry_reset_after_fork(self):
+        registry = ConnectionRegistry()
+        connection = registry.get_connection({'host': 'forked'})
+
+        with mock.patch('os.getpid', return_value=-1):
+            assert registry.get_connection({'host': 'forked'}) \
+                is not connection
+
+    def test_registry_reset_after_fork_while_lock_is_held(self):
+        registry = ConnectionRegistry()
+        connection = registry.get_connection({'host': 'forked'})
+        registry._lock.acquire()
+
+        registry.reset_after_fork()
+
+        assert registry.get_connection({'host': 'forked'}) \
+            is not connection
+
+    @pytest.mark.skipif(
+        not hasattr(os, 'register_at_fork'), reason='requires os.fork')
+    def test_child_does_not_deadlock_on_lock_held_at_fork(self):
+        from confgetti.remote import connection_registry
+
+        with connection_registry._lock:
+            pid = os.fork()
+
+            if pid == 0:
+                connection_registry.get_connection({'host': 'child'})
+                os._exit(0)
+
+        deadline = time.monotonic() + 5
+
+        while True:
+            waited, status = os.waitpid(pid, os.WNOHANG)
+
+            if waited:
+                break
+
+            if time.monotonic() > deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                pytest.fail('child process is deadlocked')
+
+            time.sleep(0.01)
+
+        assert status == 0
+
+    def test_registry_reset(self):
+        registry = ConnectionRegistry()
+        connection = registry.get_connection({'host': 'reset'})
+        registry.reset()
+
+        assert registry.get_connection({'host': 'reset'}) is not connection
+
+    def test_resize_pool(self):
+        ci = ConsulInterface()
+        ci.create_connection({'host': 'resized', 'timeout': 3})
+
+        ci.resize_pool(20)
+        adapter = ci.connection.http.session.get_adapter('http://resized')
+        ci.resize_pool(5)
+
+        assert adapter._pool_maxsize == 20
+        assert adapter.timeout == 3
+        assert ci.connection.http.session.get_adapter(
+            'https://resized') is adapter
+
+    def test_resize_pool_closes_replaced_adapter(self):
+        ci = ConsulInterface()
+        ci.create_connection({'host': 'resized-closed'})
+        adapter = ci.connection.http.session.get_adapter('http://')
+
+        with mock.patch.object(adapter, 'close') as close_mock:
+            ci.resize_pool(DEFAULT_POOLSIZE + 1)
+
+        close_mock.assert_called_once_with()
+        assert ci.connection.http.session.get_adapter(
+            'http://')._pool_maxsize == DEFAULT_POOLSIZE + 1
+
+    def test_resize_pool_without_connection(self):
+        ci = ConsulInterface()
+        ci.resize_pool(20)
+
+        assert ci.connection is None
+
     def test__check_connection__error_raises(self):
         ci = ConsulInterface()
 
@@ -107,3 +299,416 @@ class ConsulInterfaceTestCase(TestCase):
         ci = ConsulInterface(prepare_connection=True)
 
         assert ci.get_raw_value('my_variable') is None
+
+    @responses.activate
+    def test_get_raw_values(self):
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/MYAPP/?recurse=1',
+            json=CONSUL_DUMMY_RESPONSES_NAMESPACED,
+            headers={'X-Consul-Index': '924'},
+            status=200
+        )
+
+        stats = Stats()
+        ci = ConsulInterface(prepare_connection=True, stats=stats)
+
+        assert ci.get_raw_values('MYAPP') == {
+            'my_string_0': b'foo',
+            'my_string_1': b'bar',
+            'my_int': b'1',
+            'my_bool': b'false'
+        }
+        assert stats.counters == {'consul.requests': 1, 'consul.bytes': 12}
+        assert stats.timings['consul.request'].count == 1
+
+    def test_get_raw_value_connection_error_is_counted(self):
+        stats = Stats()
+        ci = ConsulInterface(stats=stats, retries=0)
+        ci.create_connection({'host': 'unreachable-stats', 'port': 8500})
+
+        with pytest.raises(Exception):
+            ci.get_raw_value('my_variable')
+
+        assert stats.counters == {'consul.requests': 1, 'consul.errors': 1}
+
+    @mock.patch.dict(os.environ, {'CONSUL_RETRIES': '5'})
+    def test_retries_from_env(self):
+        assert ConsulInterface().retries == 5
+        assert ConsulInterface(retries=1).retries == 1
+
+    @mock.patch('time.sleep')
+    def test_request_retries_with_backoff(self, sleep_mock):
+        stats = Stats()
+        ci = ConsulInterface(stats=stats, retries=2)
+        method = mock.Mock(side_effect=[ConnectionError, ReadTimeout, 'ok'])
+
+        with mock.patch('random.uniform', side_effect=lambda a, b: b):
+            assert ci._request(method, 'key') == 'ok'
+
+        assert method.call_count == 3
+        assert sleep_mock.call_args_list == [mock.call(0.1), mock.call(0.2)]
+        assert stats.counters['consul.retries'] == 2
+        assert stats.counters['consul.errors'] == 2
+
+    def test_retry_delay_is_limited(self):
+        ci = ConsulInterface()
+
+        with mock.patch('random.uniform', side_effect=lambda a, b: b):
+            assert ci.get_retry_delay(10) == ci.retry_backoff_max
+
+    @mock.patch('time.sleep')
+    def test_request_timeout_raises_connection_error(self, sleep_mock):
+        ci = ConsulInterface(retries=1)
+        method = mock.Mock(side_effect=ReadTimeout)
+
+        with pytest.raises(ConnectionError):
+            ci._request(method)
+
+        assert method.call_count == 2
+
+    def test_request_stops_on_open_circuit(self):
+        stats = Stats()
+        ci = ConsulInterface(
+            stats=stats, retries=5,
+            circuit_breaker=CircuitBreaker(failure_threshold=2))
+        method = mock.Mock(side_effect=ConnectionError)
+
+        with mock.patch('time.sleep'), pytest.raises(ConnectionError):
+            ci._request(method)
+
+        with pytest.raises(CircuitOpenError):
+            ci._request(method)
+
+        assert method.call_count == 2
+        assert stats.counters['consul.circuit_open'] == 1
+
+    def test_circuit_breaker_is_shared(self):
+        ci = ConsulInterface()
+        ci.create_connection({'host': 'shared-breaker'})
+        other = ConsulInterface()
+        other.create_connection({'host': 'shared-breaker', 'timeout': 1})
+
+        assert ci.circuit_breaker is other.circuit_breaker
+
+    @responses.activate
+    def test_get_raw_values_empty_prefix(self):
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/MYAPP/?recurse=1',
+            json=[],
+            headers={'X-Consul-Index': '924'},
+            status=404
+        )
+
+        ci = ConsulInterface(prepare_connection=True)
+
+        assert ci.get_raw_values('MYAPP') == {}
+
+    @responses.activate
+    def test_get_raw_values_permission_denied(self):
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/MYAPP/?recurse=1',
+            body='Permission denied',
+            status=403
+        )
+
+        ci = ConsulInterface(prepare_connection=True)
+
+        assert ci.get_raw_values('MYAPP') is None
+
+
+    @responses.activate
+    def test_modify_indexes_are_kept(self):
+        entries = [
+            dict(entry, ModifyIndex=number)
+            for number, entry in enumerate(CONSUL_DUMMY_RESPONSES_NAMESPACED)
+        ]
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/MYAPP/?recurse=1',
+            json=entries,
+            headers={'X-Consul-Index': '924'},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/MYAPP/?recurse=1',
+            json=entries[:2],
+            headers={'X-Consul-Index': '925'},
+            status=200
+        )
+
+        ci = ConsulInterface(prepare_connection=True)
+
+        assert ci.get_prefix_index('MYAPP') is None
+        ci.get_raw_values('MYAPP')
+
+        assert ci.get_prefix_index('MYAPP/') == '924'
+        assert ci.get_modify_index('my_string_1', 'MYAPP') == 1
+        assert ci.get_modify_index('my_bool', 'MYAPP') == 3
+
+        ci.get_raw_values('MYAPP')
+
+        assert ci.get_prefix_index('MYAPP') == '925'
+        assert ci.get_modify_index('my_bool', 'MYAPP') is None
+
+    @responses.activate
+    def test_get_raw_value_keeps_modify_index(self):
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/my_variable',
+            json=[CONSUL_DUMMY_RESPONSE],
+            headers={'X-Consul-Index': '924'},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/my_variable',
+            headers={'X-Consul-Index': '925'},
+            status=404
+        )
+
+        ci = ConsulInterface(prepare_connection=True)
+        ci.get_raw_value('my_variable')
+
+        assert ci.get_modify_index('my_variable') == 924
+
+        ci.get_raw_value('my_variable')
+
+        assert ci.get_modify_index('my_variable') is None
+
+    @responses.activate
+    def test_has_changed(self):
+        make_namespaced_prefix_response('consul')
+        for index in ('924', '925'):
+            responses.add(
+                responses.GET,
+                'http://consul:8500/v1/kv/MYAPP/?keys=True',
+                json=['MYAPP/my_int'],
+                headers={'X-Consul-Index': index},
+                status=200
+            )
+
+        stats = Stats()
+        ci = ConsulInterface(prepare_connection=True, stats=stats)
+
+        assert ci.has_changed('MYAPP') is True
+        assert stats.counters['consul.requests'] == 0
+
+        ci.get_raw_values('MYAPP')
+
+        assert ci.has_changed('MYAPP') is False
+        assert ci.has_changed('MYAPP') is True
+        assert stats.counters['consul.bytes'] == 12
+
+    @responses.activate
+    def test_get_batched_raw_values(self):
+        make_txn_response('consul')
+
+        ci = ConsulInterface(prepare_connection=True)
+        ci.txn_max_operations = 2
+
+        assert ci.get_batched_raw_values([
+            'MYAPP/my_string_0',
+            'MYAPP/my_string',
+            'MYAPP/my_int',
+            'MYAPP/my_int',
+        ]) == {
+            'MYAPP/my_string_0': b'foo',
+            'MYAPP/my_string': None,
+            'MYAPP/my_int': b'1'
+        }
+        assert len(responses.calls) == 2
+        assert ci.get_modify_index('my_int', 'MYAPP') == 924
+        assert json.loads(responses.calls[1].request.body) == [
+            {'KV': {'Verb': 'get-tree', 'Key': 'MYAPP/my_int'}}
+        ]
+
+    @responses.activate
+    def test_get_batched_raw_values_not_permitted(self):
+        for status in (403, 409):
+            responses.add(
+                responses.PUT,
+                'http://consul:8500/v1/txn',
+                body='Permission denied',
+                status=status
+            )
+
+            ci = ConsulInterface(prepare_connection=True)
+
+            assert ci.get_batched_raw_values(['MYAPP/my_int']) is None
+
+
+class CircuitBreakerTestCase(TestCase):
+    def setUp(self):
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=10)
+
+    def test_defaults(self):
+        circuit_breaker = CircuitBreaker()
+
+        assert circuit_breaker.failure_threshold == 5
+        assert circuit_breaker.reset_timeout == 30
+        assert circuit_breaker.is_closed is True
+
+    def test_opens_after_consecutive_failures(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_success()
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.before_request()
+        self.circuit_breaker.record_failure()
+
+        assert self.circuit_breaker.is_closed is False
+
+        with pytest.raises(CircuitOpenError):
+            self.circuit_breaker.before_request()
+
+    @mock.patch('time.monotonic')
+    def test_half_open_probe(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        monotonic_mock.return_value = 110
+
+        self.circuit_breaker.before_request()
+
+        with pytest.raises(CircuitOpenError):
+            self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record_success()
+
+        assert self.circuit_breaker.is_closed is True
+        self.circuit_breaker.before_request()
+
+    @mock.patch('time.monotonic')
+    def test_failed_probe_opens_circuit_again(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        monotonic_mock.return_value = 110
+        self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record_failure()
+
+        assert self.circuit_breaker.opened_at == 110
+
+        with pytest.raises(CircuitOpenError):
+            self.circuit_breaker.before_request()
+
+    def test_reset(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.reset()
+
+        assert self.circuit_breaker.is_closed is True
+        assert self.circuit_breaker.failures == 0
+
+
+class CachingConsulInterfaceTestCase(TestCase):
+    def setUp(self):
+        self.ci = CachingConsulInterface(prepare_connection=True)
+
+    def add_response(self, key='my_variable', status=200):
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/{}'.format(key),
+            json=[CONSUL_DUMMY_RESPONSE] if status == 200 else [],
+            headers={'X-Consul-Index': '924'},
+            status=status
+        )
+
+    def test_defaults(self):
+        assert self.ci.ttl == CachingConsulInterface.cache_ttl
+        assert self.ci.negative_ttl == CachingConsulInterface.cache_negative_ttl
+        assert self.ci.max_size == CachingConsulInterface.cache_max_size
+
+    @responses.activate
+    def test_get_raw_value_cached(self):
+        self.add_response()
+
+        assert self.ci.get_raw_value('my_variable') == b'foo'
+        assert self.ci.get_raw_value('my_variable') == b'foo'
+        assert len(responses.calls) == 1
+        assert self.ci.cache_info() == {
+            'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1
+        }
+
+    @responses.activate
+    def test_cache_hit_ratio(self):
+        self.add_response()
+        self.ci.stats = Stats()
+
+        for _ in range(4):
+            self.ci.get_raw_value('my_variable')
+
+        assert self.ci.stats.cache_hit_ratio == 0.75
+
+    @responses.activate
+    def test_get_raw_value_negative_cached(self):
+        self.add_response(status=404)
+
+        assert self.ci.get_raw_value('my_variable') is None
+        assert self.ci.get_raw_value('my_variable') is None
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_get_raw_value_expired(self):
+        self.add_response()
+
+        with mock.patch('time.monotonic', return_value=0):
+            self.ci.get_raw_value('my_variable')
+
+        with mock.patch('time.monotonic', return_value=self.ci.ttl):
+            self.ci.get_raw_value('my_variable')
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_lru_eviction(self):
+        ci = CachingConsulInterface(prepare_connection=True, max_size=2)
+
+        for key in ['a', 'b', 'a', 'c']:
+            self.add_response(key)
+            ci.get_raw_value(key)
+
+        assert list(ci._cache) == ['a', 'c']
+        assert ci.evictions == 1
+
+    @responses.activate
+    def test_get_raw_values_primes_cache(self):
+        responses.add(
+            responses.GET,
+            'http://consul:8500/v1/kv/MYAPP/?recurse=1',
+            json=CONSUL_DUMMY_RESPONSES_NAMESPACED,
+            headers={'X-Consul-Index': '924'},
+            status=200
+        )
+
+        self.ci.get_raw_values('MYAPP')
+
+        assert self.ci.get_raw_value('my_int', path='MYAPP') == b'1'
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_invalidate(self):
+        self.add_response()
+        self.ci.get_raw_value('my_variable')
+
+        self.ci.invalidate('my_variable')
+        self.ci.get_raw_value('my_variable')
+
+        assert len(responses.calls) == 2
+
+    def test_invalidate_prefix(self):
+        for key_path in ['MYAPP', 'MYAPP/a', 'MYAPP/b/c', 'MYAPP2/a']:
+            self.ci._store(key_path, b'foo', 0)
+
+        self.ci.invalidate_prefix('MYAPP/')
+
+        assert list(self.ci._cache) == ['MYAPP2/a']
+
+        self.ci.invalidate_prefix()
+
+        assert self.ci.cache_info()['size'] == 0
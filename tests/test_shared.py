@@ -0,0 +1,174 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import multiprocessing
+
+from unittest import mock
+
+from confgetti.shared import SharedCache
+
+
+def load_in_process(directory, counter):
+    def load():
+        with counter.get_lock():
+            counter.value += 1
+
+        time.sleep(0.1)
+
+        return {'a': '1'}
+
+    return SharedCache(directory).get_or_load('MYAPP', load)
+
+
+class SharedCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = SharedCache(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @mock.patch.dict(os.environ, {'CONFGETTI_SHARED_DIR': '/tmp/shared'})
+    def test_directory_from_env(self):
+        assert SharedCache().directory == '/tmp/shared'
+
+    def test_get_path(self):
+        assert self.cache.get_path('MYAPP/sub') == os.path.join(
+            self.directory, 'MYAPP%2Fsub.shm')
+
+    @mock.patch.dict(os.environ, {}, clear=True)
+    def test_default_directory_is_per_user(self):
+        directory = SharedCache().directory
+
+        assert os.path.basename(directory) == 'confgetti-{0}'.format(
+            os.getuid())
+
+    def test_get_path_with_scope(self):
+        assert self.cache.get_path('MYAPP', 'abc') == os.path.join(
+            self.directory, 'MYAPP.abc.shm')
+
+    def test_scopes_are_separate(self):
+        self.cache.write('MYAPP', {'a': '1'}, scope='first')
+
+        assert self.cache.read('MYAPP', 'second') is None
+        assert self.cache.read('MYAPP') is None
+        assert self.cache.read('MYAPP', 'first')[2] == {'a': '1'}
+
+    def test_write_creates_private_directory(self):
+        cache = SharedCache(os.path.join(self.directory, 'shared'))
+        cache.write('MYAPP', {'a': '1'})
+
+        assert os.stat(cache.directory).st_mode & 0o777 == 0o700
+
+    def test_write_refuses_directory_writable_by_others(self):
+        os.chmod(self.directory, 0o777)
+
+        with self.assertRaises(PermissionError):
+            self.cache.write('MYAPP', {'a': '1'})
+
+    def test_read_ignores_directory_writable_by_others(self):
+        self.cache.write('MYAPP', {'a': '1'})
+        os.chmod(self.directory, 0o777)
+
+        assert self.cache.read('MYAPP') is None
+
+    @mock.patch('os.getuid', return_value=12345)
+    def test_read_ignores_directory_of_other_user(self, getuid_mock):
+        with open(self.cache.get_path('MYAPP'), 'wb'):
+            pass
+
+        assert self.cache.read('MYAPP') is None
+
+    def test_get_or_load_raises_on_unusable_directory(self):
+        path = os.path.join(self.directory, 'file')
+
+        with open(path, 'wb'):
+            pass
+
+        with self.assertRaises(OSError):
+            SharedCache(path).get_or_load('MYAPP', lambda: {'a': '1'})
+
+    def test_write_and_read(self):
+        assert self.cache.write('MYAPP', {'a': '1', 'b': None}) == 1
+
+        version, written, values = SharedCache(self.directory).read('MYAPP')
+
+        assert version == 1
+        assert written <= time.time()
+        assert values == {'a': '1', 'b': None}
+
+    def test_write_increments_version(self):
+        self.cache.write('MYAPP', {'a': '1' * 100})
+        self.cache.write('MYAPP', {'a': '2'})
+
+        assert self.cache.get_version('MYAPP') == 2
+        assert self.cache.read('MYAPP')[2] == {'a': '2'}
+
+    def test_read_missing(self):
+        assert self.cache.read('MYAPP') is None
+        assert self.cache.get_version('MYAPP') is None
+
+    def test_read_foreign_file(self):
+        with open(self.cache.get_path('MYAPP'), 'wb') as f:
+            f.write(b'x' * 64)
+
+        assert self.cache.read('MYAPP') is None
+
+    def test_read_during_write_retries(self):
+        self.cache.write('MYAPP', {'a': '1'})
+        sequences = iter([3, 4, 4])
+
+        with mock.patch.object(
+                SharedCache, '_read_sequence',
+                side_effect=lambda buffer: next(sequences)):
+            assert self.cache.read('MYAPP')[2] == {'a': '1'}
+
+    def test_read_gives_up_while_writer_holds_sequence(self):
+        self.cache.write('MYAPP', {'a': '1'})
+
+        with mock.patch.object(
+                SharedCache, '_read_sequence', return_value=3):
+            assert self.cache.read('MYAPP') is None
+
+    def test_get_or_load_loads_once(self):
+        load = mock.Mock(return_value={'a': '1'})
+
+        assert self.cache.get_or_load('MYAPP', load) == {'a': '1'}
+        assert self.cache.get_or_load('MYAPP', load) == {'a': '1'}
+        load.assert_called_once_with()
+
+    def test_get_or_load_reloads_expired(self):
+        cache = SharedCache(self.directory, ttl=0)
+        load = mock.Mock(return_value={'a': '1'})
+
+        cache.get_or_load('MYAPP', load)
+        cache.get_or_load('MYAPP', load)
+
+        assert load.call_count == 2
+        assert cache.get_version('MYAPP') == 2
+
+    def test_get_or_load_does_not_share_none(self):
+        load = mock.Mock(return_value=None)
+
+        assert self.cache.get_or_load('MYAPP', load) is None
+        assert self.cache.read('MYAPP') is None
+
+    def test_get_or_load_single_flight_across_processes(self):
+        context = multiprocessing.get_context('fork')
+        counter = context.Value('i', 0)
+        processes = [
+            context.Process(
+                target=load_in_process, args=(self.directory, counter))
+            for _ in range(4)
+        ]
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join()
+
+        assert counter.value == 1
+        assert self.cache.read('MYAPP')[2] == {'a': '1'}
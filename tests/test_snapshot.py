@@ -0,0 +1,112 @@
+import os
+import stat
+import shutil
+import tempfile
+import unittest
+
+from unittest import mock
+
+from confgetti.snapshot import (
+    SnapshotStore,
+    check_private_directory,
+    get_default_directory
+)
+
+
+class SnapshotStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = SnapshotStore(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @mock.patch.dict(os.environ, {
+        'CONFGETTI_SNAPSHOT_DIR': '/tmp/snapshots'
+    })
+    def test_directory_from_env(self):
+        assert SnapshotStore().directory == '/tmp/snapshots'
+
+    def test_get_path(self):
+        assert self.store.get_path('MYAPP/sub') == os.path.join(
+            self.directory, 'MYAPP%2Fsub.snapshot')
+
+    def test_save_and_load(self):
+        self.store.save('MYAPP', {'a': '1', 'b': 'foo'})
+
+        assert os.listdir(self.directory) == ['MYAPP.snapshot']
+        assert SnapshotStore(self.directory).load('MYAPP') == {
+            'a': '1', 'b': 'foo'
+        }
+
+    def test_save_unchanged_values_skips_write(self):
+        self.store.save('MYAPP', {'a': '1'})
+
+        with mock.patch('tempfile.mkstemp') as mkstemp_mock:
+            self.store.save('MYAPP', {'a': '1'})
+
+        mkstemp_mock.assert_not_called()
+
+    def test_save_failure_keeps_previous_snapshot(self):
+        self.store.save('MYAPP', {'a': '1'})
+
+        with mock.patch('os.replace', side_effect=OSError):
+            self.store.save('MYAPP', {'a': '2'})
+
+        assert os.listdir(self.directory) == ['MYAPP.snapshot']
+        assert SnapshotStore(self.directory).load('MYAPP') == {'a': '1'}
+
+    def test_load_missing(self):
+        assert self.store.load('MYAPP') is None
+
+    def test_load_corrupted(self):
+        self.store.save('MYAPP', {'a': '1'})
+
+        with open(self.store.get_path('MYAPP'), 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b'\x00')
+
+        assert SnapshotStore(self.directory).load('MYAPP') is None
+
+    def test_default_directory_is_per_user(self):
+        with mock.patch.dict(os.environ, clear=True):
+            directory = SnapshotStore().directory
+
+        assert directory == get_default_directory('confgetti')
+        assert directory.endswith('confgetti-{}'.format(os.getuid()))
+
+    def test_save_creates_private_directory(self):
+        directory = os.path.join(self.directory, 'nested')
+
+        SnapshotStore(directory).save('MYAPP', {'a': '1'})
+
+        assert stat.S_IMODE(os.stat(directory).st_mode) & 0o077 == 0
+        check_private_directory(directory)
+
+    def test_save_to_unusable_directory_does_not_raise(self):
+        path = os.path.join(self.directory, 'file')
+        open(path, 'w').close()
+        store = SnapshotStore(os.path.join(path, 'snapshots'))
+
+        with self.assertLogs('confgetti.snapshot', 'WARNING'):
+            store.save('MYAPP', {'a': '1'})
+
+        assert store.load('MYAPP') is None
+
+    def test_directory_writable_by_others_is_ignored(self):
+        self.store.save('MYAPP', {'a': '1'})
+        os.chmod(self.directory, 0o777)
+
+        with self.assertLogs('confgetti.snapshot', 'WARNING'):
+            assert SnapshotStore(self.directory).load('MYAPP') is None
+
+            self.store.save('MYAPP', {'a': '2'})
+
+        assert os.listdir(self.directory) == ['MYAPP.snapshot']
+
+    def test_directory_of_other_user_is_ignored(self):
+        self.store.save('MYAPP', {'a': '1'})
+
+        with mock.patch('os.getuid', return_value=os.getuid() + 1):
+            with self.assertLogs('confgetti.snapshot', 'WARNING'):
+                assert SnapshotStore(self.directory).load('MYAPP') is None
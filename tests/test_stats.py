@@ -0,0 +1,72 @@
+import unittest
+
+from unittest import mock
+
+from confgetti.stats import Histogram, Stats
+
+
+class HistogramTestCase(unittest.TestCase):
+    def test_observe(self):
+        histogram = Histogram([0.1, 1])
+
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+
+        assert histogram.as_dict() == {
+            'count': 4,
+            'sum': 2.65,
+            'max': 2,
+            'buckets': {0.1: 2, 1: 3, float('inf'): 4}
+        }
+
+
+class StatsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.stats = Stats()
+
+    def test_as_dict(self):
+        self.stats.timing('source.env', 0.001)
+        self.stats.increment('consul.requests')
+        self.stats.increment('consul.bytes', 10)
+        self.stats.conversion_failed('my_int')
+
+        report = self.stats.as_dict()
+
+        assert report['timings']['source.env']['count'] == 1
+        assert report['counters'] == {'consul.requests': 1, 'consul.bytes': 10}
+        assert report['conversion_failures'] == {'my_int': 1}
+        assert report['cache_hit_ratio'] is None
+
+    def test_time(self):
+        with self.assertRaises(ValueError):
+            with self.stats.time('validation'):
+                raise ValueError
+
+        assert self.stats.timings['validation'].count == 1
+
+    def test_hooks(self):
+        hook = mock.Mock()
+        failing_hook = mock.Mock(side_effect=Exception)
+        self.stats.add_hook(failing_hook)
+        self.stats.add_hook(hook)
+
+        with self.assertLogs('confgetti.stats', 'ERROR'):
+            self.stats.timing('source.env', 0.5)
+
+        self.stats.increment('consul.requests')
+        self.stats.conversion_failed('my_int')
+
+        assert hook.call_args_list == [
+            mock.call('timing', 'source.env', 0.5),
+            mock.call('counter', 'consul.requests', 1),
+            mock.call('conversion_failure', 'my_int', 1),
+        ]
+
+    def test_reset(self):
+        hook = mock.Mock()
+        self.stats.add_hook(hook)
+        self.stats.increment('consul.requests')
+        self.stats.reset()
+
+        assert self.stats.counters == {}
+        assert self.stats.hooks == [hook]
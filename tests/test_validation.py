@@ -0,0 +1,98 @@
+import pytest
+
+from unittest import mock
+from voluptuous import (
+    All, Coerce, Exclusive, MultipleInvalid, Optional, Required, Schema)
+
+from confgetti.validation import CachedSchema, is_same_value
+
+
+def test_is_same_value():
+    assert is_same_value({'a': [1, 'b']}, {'a': [1, 'b']}) is True
+    assert is_same_value({'a': [1]}, {'a': [True]}) is False
+    assert is_same_value({'a': 1}, {'b': 1}) is False
+    assert is_same_value([1], [1, 2]) is False
+    assert is_same_value(1, 1.0) is False
+
+
+def test_from_schema():
+    schema = CachedSchema.from_schema(
+        Schema({'a': int}, required=True, extra=1))
+
+    assert schema.schema == {'a': int}
+    assert schema.required is True
+    assert schema.extra == 1
+
+
+def test_validates_only_changed_keys():
+    a_validator = mock.Mock(side_effect=lambda value: value.upper())
+    b_validator = mock.Mock(side_effect=int)
+    schema = CachedSchema({
+        Required('a'): a_validator,
+        Optional('b'): b_validator,
+        Optional('c', default=3): int
+    })
+
+    assert schema({'a': 'x', 'b': '1'}) == {'a': 'X', 'b': 1, 'c': 3}
+    assert schema({'a': 'x', 'b': '2'}) == {'a': 'X', 'b': 2, 'c': 3}
+    assert schema({'a': 'x', 'b': '2'}) == {'a': 'X', 'b': 2, 'c': 3}
+
+    assert a_validator.call_count == 1
+    assert b_validator.call_count == 2
+
+
+def test_changed_keys_validate_whole_config():
+    validator = mock.Mock(side_effect=lambda value: value)
+    schema = CachedSchema({'a': validator, Optional('b'): validator})
+
+    schema({'a': 'x'})
+    schema({'a': 'x', 'b': 'y'})
+
+    assert validator.call_count == 3
+
+
+def test_invalid_value_keeps_previous_values():
+    schema = CachedSchema({'a': Coerce(int), 'b': Coerce(int)})
+    schema({'a': '1', 'b': '2'})
+
+    with pytest.raises(MultipleInvalid):
+        schema({'a': '1', 'b': 'x'})
+
+    assert schema({'a': '1', 'b': '2'}) == {'a': 1, 'b': 2}
+
+
+def test_result_is_copy():
+    schema = CachedSchema({'a': int})
+    schema({'a': 1})['a'] = 2
+
+    assert schema({'a': 1}) == {'a': 1}
+
+
+def test_clear():
+    validator = mock.Mock(side_effect=lambda value: value)
+    schema = CachedSchema({'a': validator})
+
+    schema({'a': 'x'})
+    schema.clear()
+    schema({'a': 'x'})
+
+    assert validator.call_count == 2
+
+
+@pytest.mark.parametrize('schema', [
+    CachedSchema(All({'a': int, 'b': int}, lambda config: config)),
+    CachedSchema({Exclusive('a', 'group'): int, Exclusive('b', 'group'): int}),
+    CachedSchema({str: int}),
+])
+def test_cross_key_schema_is_not_incremental(schema):
+    assert schema.is_incremental is False
+
+
+def test_cross_key_schema_validates_whole_config():
+    check = mock.Mock(side_effect=lambda config: config)
+    schema = CachedSchema(All({'a': int, 'b': int}, check))
+
+    schema({'a': 1, 'b': 2})
+    schema({'a': 1, 'b': 2})
+
+    assert check.call_count == 2
@@ -0,0 +1,183 @@
+import re
+import sys
+import time
+import types
+import unittest
+import responses
+
+from unittest.mock import Mock, patch
+from consul import ConsulException
+from requests.exceptions import ConnectionError
+from voluptuous import Schema, Coerce
+
+from confgetti.validation import CachedSchema
+from confgetti.watch import ConfigWatcher, watch_config
+
+
+class ConfigWatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.module = types.ModuleType('watched_config')
+        self.module.a = 'abc'
+        self.module.b = 1
+        sys.modules['watched_config'] = self.module
+
+        self.load_from_file_patcher = patch(
+            'confgetti.load.load_from_file', return_value={})
+        self.load_from_file_patcher.start()
+        self.load_from_env_patcher = patch(
+            'confgetti.load.load_from_env', return_value={})
+        self.load_from_env_patcher.start()
+
+        self.watcher = ConfigWatcher(
+            'watched_config',
+            'MYAPP',
+            schema=Schema({'a': str, 'b': Coerce(int)}),
+            consul_config={'host': 'foobar'})
+        self.watcher.confgetti.consul = Mock()
+
+    def tearDown(self):
+        self.load_from_file_patcher.stop()
+        self.load_from_env_patcher.stop()
+        del sys.modules['watched_config']
+
+    def set_consul_response(self, index, values):
+        get_values = self.watcher.confgetti.consul.get_indexed_raw_values
+        get_values.return_value = (index, values)
+
+    def test_keys_from_schema(self):
+        assert self.watcher.keys == ['a', 'b']
+
+    def test_schema_is_cached(self):
+        assert isinstance(self.watcher.schema, CachedSchema)
+        assert self.watcher.schema.is_incremental is True
+
+    def test_poll_applies_only_changed_keys(self):
+        callback = Mock()
+        self.watcher.add_callback(callback)
+        self.set_consul_response('10', {'a': b'abc', 'b': b'2'})
+
+        changed = self.watcher.poll()
+
+        assert changed == {'b': 2}
+        assert self.module.a == 'abc'
+        assert self.module.b == 2
+        assert self.watcher.index == '10'
+        callback.assert_called_once_with({'b': 2})
+        self.watcher.confgetti.consul.get_indexed_raw_values \
+            .assert_called_once_with('MYAPP', index=None, wait='30s')
+
+    def test_poll_same_index(self):
+        self.watcher.index = '10'
+        self.set_consul_response('10', {'a': b'abc', 'b': b'2'})
+
+        assert self.watcher.poll() == {}
+        assert self.module.b == 1
+
+    def test_poll_index_reset(self):
+        self.watcher.index = '10'
+        self.set_consul_response('3', {'a': b'abc', 'b': b'2'})
+
+        assert self.watcher.poll() == {}
+        assert self.watcher.index is None
+
+    def test_poll_permission_denied(self):
+        self.watcher.retry_interval = 0
+        self.set_consul_response('10', None)
+
+        with self.assertLogs('confgetti.watch', 'WARNING'):
+            assert self.watcher.poll() == {}
+
+        assert self.watcher.index == '10'
+
+    def test_poll_permission_denied_on_first_poll_waits(self):
+        self.set_consul_response(None, None)
+        self.watcher._stop_event = Mock()
+
+        with self.assertLogs('confgetti.watch', 'WARNING'):
+            assert self.watcher.poll() == {}
+
+        self.watcher._stop_event.wait.assert_called_once_with(5)
+
+    def test_poll_keeps_previous_config_on_invalid(self):
+        self.set_consul_response('10', {'a': b'def', 'b': b'not int'})
+
+        assert self.watcher.poll() == {}
+        assert self.module.a == 'abc'
+        assert self.module.b == 1
+        assert self.watcher.index == '10'
+
+    def test_failing_callback_does_not_stop_others(self):
+        callback = Mock()
+        self.watcher.add_callback(Mock(side_effect=Exception))
+        self.watcher.add_callback(callback)
+        self.set_consul_response('10', {'a': b'def', 'b': b'1'})
+
+        self.watcher.poll()
+
+        callback.assert_called_once_with({'a': 'def'})
+
+    def test_run_retries_on_connection_error(self):
+        self.watcher.retry_interval = 0
+
+        def poll():
+            if self.watcher.poll.call_count == 1:
+                raise ConnectionError
+
+            self.watcher._stop_event.set()
+
+        self.watcher.poll = Mock(side_effect=poll)
+
+        self.watcher.run()
+
+        assert self.watcher.poll.call_count == 2
+
+    def test_run_retries_on_other_error(self):
+        self.watcher.retry_interval = 0
+
+        def poll():
+            if self.watcher.poll.call_count == 1:
+                raise ConsulException('500 No cluster leader')
+
+            self.watcher._stop_event.set()
+
+        self.watcher.poll = Mock(side_effect=poll)
+
+        with self.assertLogs('confgetti.watch', 'ERROR'):
+            self.watcher.run()
+
+        assert self.watcher.poll.call_count == 2
+
+    def test_start_and_stop(self):
+        self.set_consul_response('10', {'a': b'abc', 'b': b'1'})
+
+        self.watcher.start()
+        self.watcher.stop(timeout=1)
+
+        assert self.watcher._thread is None
+        assert self.watcher._stop_event.is_set()
+
+
+@responses.activate
+def test_watch_denied_prefix_does_not_flood_consul():
+    responses.add(
+        responses.GET,
+        re.compile(r'http://denied-watch:8500/v1/kv/MYAPP/.*'),
+        body='Permission denied',
+        status=403)
+    watcher = ConfigWatcher(
+        'watched_config', 'MYAPP', keys=['a'], retry_interval=0.2,
+        consul_config={'host': 'denied-watch'})
+
+    watcher.start()
+    time.sleep(0.5)
+    watcher.stop(timeout=1)
+
+    assert 1 <= len(responses.calls) <= 3
+
+
+@patch('confgetti.watch.ConfigWatcher.start')
+def test_watch_config(start_mock):
+    watcher = watch_config('watched_config', 'MYAPP', keys=['a'], wait='1s')
+
+    assert watcher is start_mock.return_value
+    start_mock.assert_called_once_with()